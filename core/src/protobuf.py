@@ -5,6 +5,8 @@ bytes, string, embedded message and repeated fields.
 
 from micropython import const
 
+from trezor.utils import obj_eq, obj_repr
+
 if False:
     from typing import Any, Dict, List, Type, TypeVar
     from typing_extensions import Protocol
@@ -144,11 +146,10 @@ class MessageType:
         for kw in kwargs:
             setattr(self, kw, kwargs[kw])
 
-    def __eq__(self, rhs: Any) -> bool:
-        return self.__class__ is rhs.__class__ and self.__dict__ == rhs.__dict__
-
-    def __repr__(self) -> str:
-        return "<%s>" % self.__class__.__name__
+    # the generated subclasses declare __slots__, so the comparison and repr
+    # have to go through the slots-aware helpers instead of __dict__
+    __eq__ = obj_eq
+    __repr__ = obj_repr
 
 
 class LimitedReader:
@@ -24,6 +24,7 @@ if False:
         List,
         Optional,
         Set,
+        Union,
     )
 
     Task = Coroutine
@@ -35,18 +36,34 @@ after_step_hook = None  # type: Optional[Callable[[], None]]
 # tasks scheduled for execution in the future
 _queue = utimeq.utimeq(64)
 
-# tasks paused on I/O
-_paused = {}  # type: Dict[int, Set[Task]]
+# tasks paused on I/O.  an interface rarely has more than one waiting task,
+# so the common case stores the task directly and only promotes the value to
+# a set when a second waiter appears, saving a set allocation per wait.
+# this dict is never scanned when cancelling a task: close() finds the iface
+# through _task_state and touches exactly one entry.
+_paused = {}  # type: Dict[int, Union[Task, Set[Task]]]
 
-# functions to execute after a task is finished
-_finalizers = {}  # type: Dict[int, Finalizer]
+# per-task bookkeeping, as id(task) => [iface the task is paused on or None,
+# finalizer to run when the task ends or None].  one shared table means one
+# dict probe on the schedule/pause/close paths instead of two.
+_task_state = {}  # type: Dict[int, List]
+
+# lower bound on the io.poll timeout.  `sleep` does not guarantee
+# sub-millisecond precision anyway, and a poll round is too expensive to
+# repeat every few dozen microseconds.
+_MIN_POLL_DELAY_US = const(500)
+
+# preallocated entry buffers for the `utimeq` and `io.poll` C APIs, private
+# to the event loop (`run` and `clear`)
+_task_entry = [0, 0, 0]  # deadline, task, value
+_msg_entry = [0, 0]  # iface | flags, value
 
 if __debug__:
     # for performance stats
     import array
 
     log_delay_pos = 0
-    log_delay_rb_len = const(10)
+    log_delay_rb_len = const(16)  # power of two, the index wraps with a mask
     log_delay_rb = array.array("i", [0] * log_delay_rb_len)
 
 
@@ -60,28 +77,52 @@ def schedule(
     if deadline is None:
         deadline = utime.ticks_us()
     if finalizer is not None:
-        _finalizers[id(task)] = finalizer
+        state = _task_state.get(id(task), None)
+        if state is None:
+            _task_state[id(task)] = [None, finalizer]
+        else:
+            state[1] = finalizer
     _queue.push(deadline, task, value)
 
 
 def pause(task: Task, iface: int) -> None:
+    state = _task_state.get(id(task), None)
+    if state is None:
+        _task_state[id(task)] = [iface, None]
+    else:
+        state[0] = iface
     tasks = _paused.get(iface, None)
     if tasks is None:
-        tasks = _paused[iface] = set()
-    tasks.add(task)
+        _paused[iface] = task
+    elif isinstance(tasks, set):
+        tasks.add(task)
+    else:
+        _paused[iface] = {tasks, task}
 
 
 def finalize(task: Task, value: Any) -> None:
-    fn = _finalizers.pop(id(task), None)
-    if fn is not None:
-        fn(task, value)
+    state = _task_state.pop(id(task), None)
+    if state is not None and state[1] is not None:
+        state[1](task, value)
 
 
 def close(task: Task) -> None:
-    for iface in _paused:
-        _paused[iface].discard(task)
-    _queue.discard(task)
+    state = _task_state.get(id(task), None)
+    iface = state[0] if state is not None else None
+    if iface is not None:
+        # a task paused on I/O is never in the time queue, so the O(n)
+        # scan of `_queue.discard` can be skipped altogether
+        tasks = _paused.get(iface, None)
+        if tasks is task:
+            del _paused[iface]
+        elif isinstance(tasks, set):
+            tasks.discard(task)
+            if not tasks:
+                del _paused[iface]
+    else:
+        _queue.discard(task)
     task.close()
+    # finalize pops the whole state entry and runs the finalizer, if any
     finalize(task, GeneratorExit())
 
 
@@ -98,44 +139,136 @@ def run() -> None:
 
     max_delay = const(1000000)  # usec delay if queue is empty
 
-    task_entry = [0, 0, 0]  # deadline, task, value
-    msg_entry = [0, 0]  # iface | flags, value
-    while _queue or _paused:
+    # cache frequently used names as locals, a global or attribute lookup
+    # costs two dict probes on every iteration of the hot loop
+    ticks_us = utime.ticks_us
+    ticks_diff = utime.ticks_diff
+    ticks_add = utime.ticks_add
+    poll = io.poll
+    sleep_cls = sleep
+    wait_cls = wait
+    queue = _queue
+    paused = _paused
+    task_state = _task_state
+    queue_peektime = queue.peektime
+    queue_pop = queue.pop
+    step = _step
+
+    task_entry = _task_entry
+    msg_entry = _msg_entry
+    while queue or paused:
         # compute the maximum amount of time we can wait for a message
-        if _queue:
-            delay = utime.ticks_diff(_queue.peektime(), utime.ticks_us())
+        if queue:
+            delay = ticks_diff(queue_peektime(), ticks_us())
         else:
             delay = max_delay
 
         if __debug__:
             # add current delay to ring buffer for performance stats
             log_delay_rb[log_delay_pos] = delay
-            log_delay_pos = (log_delay_pos + 1) % log_delay_rb_len
+            log_delay_pos = (log_delay_pos + 1) & (log_delay_rb_len - 1)
+
+        if delay <= 0 and not paused:
+            # the first scheduled task is already due and no task is paused
+            # on I/O, run it directly instead of going through a poll timeout.
+            # when tasks _are_ paused, we fall through to io.poll with the
+            # non-positive delay, which polls the interfaces once without
+            # blocking, so I/O is not starved by a busy queue
+            queue_pop(task_entry)
+            task = task_entry[1]
+            value = task_entry[2]
+        else:
+            if 0 < delay < _MIN_POLL_DELAY_US:
+                # clamp very short waits up to the floor to amortize the cost
+                # of the poll call, sub-ms deadlines are not honored exactly
+                # anyway.  non-positive delays poll without blocking.
+                delay = _MIN_POLL_DELAY_US
+
+            if poll(paused, msg_entry, delay):
+                # message received, run tasks paused on the interface
+                msg_tasks = paused.pop(msg_entry[0], None)
+                if msg_tasks is None:
+                    continue
+                if isinstance(msg_tasks, set):
+                    # rare multi-waiter case, take the out-of-line step
+                    for task in msg_tasks:
+                        state = task_state.get(id(task), None)
+                        if state is not None:
+                            state[0] = None
+                        step(task, msg_entry[1])
+                    continue
+                task = msg_tasks
+                state = task_state.get(id(task), None)
+                if state is not None:
+                    state[0] = None
+                value = msg_entry[1]
+            elif queue:
+                # timeout occurred, drain every task that is already due
+                # before polling again, so a burst of timers does not pay
+                # one poll round per task.  the deadlines are compared to a
+                # snapshot of the clock, tasks scheduled while draining wait
+                # for the next iteration.  the guard is re-evaluated before
+                # every pop, because a stepped task can close a scheduled
+                # sibling and mutate the queue under us.
+                now = ticks_us()
+                while queue and ticks_diff(queue_peektime(), now) <= 0:
+                    queue_pop(task_entry)
+                    step(task_entry[1], task_entry[2])  # type: ignore
+                continue
+            else:
+                continue
 
-        if io.poll(_paused, msg_entry, delay):
-            # message received, run tasks paused on the interface
-            msg_tasks = _paused.pop(msg_entry[0], ())
-            for task in msg_tasks:
-                _step(task, msg_entry[1])
+        # `_step` inlined: stepping a task is the most frequent operation in
+        # the system and a function call here costs a frame allocation.  keep
+        # this block in sync with `_step` below.
+        # (task/value come from untyped lists, because that is what the C API
+        # supports, hence the type: ignore)
+        try:
+            if isinstance(value, BaseException):
+                result = task.throw(value)  # type: ignore
+            else:
+                result = task.send(value)  # type: ignore
+        except StopIteration as e:
+            if __debug__:
+                log.debug(__name__, "finish: %s", task)
+            finalize(task, e.value)  # type: ignore
+        except Exception as e:
+            if __debug__:
+                log.exception(__name__, e)
+            finalize(task, e)  # type: ignore
         else:
-            # timeout occurred, run the first scheduled task
-            if _queue:
-                _queue.pop(task_entry)
-                _step(task_entry[1], task_entry[2])  # type: ignore
-                # error: Argument 1 to "_step" has incompatible type "int"; expected "Coroutine[Any, Any, Any]"
-                # rationale: We use untyped lists here, because that is what the C API supports.
+            if result is None:
+                schedule(task)  # type: ignore
+            elif result.__class__ is sleep_cls:
+                # sleep and wait are by far the most frequent syscalls, so
+                # their handle() bodies are dispatched on the exact type and
+                # inlined here, skipping the bound-method allocation and the
+                # virtual call.  subclasses take the generic path below.
+                deadline = ticks_add(ticks_us(), result.delay_us)
+                schedule(task, deadline, deadline)  # type: ignore
+            elif result.__class__ is wait_cls:
+                pause(task, result.msg_iface)  # type: ignore
+            else:
+                handle = getattr(result, "handle", None)
+                if handle is not None:
+                    handle(task)
+                elif __debug__:
+                    log.error(__name__, "unknown syscall: %s", result)
+            if after_step_hook:
+                after_step_hook()
 
 
 def clear() -> None:
     """Clear all queue state.  Any scheduled or paused tasks will be forgotten."""
-    _ = [0, 0, 0]
     while _queue:
-        _queue.pop(_)
+        _queue.pop(_task_entry)
     _paused.clear()
-    _finalizers.clear()
+    _task_state.clear()
 
 
 def _step(task: Task, value: Any) -> None:
+    # out-of-line twin of the step block inlined in `run`, used on the less
+    # frequent paths.  keep the two in sync.
     try:
         if isinstance(value, BaseException):
             result = task.throw(value)  # type: ignore
@@ -152,17 +285,62 @@ def _step(task: Task, value: Any) -> None:
             log.exception(__name__, e)
         finalize(task, e)
     else:
-        if isinstance(result, Syscall):
-            result.handle(task)
-        elif result is None:
+        if result is None:
             schedule(task)
+        elif result.__class__ is sleep:
+            deadline = utime.ticks_add(utime.ticks_us(), result.delay_us)
+            schedule(task, deadline, deadline)
+        elif result.__class__ is wait:
+            pause(task, result.msg_iface)
         else:
-            if __debug__:
+            handle = getattr(result, "handle", None)
+            if handle is not None:
+                handle(task)
+            elif __debug__:
                 log.error(__name__, "unknown syscall: %s", result)
         if after_step_hook:
             after_step_hook()
 
 
+class _SyscallAwaiter:
+    """
+    Lightweight iterator yielded into the scheduler when a syscall is awaited.
+    It yields the syscall once and then returns the value sent back by the
+    scheduler, like the generator previously created by `Syscall.__iter__`,
+    but without allocating a generator frame per await.
+    """
+
+    def __init__(self, syscall: "Syscall") -> None:
+        self.syscall = syscall
+        self.done = False
+
+    def __iter__(self) -> "_SyscallAwaiter":
+        return self
+
+    def __next__(self) -> "Syscall":
+        if self.done:
+            raise StopIteration
+        self.done = True
+        return self.syscall
+
+    def send(self, value: Any) -> "Syscall":
+        if self.done:
+            raise StopIteration(value)
+        self.done = True
+        return self.syscall
+
+    # awaiters can also be scheduled as tasks in their own right (e.g. when a
+    # bare syscall is passed to `spawn`), so the generator-like `throw` and
+    # `close` need to be provided as well
+
+    def throw(self, value: BaseException) -> None:
+        self.done = True
+        raise value
+
+    def close(self) -> None:
+        self.done = True
+
+
 class Syscall:
     """
     When tasks want to perform any I/O, or do any sort of communication with the
@@ -171,7 +349,7 @@ class Syscall:
 
     def __iter__(self) -> Task:  # type: ignore
         # support `yield from` or `await` on syscalls
-        return (yield self)
+        return _SyscallAwaiter(self)  # type: ignore
 
     def __await__(self) -> Generator:
         return self.__iter__()  # type: ignore
@@ -254,10 +432,17 @@ class signal(Syscall):
         self._deliver()
 
     def _deliver(self) -> None:
-        if self.task is not None and self.value is not _NO_VALUE:
-            schedule(self.task, self.value)
-            self.task = None
-            self.value = _NO_VALUE
+        # load each attribute once and exit early, _deliver runs on both the
+        # handle() and send() paths and usually one half is still missing
+        value = self.value
+        if value is _NO_VALUE:
+            return
+        task = self.task
+        if task is None:
+            return
+        schedule(task, value)
+        self.task = None
+        self.value = _NO_VALUE
 
     def __iter__(self) -> Task:  # type: ignore
         try:
@@ -300,23 +485,29 @@ class spawn(Syscall):
         self.exit_others = exit_others
         self.finished = []  # type: List[Awaitable]  # children that finished
         self.scheduled = []  # type: List[Task]  # scheduled wrapper tasks
+        # scheduled wrapper tasks back to their children, as id(task) => child
+        self._task_to_child = {}  # type: Dict[int, Awaitable]
 
     def handle(self, task: Task) -> None:
         finalizer = self._finish
-        scheduled = self.scheduled
-        finished = self.finished
+        children = self.children
 
         self.callback = task
-        scheduled.clear()
-        finished.clear()
-
-        for child in self.children:
+        # spawns have a small fixed arity, preallocate the list of wrapper
+        # tasks at the exact size instead of growing it append by append
+        scheduled = self.scheduled = [None] * len(children)  # type: ignore
+        self.finished.clear()
+        task_to_child = self._task_to_child
+        task_to_child.clear()
+
+        for index, child in enumerate(children):
             if isinstance(child, _type_gen):
                 child_task = child
             else:
                 child_task = iter(child)  # type: ignore
             schedule(child_task, None, None, finalizer)  # type: ignore
-            scheduled.append(child_task)  # type: ignore
+            scheduled[index] = child_task  # type: ignore
+            task_to_child[id(child_task)] = child
             # TODO: document the types here
 
     def exit(self, except_for: Task = None) -> None:
@@ -326,10 +517,9 @@ class spawn(Syscall):
 
     def _finish(self, task: Task, result: Any) -> None:
         if not self.finished:
-            for index, child_task in enumerate(self.scheduled):
-                if child_task is task:
-                    child = self.children[index]
-                    break
+            child = self._task_to_child.pop(id(task), None)
+            if child is None:
+                return
             self.finished.append(child)
             if self.exit_others:
                 self.exit(task)
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class ApplyFlags(p.MessageType):
-    MESSAGE_WIRE_TYPE = 28
+    MESSAGE_WIRE_TYPE = const(28)
+    __slots__ = ('flags',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class ApplyFlags(p.MessageType):
     ) -> None:
         self.flags = flags
 
+    _FIELDS = {
+        1: ('flags', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('flags', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class ApplySettings(p.MessageType):
-    MESSAGE_WIRE_TYPE = 25
+    MESSAGE_WIRE_TYPE = const(25)
+    __slots__ = ('language', 'label', 'use_passphrase', 'homescreen', 'passphrase_source', 'auto_lock_delay_ms', 'display_rotation',)
 
     def __init__(
         self,
@@ -30,14 +30,16 @@ class ApplySettings(p.MessageType):
         self.auto_lock_delay_ms = auto_lock_delay_ms
         self.display_rotation = display_rotation
 
+    _FIELDS = {
+        1: ('language', p.UnicodeType, 0),
+        2: ('label', p.UnicodeType, 0),
+        3: ('use_passphrase', p.BoolType, 0),
+        4: ('homescreen', p.BytesType, 0),
+        5: ('passphrase_source', p.UVarintType, 0),
+        6: ('auto_lock_delay_ms', p.UVarintType, 0),
+        7: ('display_rotation', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('language', p.UnicodeType, 0),
-            2: ('label', p.UnicodeType, 0),
-            3: ('use_passphrase', p.BoolType, 0),
-            4: ('homescreen', p.BytesType, 0),
-            5: ('passphrase_source', p.UVarintType, 0),
-            6: ('auto_lock_delay_ms', p.UVarintType, 0),
-            7: ('display_rotation', p.UVarintType, 0),
-        }
+        return cls._FIELDS
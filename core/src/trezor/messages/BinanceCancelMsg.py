@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class BinanceCancelMsg(p.MessageType):
-    MESSAGE_WIRE_TYPE = 708
+    MESSAGE_WIRE_TYPE = const(708)
+    __slots__ = ('refid', 'sender', 'symbol',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class BinanceCancelMsg(p.MessageType):
         self.sender = sender
         self.symbol = symbol
 
+    _FIELDS = {
+        1: ('refid', p.UnicodeType, 0),
+        2: ('sender', p.UnicodeType, 0),
+        3: ('symbol', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('refid', p.UnicodeType, 0),
-            2: ('sender', p.UnicodeType, 0),
-            3: ('symbol', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
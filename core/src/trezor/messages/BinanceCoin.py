@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class BinanceCoin(p.MessageType):
+    __slots__ = ('amount', 'denom',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class BinanceCoin(p.MessageType):
         self.amount = amount
         self.denom = denom
 
+    _FIELDS = {
+        1: ('amount', p.SVarintType, 0),
+        2: ('denom', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.SVarintType, 0),
-            2: ('denom', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class BinanceGetPublicKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 702
+    MESSAGE_WIRE_TYPE = const(702)
+    __slots__ = ('address_n', 'show_display',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class BinanceGetPublicKey(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.show_display = show_display
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('show_display', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('show_display', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -4,14 +4,12 @@ import protobuf as p
 
 from .BinanceCoin import BinanceCoin
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class BinanceInputOutput(p.MessageType):
+    __slots__ = ('address', 'coins',)
 
     def __init__(
         self,
@@ -21,9 +19,11 @@ class BinanceInputOutput(p.MessageType):
         self.address = address
         self.coins = coins if coins is not None else []
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('coins', BinanceCoin, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('coins', BinanceCoin, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
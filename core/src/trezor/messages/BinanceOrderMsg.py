@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class BinanceOrderMsg(p.MessageType):
-    MESSAGE_WIRE_TYPE = 707
+    MESSAGE_WIRE_TYPE = const(707)
+    __slots__ = ('id', 'ordertype', 'price', 'quantity', 'sender', 'side', 'symbol', 'timeinforce',)
 
     def __init__(
         self,
@@ -32,15 +32,17 @@ class BinanceOrderMsg(p.MessageType):
         self.symbol = symbol
         self.timeinforce = timeinforce
 
+    _FIELDS = {
+        1: ('id', p.UnicodeType, 0),
+        2: ('ordertype', p.UVarintType, 0),
+        3: ('price', p.SVarintType, 0),
+        4: ('quantity', p.SVarintType, 0),
+        5: ('sender', p.UnicodeType, 0),
+        6: ('side', p.UVarintType, 0),
+        7: ('symbol', p.UnicodeType, 0),
+        8: ('timeinforce', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('id', p.UnicodeType, 0),
-            2: ('ordertype', p.UVarintType, 0),
-            3: ('price', p.SVarintType, 0),
-            4: ('quantity', p.SVarintType, 0),
-            5: ('sender', p.UnicodeType, 0),
-            6: ('side', p.UVarintType, 0),
-            7: ('symbol', p.UnicodeType, 0),
-            8: ('timeinforce', p.UVarintType, 0),
-        }
+        return cls._FIELDS
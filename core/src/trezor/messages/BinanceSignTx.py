@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class BinanceSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 704
+    MESSAGE_WIRE_TYPE = const(704)
+    __slots__ = ('address_n', 'msg_count', 'account_number', 'chain_id', 'memo', 'sequence', 'source',)
 
     def __init__(
         self,
@@ -30,14 +30,16 @@ class BinanceSignTx(p.MessageType):
         self.sequence = sequence
         self.source = source
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('msg_count', p.UVarintType, 0),
+        3: ('account_number', p.SVarintType, 0),
+        4: ('chain_id', p.UnicodeType, 0),
+        5: ('memo', p.UnicodeType, 0),
+        6: ('sequence', p.SVarintType, 0),
+        7: ('source', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('msg_count', p.UVarintType, 0),
-            3: ('account_number', p.SVarintType, 0),
-            4: ('chain_id', p.UnicodeType, 0),
-            5: ('memo', p.UnicodeType, 0),
-            6: ('sequence', p.SVarintType, 0),
-            7: ('source', p.SVarintType, 0),
-        }
+        return cls._FIELDS
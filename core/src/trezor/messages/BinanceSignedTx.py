@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class BinanceSignedTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 709
+    MESSAGE_WIRE_TYPE = const(709)
+    __slots__ = ('signature', 'public_key',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class BinanceSignedTx(p.MessageType):
         self.signature = signature
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('signature', p.BytesType, 0),
+        2: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .BinanceInputOutput import BinanceInputOutput
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class BinanceTransferMsg(p.MessageType):
-    MESSAGE_WIRE_TYPE = 706
+    MESSAGE_WIRE_TYPE = const(706)
+    __slots__ = ('inputs', 'outputs',)
 
     def __init__(
         self,
@@ -22,9 +22,11 @@ class BinanceTransferMsg(p.MessageType):
         self.inputs = inputs if inputs is not None else []
         self.outputs = outputs if outputs is not None else []
 
+    _FIELDS = {
+        1: ('inputs', BinanceInputOutput, p.FLAG_REPEATED),
+        2: ('outputs', BinanceInputOutput, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('inputs', BinanceInputOutput, p.FLAG_REPEATED),
-            2: ('outputs', BinanceInputOutput, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .HDNodeType import HDNodeType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class CardanoPublicKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 306
+    MESSAGE_WIRE_TYPE = const(306)
+    __slots__ = ('xpub', 'node',)
 
     def __init__(
         self,
@@ -22,9 +22,11 @@ class CardanoPublicKey(p.MessageType):
         self.xpub = xpub
         self.node = node
 
+    _FIELDS = {
+        1: ('xpub', p.UnicodeType, 0),
+        2: ('node', HDNodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('xpub', p.UnicodeType, 0),
-            2: ('node', HDNodeType, 0),
-        }
+        return cls._FIELDS
@@ -1,19 +1,19 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .CardanoTxInputType import CardanoTxInputType
 from .CardanoTxOutputType import CardanoTxOutputType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class CardanoSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 303
+    MESSAGE_WIRE_TYPE = const(303)
+    __slots__ = ('inputs', 'outputs', 'transactions_count', 'protocol_magic',)
 
     def __init__(
         self,
@@ -27,11 +27,13 @@ class CardanoSignTx(p.MessageType):
         self.transactions_count = transactions_count
         self.protocol_magic = protocol_magic
 
+    _FIELDS = {
+        1: ('inputs', CardanoTxInputType, p.FLAG_REPEATED),
+        2: ('outputs', CardanoTxOutputType, p.FLAG_REPEATED),
+        3: ('transactions_count', p.UVarintType, 0),
+        5: ('protocol_magic', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('inputs', CardanoTxInputType, p.FLAG_REPEATED),
-            2: ('outputs', CardanoTxOutputType, p.FLAG_REPEATED),
-            3: ('transactions_count', p.UVarintType, 0),
-            5: ('protocol_magic', p.UVarintType, 0),
-        }
+        return cls._FIELDS
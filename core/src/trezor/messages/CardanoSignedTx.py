@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class CardanoSignedTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 310
+    MESSAGE_WIRE_TYPE = const(310)
+    __slots__ = ('tx_hash', 'tx_body',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class CardanoSignedTx(p.MessageType):
         self.tx_hash = tx_hash
         self.tx_body = tx_body
 
+    _FIELDS = {
+        1: ('tx_hash', p.BytesType, 0),
+        2: ('tx_body', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tx_hash', p.BytesType, 0),
-            2: ('tx_body', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class CardanoTxAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 309
+    MESSAGE_WIRE_TYPE = const(309)
+    __slots__ = ('transaction',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class CardanoTxAck(p.MessageType):
     ) -> None:
         self.transaction = transaction
 
+    _FIELDS = {
+        1: ('transaction', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('transaction', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class CardanoTxInputType(p.MessageType):
+    __slots__ = ('address_n', 'prev_hash', 'prev_index', 'type',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class CardanoTxInputType(p.MessageType):
         self.prev_index = prev_index
         self.type = type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('prev_hash', p.BytesType, 0),
+        3: ('prev_index', p.UVarintType, 0),
+        4: ('type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('prev_hash', p.BytesType, 0),
-            3: ('prev_index', p.UVarintType, 0),
-            4: ('type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
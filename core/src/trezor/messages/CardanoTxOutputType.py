@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class CardanoTxOutputType(p.MessageType):
+    __slots__ = ('address', 'address_n', 'amount',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class CardanoTxOutputType(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.amount = amount
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        3: ('amount', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('amount', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class CardanoTxRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 304
+    MESSAGE_WIRE_TYPE = const(304)
+    __slots__ = ('tx_index', 'tx_hash', 'tx_body',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class CardanoTxRequest(p.MessageType):
         self.tx_hash = tx_hash
         self.tx_body = tx_body
 
+    _FIELDS = {
+        1: ('tx_index', p.UVarintType, 0),
+        2: ('tx_hash', p.BytesType, 0),
+        3: ('tx_body', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tx_index', p.UVarintType, 0),
-            2: ('tx_hash', p.BytesType, 0),
-            3: ('tx_body', p.BytesType, 0),
-        }
+        return cls._FIELDS
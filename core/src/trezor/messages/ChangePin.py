@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class ChangePin(p.MessageType):
-    MESSAGE_WIRE_TYPE = 4
+    MESSAGE_WIRE_TYPE = const(4)
+    __slots__ = ('remove',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class ChangePin(p.MessageType):
     ) -> None:
         self.remove = remove
 
+    _FIELDS = {
+        1: ('remove', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('remove', p.BoolType, 0),
-        }
+        return cls._FIELDS
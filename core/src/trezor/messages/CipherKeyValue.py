@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class CipherKeyValue(p.MessageType):
-    MESSAGE_WIRE_TYPE = 23
+    MESSAGE_WIRE_TYPE = const(23)
+    __slots__ = ('address_n', 'key', 'value', 'encrypt', 'ask_on_encrypt', 'ask_on_decrypt', 'iv',)
 
     def __init__(
         self,
@@ -30,14 +30,16 @@ class CipherKeyValue(p.MessageType):
         self.ask_on_decrypt = ask_on_decrypt
         self.iv = iv
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('key', p.UnicodeType, 0),
+        3: ('value', p.BytesType, 0),
+        4: ('encrypt', p.BoolType, 0),
+        5: ('ask_on_encrypt', p.BoolType, 0),
+        6: ('ask_on_decrypt', p.BoolType, 0),
+        7: ('iv', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('key', p.UnicodeType, 0),
-            3: ('value', p.BytesType, 0),
-            4: ('encrypt', p.BoolType, 0),
-            5: ('ask_on_encrypt', p.BoolType, 0),
-            6: ('ask_on_decrypt', p.BoolType, 0),
-            7: ('iv', p.BytesType, 0),
-        }
+        return cls._FIELDS
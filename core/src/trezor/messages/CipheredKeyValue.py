@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class CipheredKeyValue(p.MessageType):
-    MESSAGE_WIRE_TYPE = 48
+    MESSAGE_WIRE_TYPE = const(48)
+    __slots__ = ('value',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class CipheredKeyValue(p.MessageType):
     ) -> None:
         self.value = value
 
+    _FIELDS = {
+        1: ('value', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('value', p.BytesType, 0),
-        }
+        return cls._FIELDS
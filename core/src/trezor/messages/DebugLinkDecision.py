@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class DebugLinkDecision(p.MessageType):
-    MESSAGE_WIRE_TYPE = 100
+    MESSAGE_WIRE_TYPE = const(100)
+    __slots__ = ('yes_no', 'up_down', 'input',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class DebugLinkDecision(p.MessageType):
         self.up_down = up_down
         self.input = input
 
+    _FIELDS = {
+        1: ('yes_no', p.BoolType, 0),
+        2: ('up_down', p.BoolType, 0),
+        3: ('input', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('yes_no', p.BoolType, 0),
-            2: ('up_down', p.BoolType, 0),
-            3: ('input', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -1,13 +1,9 @@
 # Automatically generated by pb2py
 # fmt: off
-import protobuf as p
+from micropython import const
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+import protobuf as p
 
 
 class DebugLinkGetState(p.MessageType):
-    MESSAGE_WIRE_TYPE = 101
+    MESSAGE_WIRE_TYPE = const(101)
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .HDNodeType import HDNodeType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class DebugLinkState(p.MessageType):
-    MESSAGE_WIRE_TYPE = 102
+    MESSAGE_WIRE_TYPE = const(102)
+    __slots__ = ('layout', 'pin', 'matrix', 'mnemonic_secret', 'node', 'passphrase_protection', 'reset_word', 'reset_entropy', 'recovery_fake_word', 'recovery_word_pos', 'reset_word_pos', 'mnemonic_type',)
 
     def __init__(
         self,
@@ -42,19 +42,21 @@ class DebugLinkState(p.MessageType):
         self.reset_word_pos = reset_word_pos
         self.mnemonic_type = mnemonic_type
 
+    _FIELDS = {
+        1: ('layout', p.BytesType, 0),
+        2: ('pin', p.UnicodeType, 0),
+        3: ('matrix', p.UnicodeType, 0),
+        4: ('mnemonic_secret', p.BytesType, 0),
+        5: ('node', HDNodeType, 0),
+        6: ('passphrase_protection', p.BoolType, 0),
+        7: ('reset_word', p.UnicodeType, 0),
+        8: ('reset_entropy', p.BytesType, 0),
+        9: ('recovery_fake_word', p.UnicodeType, 0),
+        10: ('recovery_word_pos', p.UVarintType, 0),
+        11: ('reset_word_pos', p.UVarintType, 0),
+        12: ('mnemonic_type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('layout', p.BytesType, 0),
-            2: ('pin', p.UnicodeType, 0),
-            3: ('matrix', p.UnicodeType, 0),
-            4: ('mnemonic_secret', p.BytesType, 0),
-            5: ('node', HDNodeType, 0),
-            6: ('passphrase_protection', p.BoolType, 0),
-            7: ('reset_word', p.UnicodeType, 0),
-            8: ('reset_entropy', p.BytesType, 0),
-            9: ('recovery_fake_word', p.UnicodeType, 0),
-            10: ('recovery_word_pos', p.UVarintType, 0),
-            11: ('reset_word_pos', p.UVarintType, 0),
-            12: ('mnemonic_type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
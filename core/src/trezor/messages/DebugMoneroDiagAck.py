@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class DebugMoneroDiagAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 547
+    MESSAGE_WIRE_TYPE = const(547)
+    __slots__ = ('ins', 'p1', 'p2', 'pd', 'data1', 'data2',)
 
     def __init__(
         self,
@@ -28,13 +28,15 @@ class DebugMoneroDiagAck(p.MessageType):
         self.data1 = data1
         self.data2 = data2
 
+    _FIELDS = {
+        1: ('ins', p.UVarintType, 0),
+        2: ('p1', p.UVarintType, 0),
+        3: ('p2', p.UVarintType, 0),
+        4: ('pd', p.UVarintType, p.FLAG_REPEATED),
+        5: ('data1', p.BytesType, 0),
+        6: ('data2', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('ins', p.UVarintType, 0),
-            2: ('p1', p.UVarintType, 0),
-            3: ('p2', p.UVarintType, 0),
-            4: ('pd', p.UVarintType, p.FLAG_REPEATED),
-            5: ('data1', p.BytesType, 0),
-            6: ('data2', p.BytesType, 0),
-        }
+        return cls._FIELDS
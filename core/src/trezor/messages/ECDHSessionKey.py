@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class ECDHSessionKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 62
+    MESSAGE_WIRE_TYPE = const(62)
+    __slots__ = ('session_key',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class ECDHSessionKey(p.MessageType):
     ) -> None:
         self.session_key = session_key
 
+    _FIELDS = {
+        1: ('session_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('session_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
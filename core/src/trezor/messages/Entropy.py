@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class Entropy(p.MessageType):
-    MESSAGE_WIRE_TYPE = 10
+    MESSAGE_WIRE_TYPE = const(10)
+    __slots__ = ('entropy',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class Entropy(p.MessageType):
     ) -> None:
         self.entropy = entropy
 
+    _FIELDS = {
+        1: ('entropy', p.BytesType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('entropy', p.BytesType, 0),  # required
-        }
+        return cls._FIELDS
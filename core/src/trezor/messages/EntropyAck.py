@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EntropyAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 36
+    MESSAGE_WIRE_TYPE = const(36)
+    __slots__ = ('entropy',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class EntropyAck(p.MessageType):
     ) -> None:
         self.entropy = entropy
 
+    _FIELDS = {
+        1: ('entropy', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('entropy', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosAsset import EosAsset
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionBuyRam(p.MessageType):
+    __slots__ = ('payer', 'receiver', 'quantity',)
 
     def __init__(
         self,
@@ -23,10 +21,12 @@ class EosActionBuyRam(p.MessageType):
         self.receiver = receiver
         self.quantity = quantity
 
+    _FIELDS = {
+        1: ('payer', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('quantity', EosAsset, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('payer', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('quantity', EosAsset, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionBuyRamBytes(p.MessageType):
+    __slots__ = ('payer', 'receiver', 'bytes',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class EosActionBuyRamBytes(p.MessageType):
         self.receiver = receiver
         self.bytes = bytes
 
+    _FIELDS = {
+        1: ('payer', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('bytes', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('payer', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('bytes', p.UVarintType, 0),
-        }
+        return cls._FIELDS
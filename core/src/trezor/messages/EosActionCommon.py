@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosPermissionLevel import EosPermissionLevel
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class EosActionCommon(p.MessageType):
+    __slots__ = ('account', 'name', 'authorization',)
 
     def __init__(
         self,
@@ -23,10 +21,12 @@ class EosActionCommon(p.MessageType):
         self.name = name
         self.authorization = authorization if authorization is not None else []
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('name', p.UVarintType, 0),
+        3: ('authorization', EosPermissionLevel, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('name', p.UVarintType, 0),
-            3: ('authorization', EosPermissionLevel, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosAsset import EosAsset
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionDelegate(p.MessageType):
+    __slots__ = ('sender', 'receiver', 'net_quantity', 'cpu_quantity', 'transfer',)
 
     def __init__(
         self,
@@ -27,12 +25,14 @@ class EosActionDelegate(p.MessageType):
         self.cpu_quantity = cpu_quantity
         self.transfer = transfer
 
+    _FIELDS = {
+        1: ('sender', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('net_quantity', EosAsset, 0),
+        4: ('cpu_quantity', EosAsset, 0),
+        5: ('transfer', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('sender', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('net_quantity', EosAsset, 0),
-            4: ('cpu_quantity', EosAsset, 0),
-            5: ('transfer', p.BoolType, 0),
-        }
+        return cls._FIELDS
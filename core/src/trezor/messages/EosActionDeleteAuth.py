@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionDeleteAuth(p.MessageType):
+    __slots__ = ('account', 'permission',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class EosActionDeleteAuth(p.MessageType):
         self.account = account
         self.permission = permission
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('permission', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('permission', p.UVarintType, 0),
-        }
+        return cls._FIELDS
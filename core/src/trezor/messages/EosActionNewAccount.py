@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosAuthorization import EosAuthorization
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionNewAccount(p.MessageType):
+    __slots__ = ('creator', 'name', 'owner', 'active',)
 
     def __init__(
         self,
@@ -25,11 +23,13 @@ class EosActionNewAccount(p.MessageType):
         self.owner = owner
         self.active = active
 
+    _FIELDS = {
+        1: ('creator', p.UVarintType, 0),
+        2: ('name', p.UVarintType, 0),
+        3: ('owner', EosAuthorization, 0),
+        4: ('active', EosAuthorization, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('creator', p.UVarintType, 0),
-            2: ('name', p.UVarintType, 0),
-            3: ('owner', EosAuthorization, 0),
-            4: ('active', EosAuthorization, 0),
-        }
+        return cls._FIELDS
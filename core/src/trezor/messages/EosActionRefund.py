@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionRefund(p.MessageType):
+    __slots__ = ('owner',)
 
     def __init__(
         self,
@@ -17,8 +15,10 @@ class EosActionRefund(p.MessageType):
     ) -> None:
         self.owner = owner
 
+    _FIELDS = {
+        1: ('owner', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('owner', p.UVarintType, 0),
-        }
+        return cls._FIELDS
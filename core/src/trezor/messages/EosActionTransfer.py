@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosAsset import EosAsset
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionTransfer(p.MessageType):
+    __slots__ = ('sender', 'receiver', 'quantity', 'memo',)
 
     def __init__(
         self,
@@ -25,11 +23,13 @@ class EosActionTransfer(p.MessageType):
         self.quantity = quantity
         self.memo = memo
 
+    _FIELDS = {
+        1: ('sender', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('quantity', EosAsset, 0),
+        4: ('memo', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('sender', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('quantity', EosAsset, 0),
-            4: ('memo', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosAsset import EosAsset
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionUndelegate(p.MessageType):
+    __slots__ = ('sender', 'receiver', 'net_quantity', 'cpu_quantity',)
 
     def __init__(
         self,
@@ -25,11 +23,13 @@ class EosActionUndelegate(p.MessageType):
         self.net_quantity = net_quantity
         self.cpu_quantity = cpu_quantity
 
+    _FIELDS = {
+        1: ('sender', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('net_quantity', EosAsset, 0),
+        4: ('cpu_quantity', EosAsset, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('sender', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('net_quantity', EosAsset, 0),
-            4: ('cpu_quantity', EosAsset, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionUnknown(p.MessageType):
+    __slots__ = ('data_size', 'data_chunk',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class EosActionUnknown(p.MessageType):
         self.data_size = data_size
         self.data_chunk = data_chunk
 
+    _FIELDS = {
+        1: ('data_size', p.UVarintType, 0),
+        2: ('data_chunk', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data_size', p.UVarintType, 0),
-            2: ('data_chunk', p.BytesType, 0),
-        }
+        return cls._FIELDS
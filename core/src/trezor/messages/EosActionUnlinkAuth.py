@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionUnlinkAuth(p.MessageType):
+    __slots__ = ('account', 'code', 'type',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class EosActionUnlinkAuth(p.MessageType):
         self.code = code
         self.type = type
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('code', p.UVarintType, 0),
+        3: ('type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('code', p.UVarintType, 0),
-            3: ('type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
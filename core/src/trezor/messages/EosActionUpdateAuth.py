@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosAuthorization import EosAuthorization
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosActionUpdateAuth(p.MessageType):
+    __slots__ = ('account', 'permission', 'parent', 'auth',)
 
     def __init__(
         self,
@@ -25,11 +23,13 @@ class EosActionUpdateAuth(p.MessageType):
         self.parent = parent
         self.auth = auth
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('permission', p.UVarintType, 0),
+        3: ('parent', p.UVarintType, 0),
+        4: ('auth', EosAuthorization, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('permission', p.UVarintType, 0),
-            3: ('parent', p.UVarintType, 0),
-            4: ('auth', EosAuthorization, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class EosActionVoteProducer(p.MessageType):
+    __slots__ = ('voter', 'proxy', 'producers',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class EosActionVoteProducer(p.MessageType):
         self.proxy = proxy
         self.producers = producers if producers is not None else []
 
+    _FIELDS = {
+        1: ('voter', p.UVarintType, 0),
+        2: ('proxy', p.UVarintType, 0),
+        3: ('producers', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('voter', p.UVarintType, 0),
-            2: ('proxy', p.UVarintType, 0),
-            3: ('producers', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosAsset(p.MessageType):
+    __slots__ = ('amount', 'symbol',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class EosAsset(p.MessageType):
         self.amount = amount
         self.symbol = symbol
 
+    _FIELDS = {
+        1: ('amount', p.SVarintType, 0),
+        2: ('symbol', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.SVarintType, 0),
-            2: ('symbol', p.UVarintType, 0),
-        }
+        return cls._FIELDS
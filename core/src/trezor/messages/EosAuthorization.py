@@ -6,14 +6,12 @@ from .EosAuthorizationAccount import EosAuthorizationAccount
 from .EosAuthorizationKey import EosAuthorizationKey
 from .EosAuthorizationWait import EosAuthorizationWait
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class EosAuthorization(p.MessageType):
+    __slots__ = ('threshold', 'keys', 'accounts', 'waits',)
 
     def __init__(
         self,
@@ -27,11 +25,13 @@ class EosAuthorization(p.MessageType):
         self.accounts = accounts if accounts is not None else []
         self.waits = waits if waits is not None else []
 
+    _FIELDS = {
+        1: ('threshold', p.UVarintType, 0),
+        2: ('keys', EosAuthorizationKey, p.FLAG_REPEATED),
+        3: ('accounts', EosAuthorizationAccount, p.FLAG_REPEATED),
+        4: ('waits', EosAuthorizationWait, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('threshold', p.UVarintType, 0),
-            2: ('keys', EosAuthorizationKey, p.FLAG_REPEATED),
-            3: ('accounts', EosAuthorizationAccount, p.FLAG_REPEATED),
-            4: ('waits', EosAuthorizationWait, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
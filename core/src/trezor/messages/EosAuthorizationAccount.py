@@ -4,14 +4,12 @@ import protobuf as p
 
 from .EosPermissionLevel import EosPermissionLevel
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosAuthorizationAccount(p.MessageType):
+    __slots__ = ('account', 'weight',)
 
     def __init__(
         self,
@@ -21,9 +19,11 @@ class EosAuthorizationAccount(p.MessageType):
         self.account = account
         self.weight = weight
 
+    _FIELDS = {
+        1: ('account', EosPermissionLevel, 0),
+        2: ('weight', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', EosPermissionLevel, 0),
-            2: ('weight', p.UVarintType, 0),
-        }
+        return cls._FIELDS
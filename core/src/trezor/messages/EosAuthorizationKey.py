@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class EosAuthorizationKey(p.MessageType):
+    __slots__ = ('type', 'key', 'address_n', 'weight',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class EosAuthorizationKey(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.weight = weight
 
+    _FIELDS = {
+        1: ('type', p.UVarintType, 0),
+        2: ('key', p.BytesType, 0),
+        3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        4: ('weight', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('key', p.BytesType, 0),
-            3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            4: ('weight', p.UVarintType, 0),
-        }
+        return cls._FIELDS
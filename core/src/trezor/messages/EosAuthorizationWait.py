@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosAuthorizationWait(p.MessageType):
+    __slots__ = ('wait_sec', 'weight',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class EosAuthorizationWait(p.MessageType):
         self.wait_sec = wait_sec
         self.weight = weight
 
+    _FIELDS = {
+        1: ('wait_sec', p.UVarintType, 0),
+        2: ('weight', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('wait_sec', p.UVarintType, 0),
-            2: ('weight', p.UVarintType, 0),
-        }
+        return cls._FIELDS
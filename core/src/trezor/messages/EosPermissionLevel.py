@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosPermissionLevel(p.MessageType):
+    __slots__ = ('actor', 'permission',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class EosPermissionLevel(p.MessageType):
         self.actor = actor
         self.permission = permission
 
+    _FIELDS = {
+        1: ('actor', p.UVarintType, 0),
+        2: ('permission', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('actor', p.UVarintType, 0),
-            2: ('permission', p.UVarintType, 0),
-        }
+        return cls._FIELDS
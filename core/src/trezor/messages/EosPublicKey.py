@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosPublicKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 601
+    MESSAGE_WIRE_TYPE = const(601)
+    __slots__ = ('wif_public_key', 'raw_public_key',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class EosPublicKey(p.MessageType):
         self.wif_public_key = wif_public_key
         self.raw_public_key = raw_public_key
 
+    _FIELDS = {
+        1: ('wif_public_key', p.UnicodeType, 0),
+        2: ('raw_public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('wif_public_key', p.UnicodeType, 0),
-            2: ('raw_public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .EosTxHeader import EosTxHeader
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class EosSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 602
+    MESSAGE_WIRE_TYPE = const(602)
+    __slots__ = ('address_n', 'chain_id', 'header', 'num_actions',)
 
     def __init__(
         self,
@@ -26,11 +26,13 @@ class EosSignTx(p.MessageType):
         self.header = header
         self.num_actions = num_actions
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('chain_id', p.BytesType, 0),
+        3: ('header', EosTxHeader, 0),
+        4: ('num_actions', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('chain_id', p.BytesType, 0),
-            3: ('header', EosTxHeader, 0),
-            4: ('num_actions', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,5 +1,7 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .EosActionBuyRam import EosActionBuyRam
@@ -18,15 +20,13 @@ from .EosActionUnlinkAuth import EosActionUnlinkAuth
 from .EosActionUpdateAuth import EosActionUpdateAuth
 from .EosActionVoteProducer import EosActionVoteProducer
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosTxActionAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 604
+    MESSAGE_WIRE_TYPE = const(604)
+    __slots__ = ('common', 'transfer', 'delegate', 'undelegate', 'refund', 'buy_ram', 'buy_ram_bytes', 'sell_ram', 'vote_producer', 'update_auth', 'delete_auth', 'link_auth', 'unlink_auth', 'new_account', 'unknown',)
 
     def __init__(
         self,
@@ -62,22 +62,24 @@ class EosTxActionAck(p.MessageType):
         self.new_account = new_account
         self.unknown = unknown
 
+    _FIELDS = {
+        1: ('common', EosActionCommon, 0),
+        2: ('transfer', EosActionTransfer, 0),
+        3: ('delegate', EosActionDelegate, 0),
+        4: ('undelegate', EosActionUndelegate, 0),
+        5: ('refund', EosActionRefund, 0),
+        6: ('buy_ram', EosActionBuyRam, 0),
+        7: ('buy_ram_bytes', EosActionBuyRamBytes, 0),
+        8: ('sell_ram', EosActionSellRam, 0),
+        9: ('vote_producer', EosActionVoteProducer, 0),
+        10: ('update_auth', EosActionUpdateAuth, 0),
+        11: ('delete_auth', EosActionDeleteAuth, 0),
+        12: ('link_auth', EosActionLinkAuth, 0),
+        13: ('unlink_auth', EosActionUnlinkAuth, 0),
+        14: ('new_account', EosActionNewAccount, 0),
+        15: ('unknown', EosActionUnknown, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('common', EosActionCommon, 0),
-            2: ('transfer', EosActionTransfer, 0),
-            3: ('delegate', EosActionDelegate, 0),
-            4: ('undelegate', EosActionUndelegate, 0),
-            5: ('refund', EosActionRefund, 0),
-            6: ('buy_ram', EosActionBuyRam, 0),
-            7: ('buy_ram_bytes', EosActionBuyRamBytes, 0),
-            8: ('sell_ram', EosActionSellRam, 0),
-            9: ('vote_producer', EosActionVoteProducer, 0),
-            10: ('update_auth', EosActionUpdateAuth, 0),
-            11: ('delete_auth', EosActionDeleteAuth, 0),
-            12: ('link_auth', EosActionLinkAuth, 0),
-            13: ('unlink_auth', EosActionUnlinkAuth, 0),
-            14: ('new_account', EosActionNewAccount, 0),
-            15: ('unknown', EosActionUnknown, 0),
-        }
+        return cls._FIELDS
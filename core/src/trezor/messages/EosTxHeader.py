@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EosTxHeader(p.MessageType):
+    __slots__ = ('expiration', 'ref_block_num', 'ref_block_prefix', 'max_net_usage_words', 'max_cpu_usage_ms', 'delay_sec',)
 
     def __init__(
         self,
@@ -27,13 +25,15 @@ class EosTxHeader(p.MessageType):
         self.max_cpu_usage_ms = max_cpu_usage_ms
         self.delay_sec = delay_sec
 
+    _FIELDS = {
+        1: ('expiration', p.UVarintType, 0),  # required
+        2: ('ref_block_num', p.UVarintType, 0),  # required
+        3: ('ref_block_prefix', p.UVarintType, 0),  # required
+        4: ('max_net_usage_words', p.UVarintType, 0),  # required
+        5: ('max_cpu_usage_ms', p.UVarintType, 0),  # required
+        6: ('delay_sec', p.UVarintType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('expiration', p.UVarintType, 0),  # required
-            2: ('ref_block_num', p.UVarintType, 0),  # required
-            3: ('ref_block_prefix', p.UVarintType, 0),  # required
-            4: ('max_net_usage_words', p.UVarintType, 0),  # required
-            5: ('max_cpu_usage_ms', p.UVarintType, 0),  # required
-            6: ('delay_sec', p.UVarintType, 0),  # required
-        }
+        return cls._FIELDS
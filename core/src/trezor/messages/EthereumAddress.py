@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EthereumAddress(p.MessageType):
-    MESSAGE_WIRE_TYPE = 57
+    MESSAGE_WIRE_TYPE = const(57)
+    __slots__ = ('old_address', 'address',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class EthereumAddress(p.MessageType):
         self.old_address = old_address
         self.address = address
 
+    _FIELDS = {
+        1: ('old_address', p.BytesType, 0),
+        2: ('address', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('old_address', p.BytesType, 0),
-            2: ('address', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EthereumMessageSignature(p.MessageType):
-    MESSAGE_WIRE_TYPE = 66
+    MESSAGE_WIRE_TYPE = const(66)
+    __slots__ = ('signature', 'address',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class EthereumMessageSignature(p.MessageType):
         self.signature = signature
         self.address = address
 
+    _FIELDS = {
+        2: ('signature', p.BytesType, 0),
+        3: ('address', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            2: ('signature', p.BytesType, 0),
-            3: ('address', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
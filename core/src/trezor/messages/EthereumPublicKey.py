@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .HDNodeType import HDNodeType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EthereumPublicKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 451
+    MESSAGE_WIRE_TYPE = const(451)
+    __slots__ = ('node', 'xpub',)
 
     def __init__(
         self,
@@ -22,9 +22,11 @@ class EthereumPublicKey(p.MessageType):
         self.node = node
         self.xpub = xpub
 
+    _FIELDS = {
+        1: ('node', HDNodeType, 0),
+        2: ('xpub', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('node', HDNodeType, 0),
-            2: ('xpub', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class EthereumSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 58
+    MESSAGE_WIRE_TYPE = const(58)
+    __slots__ = ('address_n', 'nonce', 'gas_price', 'gas_limit', 'to', 'value', 'data_initial_chunk', 'data_length', 'chain_id', 'tx_type',)
 
     def __init__(
         self,
@@ -36,17 +36,19 @@ class EthereumSignTx(p.MessageType):
         self.chain_id = chain_id
         self.tx_type = tx_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('nonce', p.BytesType, 0),
+        3: ('gas_price', p.BytesType, 0),
+        4: ('gas_limit', p.BytesType, 0),
+        11: ('to', p.UnicodeType, 0),
+        6: ('value', p.BytesType, 0),
+        7: ('data_initial_chunk', p.BytesType, 0),
+        8: ('data_length', p.UVarintType, 0),
+        9: ('chain_id', p.UVarintType, 0),
+        10: ('tx_type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('nonce', p.BytesType, 0),
-            3: ('gas_price', p.BytesType, 0),
-            4: ('gas_limit', p.BytesType, 0),
-            11: ('to', p.UnicodeType, 0),
-            6: ('value', p.BytesType, 0),
-            7: ('data_initial_chunk', p.BytesType, 0),
-            8: ('data_length', p.UVarintType, 0),
-            9: ('chain_id', p.UVarintType, 0),
-            10: ('tx_type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
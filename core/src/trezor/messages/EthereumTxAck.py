@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EthereumTxAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 60
+    MESSAGE_WIRE_TYPE = const(60)
+    __slots__ = ('data_chunk',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class EthereumTxAck(p.MessageType):
     ) -> None:
         self.data_chunk = data_chunk
 
+    _FIELDS = {
+        1: ('data_chunk', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data_chunk', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EthereumTxRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 59
+    MESSAGE_WIRE_TYPE = const(59)
+    __slots__ = ('data_length', 'signature_v', 'signature_r', 'signature_s',)
 
     def __init__(
         self,
@@ -24,11 +24,13 @@ class EthereumTxRequest(p.MessageType):
         self.signature_r = signature_r
         self.signature_s = signature_s
 
+    _FIELDS = {
+        1: ('data_length', p.UVarintType, 0),
+        2: ('signature_v', p.UVarintType, 0),
+        3: ('signature_r', p.BytesType, 0),
+        4: ('signature_s', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data_length', p.UVarintType, 0),
-            2: ('signature_v', p.UVarintType, 0),
-            3: ('signature_r', p.BytesType, 0),
-            4: ('signature_s', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class EthereumVerifyMessage(p.MessageType):
-    MESSAGE_WIRE_TYPE = 65
+    MESSAGE_WIRE_TYPE = const(65)
+    __slots__ = ('signature', 'message', 'address',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class EthereumVerifyMessage(p.MessageType):
         self.message = message
         self.address = address
 
+    _FIELDS = {
+        2: ('signature', p.BytesType, 0),
+        3: ('message', p.BytesType, 0),
+        4: ('address', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-            4: ('address', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
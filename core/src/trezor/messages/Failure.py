@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class Failure(p.MessageType):
-    MESSAGE_WIRE_TYPE = 3
+    MESSAGE_WIRE_TYPE = const(3)
+    __slots__ = ('code', 'message',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class Failure(p.MessageType):
         self.code = code
         self.message = message
 
+    _FIELDS = {
+        1: ('code', p.UVarintType, 0),
+        2: ('message', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('code', p.UVarintType, 0),
-            2: ('message', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
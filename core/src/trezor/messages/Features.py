@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class Features(p.MessageType):
-    MESSAGE_WIRE_TYPE = 17
+    MESSAGE_WIRE_TYPE = const(17)
+    __slots__ = ('vendor', 'major_version', 'minor_version', 'patch_version', 'bootloader_mode', 'device_id', 'pin_protection', 'passphrase_protection', 'language', 'label', 'initialized', 'revision', 'bootloader_hash', 'imported', 'pin_cached', 'passphrase_cached', 'firmware_present', 'needs_backup', 'flags', 'model', 'fw_major', 'fw_minor', 'fw_patch', 'fw_vendor', 'fw_vendor_keys', 'unfinished_backup', 'no_backup', 'recovery_mode',)
 
     def __init__(
         self,
@@ -72,35 +72,37 @@ class Features(p.MessageType):
         self.no_backup = no_backup
         self.recovery_mode = recovery_mode
 
+    _FIELDS = {
+        1: ('vendor', p.UnicodeType, 0),
+        2: ('major_version', p.UVarintType, 0),
+        3: ('minor_version', p.UVarintType, 0),
+        4: ('patch_version', p.UVarintType, 0),
+        5: ('bootloader_mode', p.BoolType, 0),
+        6: ('device_id', p.UnicodeType, 0),
+        7: ('pin_protection', p.BoolType, 0),
+        8: ('passphrase_protection', p.BoolType, 0),
+        9: ('language', p.UnicodeType, 0),
+        10: ('label', p.UnicodeType, 0),
+        12: ('initialized', p.BoolType, 0),
+        13: ('revision', p.BytesType, 0),
+        14: ('bootloader_hash', p.BytesType, 0),
+        15: ('imported', p.BoolType, 0),
+        16: ('pin_cached', p.BoolType, 0),
+        17: ('passphrase_cached', p.BoolType, 0),
+        18: ('firmware_present', p.BoolType, 0),
+        19: ('needs_backup', p.BoolType, 0),
+        20: ('flags', p.UVarintType, 0),
+        21: ('model', p.UnicodeType, 0),
+        22: ('fw_major', p.UVarintType, 0),
+        23: ('fw_minor', p.UVarintType, 0),
+        24: ('fw_patch', p.UVarintType, 0),
+        25: ('fw_vendor', p.UnicodeType, 0),
+        26: ('fw_vendor_keys', p.BytesType, 0),
+        27: ('unfinished_backup', p.BoolType, 0),
+        28: ('no_backup', p.BoolType, 0),
+        29: ('recovery_mode', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('vendor', p.UnicodeType, 0),
-            2: ('major_version', p.UVarintType, 0),
-            3: ('minor_version', p.UVarintType, 0),
-            4: ('patch_version', p.UVarintType, 0),
-            5: ('bootloader_mode', p.BoolType, 0),
-            6: ('device_id', p.UnicodeType, 0),
-            7: ('pin_protection', p.BoolType, 0),
-            8: ('passphrase_protection', p.BoolType, 0),
-            9: ('language', p.UnicodeType, 0),
-            10: ('label', p.UnicodeType, 0),
-            12: ('initialized', p.BoolType, 0),
-            13: ('revision', p.BytesType, 0),
-            14: ('bootloader_hash', p.BytesType, 0),
-            15: ('imported', p.BoolType, 0),
-            16: ('pin_cached', p.BoolType, 0),
-            17: ('passphrase_cached', p.BoolType, 0),
-            18: ('firmware_present', p.BoolType, 0),
-            19: ('needs_backup', p.BoolType, 0),
-            20: ('flags', p.UVarintType, 0),
-            21: ('model', p.UnicodeType, 0),
-            22: ('fw_major', p.UVarintType, 0),
-            23: ('fw_minor', p.UVarintType, 0),
-            24: ('fw_patch', p.UVarintType, 0),
-            25: ('fw_vendor', p.UnicodeType, 0),
-            26: ('fw_vendor_keys', p.BytesType, 0),
-            27: ('unfinished_backup', p.BoolType, 0),
-            28: ('no_backup', p.BoolType, 0),
-            29: ('recovery_mode', p.BoolType, 0),
-        }
+        return cls._FIELDS
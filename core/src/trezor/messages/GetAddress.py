@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MultisigRedeemScriptType import MultisigRedeemScriptType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class GetAddress(p.MessageType):
-    MESSAGE_WIRE_TYPE = 29
+    MESSAGE_WIRE_TYPE = const(29)
+    __slots__ = ('address_n', 'coin_name', 'show_display', 'multisig', 'script_type',)
 
     def __init__(
         self,
@@ -28,12 +28,14 @@ class GetAddress(p.MessageType):
         self.multisig = multisig
         self.script_type = script_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+        3: ('show_display', p.BoolType, 0),
+        4: ('multisig', MultisigRedeemScriptType, 0),
+        5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            3: ('show_display', p.BoolType, 0),
-            4: ('multisig', MultisigRedeemScriptType, 0),
-            5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
+        return cls._FIELDS
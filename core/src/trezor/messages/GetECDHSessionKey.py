@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .IdentityType import IdentityType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class GetECDHSessionKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 61
+    MESSAGE_WIRE_TYPE = const(61)
+    __slots__ = ('identity', 'peer_public_key', 'ecdsa_curve_name',)
 
     def __init__(
         self,
@@ -24,10 +24,12 @@ class GetECDHSessionKey(p.MessageType):
         self.peer_public_key = peer_public_key
         self.ecdsa_curve_name = ecdsa_curve_name
 
+    _FIELDS = {
+        1: ('identity', IdentityType, 0),
+        2: ('peer_public_key', p.BytesType, 0),
+        3: ('ecdsa_curve_name', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('identity', IdentityType, 0),
-            2: ('peer_public_key', p.BytesType, 0),
-            3: ('ecdsa_curve_name', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class GetEntropy(p.MessageType):
-    MESSAGE_WIRE_TYPE = 9
+    MESSAGE_WIRE_TYPE = const(9)
+    __slots__ = ('size',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class GetEntropy(p.MessageType):
     ) -> None:
         self.size = size
 
+    _FIELDS = {
+        1: ('size', p.UVarintType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('size', p.UVarintType, 0),  # required
-        }
+        return cls._FIELDS
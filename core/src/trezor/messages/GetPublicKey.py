@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class GetPublicKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 11
+    MESSAGE_WIRE_TYPE = const(11)
+    __slots__ = ('address_n', 'ecdsa_curve_name', 'show_display', 'coin_name', 'script_type',)
 
     def __init__(
         self,
@@ -26,12 +26,14 @@ class GetPublicKey(p.MessageType):
         self.coin_name = coin_name
         self.script_type = script_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('ecdsa_curve_name', p.UnicodeType, 0),
+        3: ('show_display', p.BoolType, 0),
+        4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+        5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('ecdsa_curve_name', p.UnicodeType, 0),
-            3: ('show_display', p.BoolType, 0),
-            4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
+        return cls._FIELDS
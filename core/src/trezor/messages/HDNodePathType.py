@@ -4,14 +4,12 @@ import protobuf as p
 
 from .HDNodeType import HDNodeType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class HDNodePathType(p.MessageType):
+    __slots__ = ('node', 'address_n',)
 
     def __init__(
         self,
@@ -21,9 +19,11 @@ class HDNodePathType(p.MessageType):
         self.node = node
         self.address_n = address_n if address_n is not None else []
 
+    _FIELDS = {
+        1: ('node', HDNodeType, 0),  # required
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('node', HDNodeType, 0),  # required
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class HDNodeType(p.MessageType):
+    __slots__ = ('depth', 'fingerprint', 'child_num', 'chain_code', 'private_key', 'public_key',)
 
     def __init__(
         self,
@@ -27,13 +25,15 @@ class HDNodeType(p.MessageType):
         self.private_key = private_key
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('depth', p.UVarintType, 0),  # required
+        2: ('fingerprint', p.UVarintType, 0),  # required
+        3: ('child_num', p.UVarintType, 0),  # required
+        4: ('chain_code', p.BytesType, 0),  # required
+        5: ('private_key', p.BytesType, 0),
+        6: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('depth', p.UVarintType, 0),  # required
-            2: ('fingerprint', p.UVarintType, 0),  # required
-            3: ('child_num', p.UVarintType, 0),  # required
-            4: ('chain_code', p.BytesType, 0),  # required
-            5: ('private_key', p.BytesType, 0),
-            6: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
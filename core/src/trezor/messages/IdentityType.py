@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class IdentityType(p.MessageType):
+    __slots__ = ('proto', 'user', 'host', 'port', 'path', 'index',)
 
     def __init__(
         self,
@@ -27,13 +25,15 @@ class IdentityType(p.MessageType):
         self.path = path
         self.index = index
 
+    _FIELDS = {
+        1: ('proto', p.UnicodeType, 0),
+        2: ('user', p.UnicodeType, 0),
+        3: ('host', p.UnicodeType, 0),
+        4: ('port', p.UnicodeType, 0),
+        5: ('path', p.UnicodeType, 0),
+        6: ('index', p.UVarintType, 0),  # default=0
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('proto', p.UnicodeType, 0),
-            2: ('user', p.UnicodeType, 0),
-            3: ('host', p.UnicodeType, 0),
-            4: ('port', p.UnicodeType, 0),
-            5: ('path', p.UnicodeType, 0),
-            6: ('index', p.UVarintType, 0),  # default=0
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class Initialize(p.MessageType):
-    MESSAGE_WIRE_TYPE = 0
+    MESSAGE_WIRE_TYPE = const(0)
+    __slots__ = ('state', 'skip_passphrase',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class Initialize(p.MessageType):
         self.state = state
         self.skip_passphrase = skip_passphrase
 
+    _FIELDS = {
+        1: ('state', p.BytesType, 0),
+        2: ('skip_passphrase', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('state', p.BytesType, 0),
-            2: ('skip_passphrase', p.BoolType, 0),
-        }
+        return cls._FIELDS
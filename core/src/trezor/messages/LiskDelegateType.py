@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class LiskDelegateType(p.MessageType):
+    __slots__ = ('username',)
 
     def __init__(
         self,
@@ -17,8 +15,10 @@ class LiskDelegateType(p.MessageType):
     ) -> None:
         self.username = username
 
+    _FIELDS = {
+        1: ('username', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('username', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
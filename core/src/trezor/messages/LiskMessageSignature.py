@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class LiskMessageSignature(p.MessageType):
-    MESSAGE_WIRE_TYPE = 119
+    MESSAGE_WIRE_TYPE = const(119)
+    __slots__ = ('public_key', 'signature',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class LiskMessageSignature(p.MessageType):
         self.public_key = public_key
         self.signature = signature
 
+    _FIELDS = {
+        1: ('public_key', p.BytesType, 0),
+        2: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('public_key', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
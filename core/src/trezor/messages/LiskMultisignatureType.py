@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class LiskMultisignatureType(p.MessageType):
+    __slots__ = ('min', 'life_time', 'keys_group',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class LiskMultisignatureType(p.MessageType):
         self.life_time = life_time
         self.keys_group = keys_group if keys_group is not None else []
 
+    _FIELDS = {
+        1: ('min', p.UVarintType, 0),
+        2: ('life_time', p.UVarintType, 0),
+        3: ('keys_group', p.UnicodeType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('min', p.UVarintType, 0),
-            2: ('life_time', p.UVarintType, 0),
-            3: ('keys_group', p.UnicodeType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .LiskTransactionCommon import LiskTransactionCommon
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class LiskSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 116
+    MESSAGE_WIRE_TYPE = const(116)
+    __slots__ = ('address_n', 'transaction',)
 
     def __init__(
         self,
@@ -22,9 +22,11 @@ class LiskSignTx(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.transaction = transaction
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('transaction', LiskTransactionCommon, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('transaction', LiskTransactionCommon, 0),
-        }
+        return cls._FIELDS
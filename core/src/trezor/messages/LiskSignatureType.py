@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class LiskSignatureType(p.MessageType):
+    __slots__ = ('public_key',)
 
     def __init__(
         self,
@@ -17,8 +15,10 @@ class LiskSignatureType(p.MessageType):
     ) -> None:
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
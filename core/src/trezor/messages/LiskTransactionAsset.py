@@ -6,14 +6,12 @@ from .LiskDelegateType import LiskDelegateType
 from .LiskMultisignatureType import LiskMultisignatureType
 from .LiskSignatureType import LiskSignatureType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class LiskTransactionAsset(p.MessageType):
+    __slots__ = ('signature', 'delegate', 'votes', 'multisignature', 'data',)
 
     def __init__(
         self,
@@ -29,12 +27,14 @@ class LiskTransactionAsset(p.MessageType):
         self.multisignature = multisignature
         self.data = data
 
+    _FIELDS = {
+        1: ('signature', LiskSignatureType, 0),
+        2: ('delegate', LiskDelegateType, 0),
+        3: ('votes', p.UnicodeType, p.FLAG_REPEATED),
+        4: ('multisignature', LiskMultisignatureType, 0),
+        5: ('data', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', LiskSignatureType, 0),
-            2: ('delegate', LiskDelegateType, 0),
-            3: ('votes', p.UnicodeType, p.FLAG_REPEATED),
-            4: ('multisignature', LiskMultisignatureType, 0),
-            5: ('data', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
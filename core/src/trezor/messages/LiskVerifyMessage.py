@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class LiskVerifyMessage(p.MessageType):
-    MESSAGE_WIRE_TYPE = 120
+    MESSAGE_WIRE_TYPE = const(120)
+    __slots__ = ('public_key', 'signature', 'message',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class LiskVerifyMessage(p.MessageType):
         self.signature = signature
         self.message = message
 
+    _FIELDS = {
+        1: ('public_key', p.BytesType, 0),
+        2: ('signature', p.BytesType, 0),
+        3: ('message', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('public_key', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .HDNodeType import HDNodeType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class LoadDevice(p.MessageType):
-    MESSAGE_WIRE_TYPE = 13
+    MESSAGE_WIRE_TYPE = const(13)
+    __slots__ = ('mnemonics', 'node', 'pin', 'passphrase_protection', 'language', 'label', 'skip_checksum', 'u2f_counter',)
 
     def __init__(
         self,
@@ -34,15 +34,17 @@ class LoadDevice(p.MessageType):
         self.skip_checksum = skip_checksum
         self.u2f_counter = u2f_counter
 
+    _FIELDS = {
+        1: ('mnemonics', p.UnicodeType, p.FLAG_REPEATED),
+        2: ('node', HDNodeType, 0),
+        3: ('pin', p.UnicodeType, 0),
+        4: ('passphrase_protection', p.BoolType, 0),
+        5: ('language', p.UnicodeType, 0),  # default=english
+        6: ('label', p.UnicodeType, 0),
+        7: ('skip_checksum', p.BoolType, 0),
+        8: ('u2f_counter', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('mnemonics', p.UnicodeType, p.FLAG_REPEATED),
-            2: ('node', HDNodeType, 0),
-            3: ('pin', p.UnicodeType, 0),
-            4: ('passphrase_protection', p.BoolType, 0),
-            5: ('language', p.UnicodeType, 0),  # default=english
-            6: ('label', p.UnicodeType, 0),
-            7: ('skip_checksum', p.BoolType, 0),
-            8: ('u2f_counter', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MessageSignature(p.MessageType):
-    MESSAGE_WIRE_TYPE = 40
+    MESSAGE_WIRE_TYPE = const(40)
+    __slots__ = ('address', 'signature',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class MessageSignature(p.MessageType):
         self.address = address
         self.signature = signature
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
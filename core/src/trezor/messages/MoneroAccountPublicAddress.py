@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroAccountPublicAddress(p.MessageType):
+    __slots__ = ('spend_public_key', 'view_public_key',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class MoneroAccountPublicAddress(p.MessageType):
         self.spend_public_key = spend_public_key
         self.view_public_key = view_public_key
 
+    _FIELDS = {
+        1: ('spend_public_key', p.BytesType, 0),
+        2: ('view_public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('spend_public_key', p.BytesType, 0),
-            2: ('view_public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
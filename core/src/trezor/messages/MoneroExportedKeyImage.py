@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroExportedKeyImage(p.MessageType):
+    __slots__ = ('iv', 'blob',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class MoneroExportedKeyImage(p.MessageType):
         self.iv = iv
         self.blob = blob
 
+    _FIELDS = {
+        1: ('iv', p.BytesType, 0),
+        3: ('blob', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('iv', p.BytesType, 0),
-            3: ('blob', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroGetAddress(p.MessageType):
-    MESSAGE_WIRE_TYPE = 540
+    MESSAGE_WIRE_TYPE = const(540)
+    __slots__ = ('address_n', 'show_display', 'network_type', 'account', 'minor', 'payment_id',)
 
     def __init__(
         self,
@@ -28,13 +28,15 @@ class MoneroGetAddress(p.MessageType):
         self.minor = minor
         self.payment_id = payment_id
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('show_display', p.BoolType, 0),
+        3: ('network_type', p.UVarintType, 0),
+        4: ('account', p.UVarintType, 0),
+        5: ('minor', p.UVarintType, 0),
+        6: ('payment_id', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('show_display', p.BoolType, 0),
-            3: ('network_type', p.UVarintType, 0),
-            4: ('account', p.UVarintType, 0),
-            5: ('minor', p.UVarintType, 0),
-            6: ('payment_id', p.BytesType, 0),
-        }
+        return cls._FIELDS
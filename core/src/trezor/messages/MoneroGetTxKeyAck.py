@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroGetTxKeyAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 551
+    MESSAGE_WIRE_TYPE = const(551)
+    __slots__ = ('salt', 'tx_keys', 'tx_derivations',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class MoneroGetTxKeyAck(p.MessageType):
         self.tx_keys = tx_keys
         self.tx_derivations = tx_derivations
 
+    _FIELDS = {
+        1: ('salt', p.BytesType, 0),
+        2: ('tx_keys', p.BytesType, 0),
+        3: ('tx_derivations', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('salt', p.BytesType, 0),
-            2: ('tx_keys', p.BytesType, 0),
-            3: ('tx_derivations', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroGetTxKeyRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 550
+    MESSAGE_WIRE_TYPE = const(550)
+    __slots__ = ('address_n', 'network_type', 'salt1', 'salt2', 'tx_enc_keys', 'tx_prefix_hash', 'reason', 'view_public_key',)
 
     def __init__(
         self,
@@ -32,15 +32,17 @@ class MoneroGetTxKeyRequest(p.MessageType):
         self.reason = reason
         self.view_public_key = view_public_key
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network_type', p.UVarintType, 0),
+        3: ('salt1', p.BytesType, 0),
+        4: ('salt2', p.BytesType, 0),
+        5: ('tx_enc_keys', p.BytesType, 0),
+        6: ('tx_prefix_hash', p.BytesType, 0),
+        7: ('reason', p.UVarintType, 0),
+        8: ('view_public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network_type', p.UVarintType, 0),
-            3: ('salt1', p.BytesType, 0),
-            4: ('salt2', p.BytesType, 0),
-            5: ('tx_enc_keys', p.BytesType, 0),
-            6: ('tx_prefix_hash', p.BytesType, 0),
-            7: ('reason', p.UVarintType, 0),
-            8: ('view_public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroSubAddressIndicesList import MoneroSubAddressIndicesList
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroKeyImageExportInitRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 530
+    MESSAGE_WIRE_TYPE = const(530)
+    __slots__ = ('num', 'hash', 'address_n', 'network_type', 'subs',)
 
     def __init__(
         self,
@@ -28,12 +28,14 @@ class MoneroKeyImageExportInitRequest(p.MessageType):
         self.network_type = network_type
         self.subs = subs if subs is not None else []
 
+    _FIELDS = {
+        1: ('num', p.UVarintType, 0),
+        2: ('hash', p.BytesType, 0),
+        3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        4: ('network_type', p.UVarintType, 0),
+        5: ('subs', MoneroSubAddressIndicesList, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('num', p.UVarintType, 0),
-            2: ('hash', p.BytesType, 0),
-            3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            4: ('network_type', p.UVarintType, 0),
-            5: ('subs', MoneroSubAddressIndicesList, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroKeyImageSyncFinalAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 535
+    MESSAGE_WIRE_TYPE = const(535)
+    __slots__ = ('enc_key',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class MoneroKeyImageSyncFinalAck(p.MessageType):
     ) -> None:
         self.enc_key = enc_key
 
+    _FIELDS = {
+        1: ('enc_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('enc_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
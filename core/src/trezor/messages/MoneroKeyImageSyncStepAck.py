@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroExportedKeyImage import MoneroExportedKeyImage
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroKeyImageSyncStepAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 533
+    MESSAGE_WIRE_TYPE = const(533)
+    __slots__ = ('kis',)
 
     def __init__(
         self,
@@ -20,8 +20,10 @@ class MoneroKeyImageSyncStepAck(p.MessageType):
     ) -> None:
         self.kis = kis if kis is not None else []
 
+    _FIELDS = {
+        1: ('kis', MoneroExportedKeyImage, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('kis', MoneroExportedKeyImage, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
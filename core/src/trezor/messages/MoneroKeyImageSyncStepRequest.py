@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransferDetails import MoneroTransferDetails
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroKeyImageSyncStepRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 532
+    MESSAGE_WIRE_TYPE = const(532)
+    __slots__ = ('tdis',)
 
     def __init__(
         self,
@@ -20,8 +20,10 @@ class MoneroKeyImageSyncStepRequest(p.MessageType):
     ) -> None:
         self.tdis = tdis if tdis is not None else []
 
+    _FIELDS = {
+        1: ('tdis', MoneroTransferDetails, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tdis', MoneroTransferDetails, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
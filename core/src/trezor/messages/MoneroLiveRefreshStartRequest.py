@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroLiveRefreshStartRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 552
+    MESSAGE_WIRE_TYPE = const(552)
+    __slots__ = ('address_n', 'network_type',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class MoneroLiveRefreshStartRequest(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.network_type = network_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network_type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network_type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroLiveRefreshStepAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 555
+    MESSAGE_WIRE_TYPE = const(555)
+    __slots__ = ('salt', 'key_image',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class MoneroLiveRefreshStepAck(p.MessageType):
         self.salt = salt
         self.key_image = key_image
 
+    _FIELDS = {
+        1: ('salt', p.BytesType, 0),
+        2: ('key_image', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('salt', p.BytesType, 0),
-            2: ('key_image', p.BytesType, 0),
-        }
+        return cls._FIELDS
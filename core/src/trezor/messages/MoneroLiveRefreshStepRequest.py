@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroLiveRefreshStepRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 554
+    MESSAGE_WIRE_TYPE = const(554)
+    __slots__ = ('out_key', 'recv_deriv', 'real_out_idx', 'sub_addr_major', 'sub_addr_minor',)
 
     def __init__(
         self,
@@ -26,12 +26,14 @@ class MoneroLiveRefreshStepRequest(p.MessageType):
         self.sub_addr_major = sub_addr_major
         self.sub_addr_minor = sub_addr_minor
 
+    _FIELDS = {
+        1: ('out_key', p.BytesType, 0),
+        2: ('recv_deriv', p.BytesType, 0),
+        3: ('real_out_idx', p.UVarintType, 0),
+        4: ('sub_addr_major', p.UVarintType, 0),
+        5: ('sub_addr_minor', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('out_key', p.BytesType, 0),
-            2: ('recv_deriv', p.BytesType, 0),
-            3: ('real_out_idx', p.UVarintType, 0),
-            4: ('sub_addr_major', p.UVarintType, 0),
-            5: ('sub_addr_minor', p.UVarintType, 0),
-        }
+        return cls._FIELDS
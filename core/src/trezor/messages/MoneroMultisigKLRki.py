@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroMultisigKLRki(p.MessageType):
+    __slots__ = ('K', 'L', 'R', 'ki',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class MoneroMultisigKLRki(p.MessageType):
         self.R = R
         self.ki = ki
 
+    _FIELDS = {
+        1: ('K', p.BytesType, 0),
+        2: ('L', p.BytesType, 0),
+        3: ('R', p.BytesType, 0),
+        4: ('ki', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('K', p.BytesType, 0),
-            2: ('L', p.BytesType, 0),
-            3: ('R', p.BytesType, 0),
-            4: ('ki', p.BytesType, 0),
-        }
+        return cls._FIELDS
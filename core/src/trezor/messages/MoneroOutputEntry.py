@@ -4,14 +4,12 @@ import protobuf as p
 
 from .MoneroRctKeyPublic import MoneroRctKeyPublic
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroOutputEntry(p.MessageType):
+    __slots__ = ('idx', 'key',)
 
     def __init__(
         self,
@@ -21,9 +19,11 @@ class MoneroOutputEntry(p.MessageType):
         self.idx = idx
         self.key = key
 
+    _FIELDS = {
+        1: ('idx', p.UVarintType, 0),
+        2: ('key', MoneroRctKeyPublic, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('idx', p.UVarintType, 0),
-            2: ('key', MoneroRctKeyPublic, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroRctKeyPublic(p.MessageType):
+    __slots__ = ('dest', 'commitment',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class MoneroRctKeyPublic(p.MessageType):
         self.dest = dest
         self.commitment = commitment
 
+    _FIELDS = {
+        1: ('dest', p.BytesType, 0),
+        2: ('commitment', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('dest', p.BytesType, 0),
-            2: ('commitment', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroRingCtSig(p.MessageType):
+    __slots__ = ('txn_fee', 'message', 'rv_type',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class MoneroRingCtSig(p.MessageType):
         self.message = message
         self.rv_type = rv_type
 
+    _FIELDS = {
+        1: ('txn_fee', p.UVarintType, 0),
+        2: ('message', p.BytesType, 0),
+        3: ('rv_type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('txn_fee', p.UVarintType, 0),
-            2: ('message', p.BytesType, 0),
-            3: ('rv_type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
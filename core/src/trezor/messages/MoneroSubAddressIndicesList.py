@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroSubAddressIndicesList(p.MessageType):
+    __slots__ = ('account', 'minor_indices',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class MoneroSubAddressIndicesList(p.MessageType):
         self.account = account
         self.minor_indices = minor_indices if minor_indices is not None else []
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionAllInputsSetAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 510
+    MESSAGE_WIRE_TYPE = const(510)
+    __slots__ = ('rsig_data',)
 
     def __init__(
         self,
@@ -20,8 +20,10 @@ class MoneroTransactionAllInputsSetAck(p.MessageType):
     ) -> None:
         self.rsig_data = rsig_data
 
+    _FIELDS = {
+        1: ('rsig_data', MoneroTransactionRsigData, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('rsig_data', MoneroTransactionRsigData, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroRingCtSig import MoneroRingCtSig
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionAllOutSetAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 514
+    MESSAGE_WIRE_TYPE = const(514)
+    __slots__ = ('extra', 'tx_prefix_hash', 'rv', 'full_message_hash',)
 
     def __init__(
         self,
@@ -26,11 +26,13 @@ class MoneroTransactionAllOutSetAck(p.MessageType):
         self.rv = rv
         self.full_message_hash = full_message_hash
 
+    _FIELDS = {
+        1: ('extra', p.BytesType, 0),
+        2: ('tx_prefix_hash', p.BytesType, 0),
+        4: ('rv', MoneroRingCtSig, 0),
+        5: ('full_message_hash', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('extra', p.BytesType, 0),
-            2: ('tx_prefix_hash', p.BytesType, 0),
-            4: ('rv', MoneroRingCtSig, 0),
-            5: ('full_message_hash', p.BytesType, 0),
-        }
+        return cls._FIELDS
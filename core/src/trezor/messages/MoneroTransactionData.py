@@ -5,14 +5,12 @@ import protobuf as p
 from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
 from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroTransactionData(p.MessageType):
+    __slots__ = ('version', 'payment_id', 'unlock_time', 'outputs', 'change_dts', 'num_inputs', 'mixin', 'fee', 'account', 'minor_indices', 'rsig_data', 'integrated_indices', 'client_version', 'hard_fork', 'monero_version',)
 
     def __init__(
         self,
@@ -48,22 +46,24 @@ class MoneroTransactionData(p.MessageType):
         self.hard_fork = hard_fork
         self.monero_version = monero_version
 
+    _FIELDS = {
+        1: ('version', p.UVarintType, 0),
+        2: ('payment_id', p.BytesType, 0),
+        3: ('unlock_time', p.UVarintType, 0),
+        4: ('outputs', MoneroTransactionDestinationEntry, p.FLAG_REPEATED),
+        5: ('change_dts', MoneroTransactionDestinationEntry, 0),
+        6: ('num_inputs', p.UVarintType, 0),
+        7: ('mixin', p.UVarintType, 0),
+        8: ('fee', p.UVarintType, 0),
+        9: ('account', p.UVarintType, 0),
+        10: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
+        11: ('rsig_data', MoneroTransactionRsigData, 0),
+        12: ('integrated_indices', p.UVarintType, p.FLAG_REPEATED),
+        13: ('client_version', p.UVarintType, 0),
+        14: ('hard_fork', p.UVarintType, 0),
+        15: ('monero_version', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('payment_id', p.BytesType, 0),
-            3: ('unlock_time', p.UVarintType, 0),
-            4: ('outputs', MoneroTransactionDestinationEntry, p.FLAG_REPEATED),
-            5: ('change_dts', MoneroTransactionDestinationEntry, 0),
-            6: ('num_inputs', p.UVarintType, 0),
-            7: ('mixin', p.UVarintType, 0),
-            8: ('fee', p.UVarintType, 0),
-            9: ('account', p.UVarintType, 0),
-            10: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
-            11: ('rsig_data', MoneroTransactionRsigData, 0),
-            12: ('integrated_indices', p.UVarintType, p.FLAG_REPEATED),
-            13: ('client_version', p.UVarintType, 0),
-            14: ('hard_fork', p.UVarintType, 0),
-            15: ('monero_version', p.BytesType, 0),
-        }
+        return cls._FIELDS
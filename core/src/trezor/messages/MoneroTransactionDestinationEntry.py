@@ -4,14 +4,12 @@ import protobuf as p
 
 from .MoneroAccountPublicAddress import MoneroAccountPublicAddress
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionDestinationEntry(p.MessageType):
+    __slots__ = ('amount', 'addr', 'is_subaddress', 'original', 'is_integrated',)
 
     def __init__(
         self,
@@ -27,12 +25,14 @@ class MoneroTransactionDestinationEntry(p.MessageType):
         self.original = original
         self.is_integrated = is_integrated
 
+    _FIELDS = {
+        1: ('amount', p.UVarintType, 0),
+        2: ('addr', MoneroAccountPublicAddress, 0),
+        3: ('is_subaddress', p.BoolType, 0),
+        4: ('original', p.BytesType, 0),
+        5: ('is_integrated', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.UVarintType, 0),
-            2: ('addr', MoneroAccountPublicAddress, 0),
-            3: ('is_subaddress', p.BoolType, 0),
-            4: ('original', p.BytesType, 0),
-            5: ('is_integrated', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionFinalAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 518
+    MESSAGE_WIRE_TYPE = const(518)
+    __slots__ = ('cout_key', 'salt', 'rand_mult', 'tx_enc_keys',)
 
     def __init__(
         self,
@@ -24,11 +24,13 @@ class MoneroTransactionFinalAck(p.MessageType):
         self.rand_mult = rand_mult
         self.tx_enc_keys = tx_enc_keys
 
+    _FIELDS = {
+        1: ('cout_key', p.BytesType, 0),
+        2: ('salt', p.BytesType, 0),
+        3: ('rand_mult', p.BytesType, 0),
+        4: ('tx_enc_keys', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('cout_key', p.BytesType, 0),
-            2: ('salt', p.BytesType, 0),
-            3: ('rand_mult', p.BytesType, 0),
-            4: ('tx_enc_keys', p.BytesType, 0),
-        }
+        return cls._FIELDS
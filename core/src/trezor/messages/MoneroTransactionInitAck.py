@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroTransactionInitAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 502
+    MESSAGE_WIRE_TYPE = const(502)
+    __slots__ = ('hmacs', 'rsig_data',)
 
     def __init__(
         self,
@@ -22,9 +22,11 @@ class MoneroTransactionInitAck(p.MessageType):
         self.hmacs = hmacs if hmacs is not None else []
         self.rsig_data = rsig_data
 
+    _FIELDS = {
+        1: ('hmacs', p.BytesType, p.FLAG_REPEATED),
+        2: ('rsig_data', MoneroTransactionRsigData, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('hmacs', p.BytesType, p.FLAG_REPEATED),
-            2: ('rsig_data', MoneroTransactionRsigData, 0),
-        }
+        return cls._FIELDS
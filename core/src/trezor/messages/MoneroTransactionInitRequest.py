@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionData import MoneroTransactionData
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroTransactionInitRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 501
+    MESSAGE_WIRE_TYPE = const(501)
+    __slots__ = ('version', 'address_n', 'network_type', 'tsx_data',)
 
     def __init__(
         self,
@@ -26,11 +26,13 @@ class MoneroTransactionInitRequest(p.MessageType):
         self.network_type = network_type
         self.tsx_data = tsx_data
 
+    _FIELDS = {
+        1: ('version', p.UVarintType, 0),
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        3: ('network_type', p.UVarintType, 0),
+        4: ('tsx_data', MoneroTransactionData, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('network_type', p.UVarintType, 0),
-            4: ('tsx_data', MoneroTransactionData, 0),
-        }
+        return cls._FIELDS
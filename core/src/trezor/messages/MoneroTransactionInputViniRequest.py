@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionInputViniRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 507
+    MESSAGE_WIRE_TYPE = const(507)
+    __slots__ = ('src_entr', 'vini', 'vini_hmac', 'pseudo_out', 'pseudo_out_hmac',)
 
     def __init__(
         self,
@@ -28,12 +28,14 @@ class MoneroTransactionInputViniRequest(p.MessageType):
         self.pseudo_out = pseudo_out
         self.pseudo_out_hmac = pseudo_out_hmac
 
+    _FIELDS = {
+        1: ('src_entr', MoneroTransactionSourceEntry, 0),
+        2: ('vini', p.BytesType, 0),
+        3: ('vini_hmac', p.BytesType, 0),
+        4: ('pseudo_out', p.BytesType, 0),
+        5: ('pseudo_out_hmac', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-            2: ('vini', p.BytesType, 0),
-            3: ('vini_hmac', p.BytesType, 0),
-            4: ('pseudo_out', p.BytesType, 0),
-            5: ('pseudo_out_hmac', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroTransactionInputsPermutationRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 505
+    MESSAGE_WIRE_TYPE = const(505)
+    __slots__ = ('perm',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class MoneroTransactionInputsPermutationRequest(p.MessageType):
     ) -> None:
         self.perm = perm if perm is not None else []
 
+    _FIELDS = {
+        1: ('perm', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('perm', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
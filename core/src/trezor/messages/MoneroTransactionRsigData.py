@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroTransactionRsigData(p.MessageType):
+    __slots__ = ('rsig_type', 'offload_type', 'grouping', 'mask', 'rsig', 'rsig_parts', 'bp_version',)
 
     def __init__(
         self,
@@ -29,14 +27,16 @@ class MoneroTransactionRsigData(p.MessageType):
         self.rsig_parts = rsig_parts if rsig_parts is not None else []
         self.bp_version = bp_version
 
+    _FIELDS = {
+        1: ('rsig_type', p.UVarintType, 0),
+        2: ('offload_type', p.UVarintType, 0),
+        3: ('grouping', p.UVarintType, p.FLAG_REPEATED),
+        4: ('mask', p.BytesType, 0),
+        5: ('rsig', p.BytesType, 0),
+        6: ('rsig_parts', p.BytesType, p.FLAG_REPEATED),
+        7: ('bp_version', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('rsig_type', p.UVarintType, 0),
-            2: ('offload_type', p.UVarintType, 0),
-            3: ('grouping', p.UVarintType, p.FLAG_REPEATED),
-            4: ('mask', p.BytesType, 0),
-            5: ('rsig', p.BytesType, 0),
-            6: ('rsig_parts', p.BytesType, p.FLAG_REPEATED),
-            7: ('bp_version', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionSetInputAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 504
+    MESSAGE_WIRE_TYPE = const(504)
+    __slots__ = ('vini', 'vini_hmac', 'pseudo_out', 'pseudo_out_hmac', 'pseudo_out_alpha', 'spend_key',)
 
     def __init__(
         self,
@@ -28,13 +28,15 @@ class MoneroTransactionSetInputAck(p.MessageType):
         self.pseudo_out_alpha = pseudo_out_alpha
         self.spend_key = spend_key
 
+    _FIELDS = {
+        1: ('vini', p.BytesType, 0),
+        2: ('vini_hmac', p.BytesType, 0),
+        3: ('pseudo_out', p.BytesType, 0),
+        4: ('pseudo_out_hmac', p.BytesType, 0),
+        5: ('pseudo_out_alpha', p.BytesType, 0),
+        6: ('spend_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('vini', p.BytesType, 0),
-            2: ('vini_hmac', p.BytesType, 0),
-            3: ('pseudo_out', p.BytesType, 0),
-            4: ('pseudo_out_hmac', p.BytesType, 0),
-            5: ('pseudo_out_alpha', p.BytesType, 0),
-            6: ('spend_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
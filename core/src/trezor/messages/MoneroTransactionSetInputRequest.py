@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionSetInputRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 503
+    MESSAGE_WIRE_TYPE = const(503)
+    __slots__ = ('src_entr',)
 
     def __init__(
         self,
@@ -20,8 +20,10 @@ class MoneroTransactionSetInputRequest(p.MessageType):
     ) -> None:
         self.src_entr = src_entr
 
+    _FIELDS = {
+        1: ('src_entr', MoneroTransactionSourceEntry, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-        }
+        return cls._FIELDS
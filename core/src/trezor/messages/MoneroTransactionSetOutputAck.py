@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionSetOutputAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 512
+    MESSAGE_WIRE_TYPE = const(512)
+    __slots__ = ('tx_out', 'vouti_hmac', 'rsig_data', 'out_pk', 'ecdh_info',)
 
     def __init__(
         self,
@@ -28,12 +28,14 @@ class MoneroTransactionSetOutputAck(p.MessageType):
         self.out_pk = out_pk
         self.ecdh_info = ecdh_info
 
+    _FIELDS = {
+        1: ('tx_out', p.BytesType, 0),
+        2: ('vouti_hmac', p.BytesType, 0),
+        3: ('rsig_data', MoneroTransactionRsigData, 0),
+        4: ('out_pk', p.BytesType, 0),
+        5: ('ecdh_info', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tx_out', p.BytesType, 0),
-            2: ('vouti_hmac', p.BytesType, 0),
-            3: ('rsig_data', MoneroTransactionRsigData, 0),
-            4: ('out_pk', p.BytesType, 0),
-            5: ('ecdh_info', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,19 +1,19 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
 from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionSetOutputRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 511
+    MESSAGE_WIRE_TYPE = const(511)
+    __slots__ = ('dst_entr', 'dst_entr_hmac', 'rsig_data', 'is_offloaded_bp',)
 
     def __init__(
         self,
@@ -27,11 +27,13 @@ class MoneroTransactionSetOutputRequest(p.MessageType):
         self.rsig_data = rsig_data
         self.is_offloaded_bp = is_offloaded_bp
 
+    _FIELDS = {
+        1: ('dst_entr', MoneroTransactionDestinationEntry, 0),
+        2: ('dst_entr_hmac', p.BytesType, 0),
+        3: ('rsig_data', MoneroTransactionRsigData, 0),
+        4: ('is_offloaded_bp', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('dst_entr', MoneroTransactionDestinationEntry, 0),
-            2: ('dst_entr_hmac', p.BytesType, 0),
-            3: ('rsig_data', MoneroTransactionRsigData, 0),
-            4: ('is_offloaded_bp', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionSignInputAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 516
+    MESSAGE_WIRE_TYPE = const(516)
+    __slots__ = ('signature', 'pseudo_out',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class MoneroTransactionSignInputAck(p.MessageType):
         self.signature = signature
         self.pseudo_out = pseudo_out
 
+    _FIELDS = {
+        1: ('signature', p.BytesType, 0),
+        2: ('pseudo_out', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('pseudo_out', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroTransactionSignInputRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 515
+    MESSAGE_WIRE_TYPE = const(515)
+    __slots__ = ('src_entr', 'vini', 'vini_hmac', 'pseudo_out', 'pseudo_out_hmac', 'pseudo_out_alpha', 'spend_key',)
 
     def __init__(
         self,
@@ -32,14 +32,16 @@ class MoneroTransactionSignInputRequest(p.MessageType):
         self.pseudo_out_alpha = pseudo_out_alpha
         self.spend_key = spend_key
 
+    _FIELDS = {
+        1: ('src_entr', MoneroTransactionSourceEntry, 0),
+        2: ('vini', p.BytesType, 0),
+        3: ('vini_hmac', p.BytesType, 0),
+        4: ('pseudo_out', p.BytesType, 0),
+        5: ('pseudo_out_hmac', p.BytesType, 0),
+        6: ('pseudo_out_alpha', p.BytesType, 0),
+        7: ('spend_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-            2: ('vini', p.BytesType, 0),
-            3: ('vini_hmac', p.BytesType, 0),
-            4: ('pseudo_out', p.BytesType, 0),
-            5: ('pseudo_out_hmac', p.BytesType, 0),
-            6: ('pseudo_out_alpha', p.BytesType, 0),
-            7: ('spend_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
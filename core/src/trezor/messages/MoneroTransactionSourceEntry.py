@@ -5,14 +5,12 @@ import protobuf as p
 from .MoneroMultisigKLRki import MoneroMultisigKLRki
 from .MoneroOutputEntry import MoneroOutputEntry
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroTransactionSourceEntry(p.MessageType):
+    __slots__ = ('outputs', 'real_output', 'real_out_tx_key', 'real_out_additional_tx_keys', 'real_output_in_tx_index', 'amount', 'rct', 'mask', 'multisig_kLRki',)
 
     def __init__(
         self,
@@ -36,16 +34,18 @@ class MoneroTransactionSourceEntry(p.MessageType):
         self.mask = mask
         self.multisig_kLRki = multisig_kLRki
 
+    _FIELDS = {
+        1: ('outputs', MoneroOutputEntry, p.FLAG_REPEATED),
+        2: ('real_output', p.UVarintType, 0),
+        3: ('real_out_tx_key', p.BytesType, 0),
+        4: ('real_out_additional_tx_keys', p.BytesType, p.FLAG_REPEATED),
+        5: ('real_output_in_tx_index', p.UVarintType, 0),
+        6: ('amount', p.UVarintType, 0),
+        7: ('rct', p.BoolType, 0),
+        8: ('mask', p.BytesType, 0),
+        9: ('multisig_kLRki', MoneroMultisigKLRki, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('outputs', MoneroOutputEntry, p.FLAG_REPEATED),
-            2: ('real_output', p.UVarintType, 0),
-            3: ('real_out_tx_key', p.BytesType, 0),
-            4: ('real_out_additional_tx_keys', p.BytesType, p.FLAG_REPEATED),
-            5: ('real_output_in_tx_index', p.UVarintType, 0),
-            6: ('amount', p.UVarintType, 0),
-            7: ('rct', p.BoolType, 0),
-            8: ('mask', p.BytesType, 0),
-            9: ('multisig_kLRki', MoneroMultisigKLRki, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MoneroTransferDetails(p.MessageType):
+    __slots__ = ('out_key', 'tx_pub_key', 'additional_tx_pub_keys', 'internal_output_index',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class MoneroTransferDetails(p.MessageType):
         self.additional_tx_pub_keys = additional_tx_pub_keys if additional_tx_pub_keys is not None else []
         self.internal_output_index = internal_output_index
 
+    _FIELDS = {
+        1: ('out_key', p.BytesType, 0),
+        2: ('tx_pub_key', p.BytesType, 0),
+        3: ('additional_tx_pub_keys', p.BytesType, p.FLAG_REPEATED),
+        4: ('internal_output_index', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('out_key', p.BytesType, 0),
-            2: ('tx_pub_key', p.BytesType, 0),
-            3: ('additional_tx_pub_keys', p.BytesType, p.FLAG_REPEATED),
-            4: ('internal_output_index', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class MoneroWatchKey(p.MessageType):
-    MESSAGE_WIRE_TYPE = 543
+    MESSAGE_WIRE_TYPE = const(543)
+    __slots__ = ('watch_key', 'address',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class MoneroWatchKey(p.MessageType):
         self.watch_key = watch_key
         self.address = address
 
+    _FIELDS = {
+        1: ('watch_key', p.BytesType, 0),
+        2: ('address', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('watch_key', p.BytesType, 0),
-            2: ('address', p.BytesType, 0),
-        }
+        return cls._FIELDS
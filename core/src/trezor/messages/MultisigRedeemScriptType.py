@@ -5,14 +5,12 @@ import protobuf as p
 from .HDNodePathType import HDNodePathType
 from .HDNodeType import HDNodeType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class MultisigRedeemScriptType(p.MessageType):
+    __slots__ = ('pubkeys', 'signatures', 'm', 'nodes', 'address_n',)
 
     def __init__(
         self,
@@ -28,12 +26,14 @@ class MultisigRedeemScriptType(p.MessageType):
         self.nodes = nodes if nodes is not None else []
         self.address_n = address_n if address_n is not None else []
 
+    _FIELDS = {
+        1: ('pubkeys', HDNodePathType, p.FLAG_REPEATED),
+        2: ('signatures', p.BytesType, p.FLAG_REPEATED),
+        3: ('m', p.UVarintType, 0),
+        4: ('nodes', HDNodeType, p.FLAG_REPEATED),
+        5: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('pubkeys', HDNodePathType, p.FLAG_REPEATED),
-            2: ('signatures', p.BytesType, p.FLAG_REPEATED),
-            3: ('m', p.UVarintType, 0),
-            4: ('nodes', HDNodeType, p.FLAG_REPEATED),
-            5: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
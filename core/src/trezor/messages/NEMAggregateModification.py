@@ -4,14 +4,12 @@ import protobuf as p
 
 from .NEMCosignatoryModification import NEMCosignatoryModification
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class NEMAggregateModification(p.MessageType):
+    __slots__ = ('modifications', 'relative_change',)
 
     def __init__(
         self,
@@ -21,9 +19,11 @@ class NEMAggregateModification(p.MessageType):
         self.modifications = modifications if modifications is not None else []
         self.relative_change = relative_change
 
+    _FIELDS = {
+        1: ('modifications', NEMCosignatoryModification, p.FLAG_REPEATED),
+        2: ('relative_change', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('modifications', NEMCosignatoryModification, p.FLAG_REPEATED),
-            2: ('relative_change', p.SVarintType, 0),
-        }
+        return cls._FIELDS
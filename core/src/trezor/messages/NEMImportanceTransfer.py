@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class NEMImportanceTransfer(p.MessageType):
+    __slots__ = ('mode', 'public_key',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class NEMImportanceTransfer(p.MessageType):
         self.mode = mode
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('mode', p.UVarintType, 0),
+        2: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('mode', p.UVarintType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
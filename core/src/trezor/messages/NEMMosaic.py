@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class NEMMosaic(p.MessageType):
+    __slots__ = ('namespace', 'mosaic', 'quantity',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class NEMMosaic(p.MessageType):
         self.mosaic = mosaic
         self.quantity = quantity
 
+    _FIELDS = {
+        1: ('namespace', p.UnicodeType, 0),
+        2: ('mosaic', p.UnicodeType, 0),
+        3: ('quantity', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('mosaic', p.UnicodeType, 0),
-            3: ('quantity', p.UVarintType, 0),
-        }
+        return cls._FIELDS
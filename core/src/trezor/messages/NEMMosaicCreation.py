@@ -4,14 +4,12 @@ import protobuf as p
 
 from .NEMMosaicDefinition import NEMMosaicDefinition
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class NEMMosaicCreation(p.MessageType):
+    __slots__ = ('definition', 'sink', 'fee',)
 
     def __init__(
         self,
@@ -23,10 +21,12 @@ class NEMMosaicCreation(p.MessageType):
         self.sink = sink
         self.fee = fee
 
+    _FIELDS = {
+        1: ('definition', NEMMosaicDefinition, 0),
+        2: ('sink', p.UnicodeType, 0),
+        3: ('fee', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('definition', NEMMosaicDefinition, 0),
-            2: ('sink', p.UnicodeType, 0),
-            3: ('fee', p.UVarintType, 0),
-        }
+        return cls._FIELDS
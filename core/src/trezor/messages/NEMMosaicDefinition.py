@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class NEMMosaicDefinition(p.MessageType):
+    __slots__ = ('name', 'ticker', 'namespace', 'mosaic', 'divisibility', 'levy', 'fee', 'levy_address', 'levy_namespace', 'levy_mosaic', 'supply', 'mutable_supply', 'transferable', 'description', 'networks',)
 
     def __init__(
         self,
@@ -45,22 +43,24 @@ class NEMMosaicDefinition(p.MessageType):
         self.description = description
         self.networks = networks if networks is not None else []
 
+    _FIELDS = {
+        1: ('name', p.UnicodeType, 0),
+        2: ('ticker', p.UnicodeType, 0),
+        3: ('namespace', p.UnicodeType, 0),
+        4: ('mosaic', p.UnicodeType, 0),
+        5: ('divisibility', p.UVarintType, 0),
+        6: ('levy', p.UVarintType, 0),
+        7: ('fee', p.UVarintType, 0),
+        8: ('levy_address', p.UnicodeType, 0),
+        9: ('levy_namespace', p.UnicodeType, 0),
+        10: ('levy_mosaic', p.UnicodeType, 0),
+        11: ('supply', p.UVarintType, 0),
+        12: ('mutable_supply', p.BoolType, 0),
+        13: ('transferable', p.BoolType, 0),
+        14: ('description', p.UnicodeType, 0),
+        15: ('networks', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('name', p.UnicodeType, 0),
-            2: ('ticker', p.UnicodeType, 0),
-            3: ('namespace', p.UnicodeType, 0),
-            4: ('mosaic', p.UnicodeType, 0),
-            5: ('divisibility', p.UVarintType, 0),
-            6: ('levy', p.UVarintType, 0),
-            7: ('fee', p.UVarintType, 0),
-            8: ('levy_address', p.UnicodeType, 0),
-            9: ('levy_namespace', p.UnicodeType, 0),
-            10: ('levy_mosaic', p.UnicodeType, 0),
-            11: ('supply', p.UVarintType, 0),
-            12: ('mutable_supply', p.BoolType, 0),
-            13: ('transferable', p.BoolType, 0),
-            14: ('description', p.UnicodeType, 0),
-            15: ('networks', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
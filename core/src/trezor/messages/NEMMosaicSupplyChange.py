@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class NEMMosaicSupplyChange(p.MessageType):
+    __slots__ = ('namespace', 'mosaic', 'type', 'delta',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class NEMMosaicSupplyChange(p.MessageType):
         self.type = type
         self.delta = delta
 
+    _FIELDS = {
+        1: ('namespace', p.UnicodeType, 0),
+        2: ('mosaic', p.UnicodeType, 0),
+        3: ('type', p.UVarintType, 0),
+        4: ('delta', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('mosaic', p.UnicodeType, 0),
-            3: ('type', p.UVarintType, 0),
-            4: ('delta', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class NEMProvisionNamespace(p.MessageType):
+    __slots__ = ('namespace', 'parent', 'sink', 'fee',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class NEMProvisionNamespace(p.MessageType):
         self.sink = sink
         self.fee = fee
 
+    _FIELDS = {
+        1: ('namespace', p.UnicodeType, 0),
+        2: ('parent', p.UnicodeType, 0),
+        3: ('sink', p.UnicodeType, 0),
+        4: ('fee', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('parent', p.UnicodeType, 0),
-            3: ('sink', p.UnicodeType, 0),
-            4: ('fee', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,5 +1,7 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .NEMAggregateModification import NEMAggregateModification
@@ -10,15 +12,13 @@ from .NEMProvisionNamespace import NEMProvisionNamespace
 from .NEMTransactionCommon import NEMTransactionCommon
 from .NEMTransfer import NEMTransfer
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class NEMSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 69
+    MESSAGE_WIRE_TYPE = const(69)
+    __slots__ = ('transaction', 'multisig', 'transfer', 'cosigning', 'provision_namespace', 'mosaic_creation', 'supply_change', 'aggregate_modification', 'importance_transfer',)
 
     def __init__(
         self,
@@ -42,16 +42,18 @@ class NEMSignTx(p.MessageType):
         self.aggregate_modification = aggregate_modification
         self.importance_transfer = importance_transfer
 
+    _FIELDS = {
+        1: ('transaction', NEMTransactionCommon, 0),
+        2: ('multisig', NEMTransactionCommon, 0),
+        3: ('transfer', NEMTransfer, 0),
+        4: ('cosigning', p.BoolType, 0),
+        5: ('provision_namespace', NEMProvisionNamespace, 0),
+        6: ('mosaic_creation', NEMMosaicCreation, 0),
+        7: ('supply_change', NEMMosaicSupplyChange, 0),
+        8: ('aggregate_modification', NEMAggregateModification, 0),
+        9: ('importance_transfer', NEMImportanceTransfer, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('transaction', NEMTransactionCommon, 0),
-            2: ('multisig', NEMTransactionCommon, 0),
-            3: ('transfer', NEMTransfer, 0),
-            4: ('cosigning', p.BoolType, 0),
-            5: ('provision_namespace', NEMProvisionNamespace, 0),
-            6: ('mosaic_creation', NEMMosaicCreation, 0),
-            7: ('supply_change', NEMMosaicSupplyChange, 0),
-            8: ('aggregate_modification', NEMAggregateModification, 0),
-            9: ('importance_transfer', NEMImportanceTransfer, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class NEMSignedTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 70
+    MESSAGE_WIRE_TYPE = const(70)
+    __slots__ = ('data', 'signature',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class NEMSignedTx(p.MessageType):
         self.data = data
         self.signature = signature
 
+    _FIELDS = {
+        1: ('data', p.BytesType, 0),
+        2: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
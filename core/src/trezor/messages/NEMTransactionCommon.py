@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class NEMTransactionCommon(p.MessageType):
+    __slots__ = ('address_n', 'network', 'timestamp', 'fee', 'deadline', 'signer',)
 
     def __init__(
         self,
@@ -27,13 +25,15 @@ class NEMTransactionCommon(p.MessageType):
         self.deadline = deadline
         self.signer = signer
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network', p.UVarintType, 0),
+        3: ('timestamp', p.UVarintType, 0),
+        4: ('fee', p.UVarintType, 0),
+        5: ('deadline', p.UVarintType, 0),
+        6: ('signer', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network', p.UVarintType, 0),
-            3: ('timestamp', p.UVarintType, 0),
-            4: ('fee', p.UVarintType, 0),
-            5: ('deadline', p.UVarintType, 0),
-            6: ('signer', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class PassphraseAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 42
+    MESSAGE_WIRE_TYPE = const(42)
+    __slots__ = ('passphrase', 'state',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class PassphraseAck(p.MessageType):
         self.passphrase = passphrase
         self.state = state
 
+    _FIELDS = {
+        1: ('passphrase', p.UnicodeType, 0),
+        2: ('state', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('passphrase', p.UnicodeType, 0),
-            2: ('state', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class PassphraseRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 41
+    MESSAGE_WIRE_TYPE = const(41)
+    __slots__ = ('on_device',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class PassphraseRequest(p.MessageType):
     ) -> None:
         self.on_device = on_device
 
+    _FIELDS = {
+        1: ('on_device', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('on_device', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class PassphraseStateRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 77
+    MESSAGE_WIRE_TYPE = const(77)
+    __slots__ = ('state',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class PassphraseStateRequest(p.MessageType):
     ) -> None:
         self.state = state
 
+    _FIELDS = {
+        1: ('state', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('state', p.BytesType, 0),
-        }
+        return cls._FIELDS
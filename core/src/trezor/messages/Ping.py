@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class Ping(p.MessageType):
-    MESSAGE_WIRE_TYPE = 1
+    MESSAGE_WIRE_TYPE = const(1)
+    __slots__ = ('message', 'button_protection', 'pin_protection', 'passphrase_protection',)
 
     def __init__(
         self,
@@ -24,11 +24,13 @@ class Ping(p.MessageType):
         self.pin_protection = pin_protection
         self.passphrase_protection = passphrase_protection
 
+    _FIELDS = {
+        1: ('message', p.UnicodeType, 0),
+        2: ('button_protection', p.BoolType, 0),
+        3: ('pin_protection', p.BoolType, 0),
+        4: ('passphrase_protection', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('message', p.UnicodeType, 0),
-            2: ('button_protection', p.BoolType, 0),
-            3: ('pin_protection', p.BoolType, 0),
-            4: ('passphrase_protection', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class RecoveryDevice(p.MessageType):
-    MESSAGE_WIRE_TYPE = 45
+    MESSAGE_WIRE_TYPE = const(45)
+    __slots__ = ('word_count', 'passphrase_protection', 'pin_protection', 'language', 'label', 'enforce_wordlist', 'type', 'u2f_counter', 'dry_run',)
 
     def __init__(
         self,
@@ -34,16 +34,18 @@ class RecoveryDevice(p.MessageType):
         self.u2f_counter = u2f_counter
         self.dry_run = dry_run
 
+    _FIELDS = {
+        1: ('word_count', p.UVarintType, 0),
+        2: ('passphrase_protection', p.BoolType, 0),
+        3: ('pin_protection', p.BoolType, 0),
+        4: ('language', p.UnicodeType, 0),  # default=english
+        5: ('label', p.UnicodeType, 0),
+        6: ('enforce_wordlist', p.BoolType, 0),
+        8: ('type', p.UVarintType, 0),
+        9: ('u2f_counter', p.UVarintType, 0),
+        10: ('dry_run', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('word_count', p.UVarintType, 0),
-            2: ('passphrase_protection', p.BoolType, 0),
-            3: ('pin_protection', p.BoolType, 0),
-            4: ('language', p.UnicodeType, 0),  # default=english
-            5: ('label', p.UnicodeType, 0),
-            6: ('enforce_wordlist', p.BoolType, 0),
-            8: ('type', p.UVarintType, 0),
-            9: ('u2f_counter', p.UVarintType, 0),
-            10: ('dry_run', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class ResetDevice(p.MessageType):
-    MESSAGE_WIRE_TYPE = 14
+    MESSAGE_WIRE_TYPE = const(14)
+    __slots__ = ('display_random', 'strength', 'passphrase_protection', 'pin_protection', 'language', 'label', 'u2f_counter', 'skip_backup', 'no_backup', 'backup_type',)
 
     def __init__(
         self,
@@ -36,17 +36,19 @@ class ResetDevice(p.MessageType):
         self.no_backup = no_backup
         self.backup_type = backup_type
 
+    _FIELDS = {
+        1: ('display_random', p.BoolType, 0),
+        2: ('strength', p.UVarintType, 0),  # default=256
+        3: ('passphrase_protection', p.BoolType, 0),
+        4: ('pin_protection', p.BoolType, 0),
+        5: ('language', p.UnicodeType, 0),  # default=english
+        6: ('label', p.UnicodeType, 0),
+        7: ('u2f_counter', p.UVarintType, 0),
+        8: ('skip_backup', p.BoolType, 0),
+        9: ('no_backup', p.BoolType, 0),
+        10: ('backup_type', p.UVarintType, 0),  # default=ResetDeviceBackupType_Bip39
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('display_random', p.BoolType, 0),
-            2: ('strength', p.UVarintType, 0),  # default=256
-            3: ('passphrase_protection', p.BoolType, 0),
-            4: ('pin_protection', p.BoolType, 0),
-            5: ('language', p.UnicodeType, 0),  # default=english
-            6: ('label', p.UnicodeType, 0),
-            7: ('u2f_counter', p.UVarintType, 0),
-            8: ('skip_backup', p.BoolType, 0),
-            9: ('no_backup', p.BoolType, 0),
-            10: ('backup_type', p.UVarintType, 0),  # default=ResetDeviceBackupType_Bip39
-        }
+        return cls._FIELDS
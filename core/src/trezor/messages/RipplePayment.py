@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class RipplePayment(p.MessageType):
+    __slots__ = ('amount', 'destination', 'destination_tag',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class RipplePayment(p.MessageType):
         self.destination = destination
         self.destination_tag = destination_tag
 
+    _FIELDS = {
+        1: ('amount', p.UVarintType, 0),
+        2: ('destination', p.UnicodeType, 0),
+        3: ('destination_tag', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.UVarintType, 0),
-            2: ('destination', p.UnicodeType, 0),
-            3: ('destination_tag', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .RipplePayment import RipplePayment
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class RippleSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 402
+    MESSAGE_WIRE_TYPE = const(402)
+    __slots__ = ('address_n', 'fee', 'flags', 'sequence', 'last_ledger_sequence', 'payment',)
 
     def __init__(
         self,
@@ -30,13 +30,15 @@ class RippleSignTx(p.MessageType):
         self.last_ledger_sequence = last_ledger_sequence
         self.payment = payment
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('fee', p.UVarintType, 0),
+        3: ('flags', p.UVarintType, 0),
+        4: ('sequence', p.UVarintType, 0),
+        5: ('last_ledger_sequence', p.UVarintType, 0),
+        6: ('payment', RipplePayment, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('fee', p.UVarintType, 0),
-            3: ('flags', p.UVarintType, 0),
-            4: ('sequence', p.UVarintType, 0),
-            5: ('last_ledger_sequence', p.UVarintType, 0),
-            6: ('payment', RipplePayment, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class RippleSignedTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 403
+    MESSAGE_WIRE_TYPE = const(403)
+    __slots__ = ('signature', 'serialized_tx',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class RippleSignedTx(p.MessageType):
         self.signature = signature
         self.serialized_tx = serialized_tx
 
+    _FIELDS = {
+        1: ('signature', p.BytesType, 0),
+        2: ('serialized_tx', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('serialized_tx', p.BytesType, 0),
-        }
+        return cls._FIELDS
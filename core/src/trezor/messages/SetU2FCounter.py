@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class SetU2FCounter(p.MessageType):
-    MESSAGE_WIRE_TYPE = 63
+    MESSAGE_WIRE_TYPE = const(63)
+    __slots__ = ('u2f_counter',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class SetU2FCounter(p.MessageType):
     ) -> None:
         self.u2f_counter = u2f_counter
 
+    _FIELDS = {
+        1: ('u2f_counter', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('u2f_counter', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .IdentityType import IdentityType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class SignIdentity(p.MessageType):
-    MESSAGE_WIRE_TYPE = 53
+    MESSAGE_WIRE_TYPE = const(53)
+    __slots__ = ('identity', 'challenge_hidden', 'challenge_visual', 'ecdsa_curve_name',)
 
     def __init__(
         self,
@@ -26,11 +26,13 @@ class SignIdentity(p.MessageType):
         self.challenge_visual = challenge_visual
         self.ecdsa_curve_name = ecdsa_curve_name
 
+    _FIELDS = {
+        1: ('identity', IdentityType, 0),
+        2: ('challenge_hidden', p.BytesType, 0),
+        3: ('challenge_visual', p.UnicodeType, 0),
+        4: ('ecdsa_curve_name', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('identity', IdentityType, 0),
-            2: ('challenge_hidden', p.BytesType, 0),
-            3: ('challenge_visual', p.UnicodeType, 0),
-            4: ('ecdsa_curve_name', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class SignMessage(p.MessageType):
-    MESSAGE_WIRE_TYPE = 38
+    MESSAGE_WIRE_TYPE = const(38)
+    __slots__ = ('address_n', 'message', 'coin_name', 'script_type',)
 
     def __init__(
         self,
@@ -24,11 +24,13 @@ class SignMessage(p.MessageType):
         self.coin_name = coin_name
         self.script_type = script_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('message', p.BytesType, 0),  # required
+        3: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+        4: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('message', p.BytesType, 0),  # required
-            3: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            4: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarAccountMergeOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 218
+    MESSAGE_WIRE_TYPE = const(218)
+    __slots__ = ('source_account', 'destination_account',)
 
     def __init__(
         self,
@@ -20,9 +20,11 @@ class StellarAccountMergeOp(p.MessageType):
         self.source_account = source_account
         self.destination_account = destination_account
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('destination_account', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('destination_account', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
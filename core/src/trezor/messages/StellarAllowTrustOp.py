@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarAllowTrustOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 217
+    MESSAGE_WIRE_TYPE = const(217)
+    __slots__ = ('source_account', 'trusted_account', 'asset_type', 'asset_code', 'is_authorized',)
 
     def __init__(
         self,
@@ -26,12 +26,14 @@ class StellarAllowTrustOp(p.MessageType):
         self.asset_code = asset_code
         self.is_authorized = is_authorized
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('trusted_account', p.UnicodeType, 0),
+        3: ('asset_type', p.UVarintType, 0),
+        4: ('asset_code', p.UnicodeType, 0),
+        5: ('is_authorized', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('trusted_account', p.UnicodeType, 0),
-            3: ('asset_type', p.UVarintType, 0),
-            4: ('asset_code', p.UnicodeType, 0),
-            5: ('is_authorized', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarAssetType(p.MessageType):
+    __slots__ = ('type', 'code', 'issuer',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class StellarAssetType(p.MessageType):
         self.code = code
         self.issuer = issuer
 
+    _FIELDS = {
+        1: ('type', p.UVarintType, 0),
+        2: ('code', p.UnicodeType, 0),
+        3: ('issuer', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('code', p.UnicodeType, 0),
-            3: ('issuer', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
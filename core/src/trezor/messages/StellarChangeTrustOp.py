@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .StellarAssetType import StellarAssetType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarChangeTrustOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 216
+    MESSAGE_WIRE_TYPE = const(216)
+    __slots__ = ('source_account', 'asset', 'limit',)
 
     def __init__(
         self,
@@ -24,10 +24,12 @@ class StellarChangeTrustOp(p.MessageType):
         self.asset = asset
         self.limit = limit
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('asset', StellarAssetType, 0),
+        3: ('limit', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('asset', StellarAssetType, 0),
-            3: ('limit', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarCreateAccountOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 210
+    MESSAGE_WIRE_TYPE = const(210)
+    __slots__ = ('source_account', 'new_account', 'starting_balance',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class StellarCreateAccountOp(p.MessageType):
         self.new_account = new_account
         self.starting_balance = starting_balance
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('new_account', p.UnicodeType, 0),
+        3: ('starting_balance', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('new_account', p.UnicodeType, 0),
-            3: ('starting_balance', p.SVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .StellarAssetType import StellarAssetType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarCreatePassiveOfferOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 214
+    MESSAGE_WIRE_TYPE = const(214)
+    __slots__ = ('source_account', 'selling_asset', 'buying_asset', 'amount', 'price_n', 'price_d',)
 
     def __init__(
         self,
@@ -30,13 +30,15 @@ class StellarCreatePassiveOfferOp(p.MessageType):
         self.price_n = price_n
         self.price_d = price_d
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('selling_asset', StellarAssetType, 0),
+        3: ('buying_asset', StellarAssetType, 0),
+        4: ('amount', p.SVarintType, 0),
+        5: ('price_n', p.UVarintType, 0),
+        6: ('price_d', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('selling_asset', StellarAssetType, 0),
-            3: ('buying_asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-            5: ('price_n', p.UVarintType, 0),
-            6: ('price_d', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarManageDataOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 220
+    MESSAGE_WIRE_TYPE = const(220)
+    __slots__ = ('source_account', 'key', 'value',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class StellarManageDataOp(p.MessageType):
         self.key = key
         self.value = value
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('key', p.UnicodeType, 0),
+        3: ('value', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('key', p.UnicodeType, 0),
-            3: ('value', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .StellarAssetType import StellarAssetType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarManageOfferOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 213
+    MESSAGE_WIRE_TYPE = const(213)
+    __slots__ = ('source_account', 'selling_asset', 'buying_asset', 'amount', 'price_n', 'price_d', 'offer_id',)
 
     def __init__(
         self,
@@ -32,14 +32,16 @@ class StellarManageOfferOp(p.MessageType):
         self.price_d = price_d
         self.offer_id = offer_id
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('selling_asset', StellarAssetType, 0),
+        3: ('buying_asset', StellarAssetType, 0),
+        4: ('amount', p.SVarintType, 0),
+        5: ('price_n', p.UVarintType, 0),
+        6: ('price_d', p.UVarintType, 0),
+        7: ('offer_id', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('selling_asset', StellarAssetType, 0),
-            3: ('buying_asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-            5: ('price_n', p.UVarintType, 0),
-            6: ('price_d', p.UVarintType, 0),
-            7: ('offer_id', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .StellarAssetType import StellarAssetType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class StellarPathPaymentOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 212
+    MESSAGE_WIRE_TYPE = const(212)
+    __slots__ = ('source_account', 'send_asset', 'send_max', 'destination_account', 'destination_asset', 'destination_amount', 'paths',)
 
     def __init__(
         self,
@@ -32,14 +32,16 @@ class StellarPathPaymentOp(p.MessageType):
         self.destination_amount = destination_amount
         self.paths = paths if paths is not None else []
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('send_asset', StellarAssetType, 0),
+        3: ('send_max', p.SVarintType, 0),
+        4: ('destination_account', p.UnicodeType, 0),
+        5: ('destination_asset', StellarAssetType, 0),
+        6: ('destination_amount', p.SVarintType, 0),
+        7: ('paths', StellarAssetType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('send_asset', StellarAssetType, 0),
-            3: ('send_max', p.SVarintType, 0),
-            4: ('destination_account', p.UnicodeType, 0),
-            5: ('destination_asset', StellarAssetType, 0),
-            6: ('destination_amount', p.SVarintType, 0),
-            7: ('paths', StellarAssetType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
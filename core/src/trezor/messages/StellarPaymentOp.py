@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .StellarAssetType import StellarAssetType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarPaymentOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 211
+    MESSAGE_WIRE_TYPE = const(211)
+    __slots__ = ('source_account', 'destination_account', 'asset', 'amount',)
 
     def __init__(
         self,
@@ -26,11 +26,13 @@ class StellarPaymentOp(p.MessageType):
         self.asset = asset
         self.amount = amount
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('destination_account', p.UnicodeType, 0),
+        3: ('asset', StellarAssetType, 0),
+        4: ('amount', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('destination_account', p.UnicodeType, 0),
-            3: ('asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-        }
+        return cls._FIELDS
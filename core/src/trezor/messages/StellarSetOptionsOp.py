@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class StellarSetOptionsOp(p.MessageType):
-    MESSAGE_WIRE_TYPE = 215
+    MESSAGE_WIRE_TYPE = const(215)
+    __slots__ = ('source_account', 'inflation_destination_account', 'clear_flags', 'set_flags', 'master_weight', 'low_threshold', 'medium_threshold', 'high_threshold', 'home_domain', 'signer_type', 'signer_key', 'signer_weight',)
 
     def __init__(
         self,
@@ -40,19 +40,21 @@ class StellarSetOptionsOp(p.MessageType):
         self.signer_key = signer_key
         self.signer_weight = signer_weight
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('inflation_destination_account', p.UnicodeType, 0),
+        3: ('clear_flags', p.UVarintType, 0),
+        4: ('set_flags', p.UVarintType, 0),
+        5: ('master_weight', p.UVarintType, 0),
+        6: ('low_threshold', p.UVarintType, 0),
+        7: ('medium_threshold', p.UVarintType, 0),
+        8: ('high_threshold', p.UVarintType, 0),
+        9: ('home_domain', p.UnicodeType, 0),
+        10: ('signer_type', p.UVarintType, 0),
+        11: ('signer_key', p.BytesType, 0),
+        12: ('signer_weight', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('inflation_destination_account', p.UnicodeType, 0),
-            3: ('clear_flags', p.UVarintType, 0),
-            4: ('set_flags', p.UVarintType, 0),
-            5: ('master_weight', p.UVarintType, 0),
-            6: ('low_threshold', p.UVarintType, 0),
-            7: ('medium_threshold', p.UVarintType, 0),
-            8: ('high_threshold', p.UVarintType, 0),
-            9: ('home_domain', p.UnicodeType, 0),
-            10: ('signer_type', p.UVarintType, 0),
-            11: ('signer_key', p.BytesType, 0),
-            12: ('signer_weight', p.UVarintType, 0),
-        }
+        return cls._FIELDS
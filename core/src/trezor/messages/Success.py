@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class Success(p.MessageType):
-    MESSAGE_WIRE_TYPE = 2
+    MESSAGE_WIRE_TYPE = const(2)
+    __slots__ = ('message',)
 
     def __init__(
         self,
@@ -18,8 +18,10 @@ class Success(p.MessageType):
     ) -> None:
         self.message = message
 
+    _FIELDS = {
+        1: ('message', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('message', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
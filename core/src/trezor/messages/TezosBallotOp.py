@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TezosBallotOp(p.MessageType):
+    __slots__ = ('source', 'period', 'proposal', 'ballot',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class TezosBallotOp(p.MessageType):
         self.proposal = proposal
         self.ballot = ballot
 
+    _FIELDS = {
+        1: ('source', p.BytesType, 0),
+        2: ('period', p.UVarintType, 0),
+        3: ('proposal', p.BytesType, 0),
+        4: ('ballot', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source', p.BytesType, 0),
-            2: ('period', p.UVarintType, 0),
-            3: ('proposal', p.BytesType, 0),
-            4: ('ballot', p.UVarintType, 0),
-        }
+        return cls._FIELDS
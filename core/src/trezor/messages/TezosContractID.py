@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TezosContractID(p.MessageType):
+    __slots__ = ('tag', 'hash',)
 
     def __init__(
         self,
@@ -19,9 +17,11 @@ class TezosContractID(p.MessageType):
         self.tag = tag
         self.hash = hash
 
+    _FIELDS = {
+        1: ('tag', p.UVarintType, 0),
+        2: ('hash', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tag', p.UVarintType, 0),
-            2: ('hash', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -4,14 +4,12 @@ import protobuf as p
 
 from .TezosContractID import TezosContractID
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TezosDelegationOp(p.MessageType):
+    __slots__ = ('source', 'fee', 'counter', 'gas_limit', 'storage_limit', 'delegate',)
 
     def __init__(
         self,
@@ -29,13 +27,15 @@ class TezosDelegationOp(p.MessageType):
         self.storage_limit = storage_limit
         self.delegate = delegate
 
+    _FIELDS = {
+        1: ('source', TezosContractID, 0),
+        2: ('fee', p.UVarintType, 0),
+        3: ('counter', p.UVarintType, 0),
+        4: ('gas_limit', p.UVarintType, 0),
+        5: ('storage_limit', p.UVarintType, 0),
+        6: ('delegate', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source', TezosContractID, 0),
-            2: ('fee', p.UVarintType, 0),
-            3: ('counter', p.UVarintType, 0),
-            4: ('gas_limit', p.UVarintType, 0),
-            5: ('storage_limit', p.UVarintType, 0),
-            6: ('delegate', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class TezosProposalOp(p.MessageType):
+    __slots__ = ('source', 'period', 'proposals',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class TezosProposalOp(p.MessageType):
         self.period = period
         self.proposals = proposals if proposals is not None else []
 
+    _FIELDS = {
+        1: ('source', p.BytesType, 0),
+        2: ('period', p.UVarintType, 0),
+        4: ('proposals', p.BytesType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source', p.BytesType, 0),
-            2: ('period', p.UVarintType, 0),
-            4: ('proposals', p.BytesType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -1,5 +1,7 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .TezosBallotOp import TezosBallotOp
@@ -9,15 +11,13 @@ from .TezosProposalOp import TezosProposalOp
 from .TezosRevealOp import TezosRevealOp
 from .TezosTransactionOp import TezosTransactionOp
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class TezosSignTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 152
+    MESSAGE_WIRE_TYPE = const(152)
+    __slots__ = ('address_n', 'branch', 'reveal', 'transaction', 'origination', 'delegation', 'proposal', 'ballot',)
 
     def __init__(
         self,
@@ -39,15 +39,17 @@ class TezosSignTx(p.MessageType):
         self.proposal = proposal
         self.ballot = ballot
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('branch', p.BytesType, 0),
+        3: ('reveal', TezosRevealOp, 0),
+        4: ('transaction', TezosTransactionOp, 0),
+        5: ('origination', TezosOriginationOp, 0),
+        6: ('delegation', TezosDelegationOp, 0),
+        7: ('proposal', TezosProposalOp, 0),
+        8: ('ballot', TezosBallotOp, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('branch', p.BytesType, 0),
-            3: ('reveal', TezosRevealOp, 0),
-            4: ('transaction', TezosTransactionOp, 0),
-            5: ('origination', TezosOriginationOp, 0),
-            6: ('delegation', TezosDelegationOp, 0),
-            7: ('proposal', TezosProposalOp, 0),
-            8: ('ballot', TezosBallotOp, 0),
-        }
+        return cls._FIELDS
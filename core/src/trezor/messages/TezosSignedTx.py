@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TezosSignedTx(p.MessageType):
-    MESSAGE_WIRE_TYPE = 153
+    MESSAGE_WIRE_TYPE = const(153)
+    __slots__ = ('signature', 'sig_op_contents', 'operation_hash',)
 
     def __init__(
         self,
@@ -22,10 +22,12 @@ class TezosSignedTx(p.MessageType):
         self.sig_op_contents = sig_op_contents
         self.operation_hash = operation_hash
 
+    _FIELDS = {
+        1: ('signature', p.UnicodeType, 0),
+        2: ('sig_op_contents', p.BytesType, 0),
+        3: ('operation_hash', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.UnicodeType, 0),
-            2: ('sig_op_contents', p.BytesType, 0),
-            3: ('operation_hash', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -6,14 +6,12 @@ from .TxInputType import TxInputType
 from .TxOutputBinType import TxOutputBinType
 from .TxOutputType import TxOutputType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class TransactionType(p.MessageType):
+    __slots__ = ('version', 'inputs', 'bin_outputs', 'lock_time', 'outputs', 'inputs_cnt', 'outputs_cnt', 'extra_data', 'extra_data_len', 'expiry', 'overwintered', 'version_group_id', 'timestamp', 'branch_id',)
 
     def __init__(
         self,
@@ -47,21 +45,23 @@ class TransactionType(p.MessageType):
         self.timestamp = timestamp
         self.branch_id = branch_id
 
+    _FIELDS = {
+        1: ('version', p.UVarintType, 0),
+        2: ('inputs', TxInputType, p.FLAG_REPEATED),
+        3: ('bin_outputs', TxOutputBinType, p.FLAG_REPEATED),
+        4: ('lock_time', p.UVarintType, 0),
+        5: ('outputs', TxOutputType, p.FLAG_REPEATED),
+        6: ('inputs_cnt', p.UVarintType, 0),
+        7: ('outputs_cnt', p.UVarintType, 0),
+        8: ('extra_data', p.BytesType, 0),
+        9: ('extra_data_len', p.UVarintType, 0),
+        10: ('expiry', p.UVarintType, 0),
+        11: ('overwintered', p.BoolType, 0),
+        12: ('version_group_id', p.UVarintType, 0),
+        13: ('timestamp', p.UVarintType, 0),
+        14: ('branch_id', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('inputs', TxInputType, p.FLAG_REPEATED),
-            3: ('bin_outputs', TxOutputBinType, p.FLAG_REPEATED),
-            4: ('lock_time', p.UVarintType, 0),
-            5: ('outputs', TxOutputType, p.FLAG_REPEATED),
-            6: ('inputs_cnt', p.UVarintType, 0),
-            7: ('outputs_cnt', p.UVarintType, 0),
-            8: ('extra_data', p.BytesType, 0),
-            9: ('extra_data_len', p.UVarintType, 0),
-            10: ('expiry', p.UVarintType, 0),
-            11: ('overwintered', p.BoolType, 0),
-            12: ('version_group_id', p.UVarintType, 0),
-            13: ('timestamp', p.UVarintType, 0),
-            14: ('branch_id', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -1,18 +1,18 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .TransactionType import TransactionType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TxAck(p.MessageType):
-    MESSAGE_WIRE_TYPE = 22
+    MESSAGE_WIRE_TYPE = const(22)
+    __slots__ = ('tx',)
 
     def __init__(
         self,
@@ -20,8 +20,10 @@ class TxAck(p.MessageType):
     ) -> None:
         self.tx = tx
 
+    _FIELDS = {
+        1: ('tx', TransactionType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tx', TransactionType, 0),
-        }
+        return cls._FIELDS
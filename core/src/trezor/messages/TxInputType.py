@@ -4,14 +4,12 @@ import protobuf as p
 
 from .MultisigRedeemScriptType import MultisigRedeemScriptType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class TxInputType(p.MessageType):
+    __slots__ = ('address_n', 'prev_hash', 'prev_index', 'script_sig', 'sequence', 'script_type', 'multisig', 'amount', 'decred_tree', 'decred_script_version', 'prev_block_hash_bip115', 'prev_block_height_bip115',)
 
     def __init__(
         self,
@@ -41,19 +39,21 @@ class TxInputType(p.MessageType):
         self.prev_block_hash_bip115 = prev_block_hash_bip115
         self.prev_block_height_bip115 = prev_block_height_bip115
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('prev_hash', p.BytesType, 0),  # required
+        3: ('prev_index', p.UVarintType, 0),  # required
+        4: ('script_sig', p.BytesType, 0),
+        5: ('sequence', p.UVarintType, 0),  # default=4294967295
+        6: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
+        7: ('multisig', MultisigRedeemScriptType, 0),
+        8: ('amount', p.UVarintType, 0),
+        9: ('decred_tree', p.UVarintType, 0),
+        10: ('decred_script_version', p.UVarintType, 0),
+        11: ('prev_block_hash_bip115', p.BytesType, 0),
+        12: ('prev_block_height_bip115', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('prev_hash', p.BytesType, 0),  # required
-            3: ('prev_index', p.UVarintType, 0),  # required
-            4: ('script_sig', p.BytesType, 0),
-            5: ('sequence', p.UVarintType, 0),  # default=4294967295
-            6: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-            7: ('multisig', MultisigRedeemScriptType, 0),
-            8: ('amount', p.UVarintType, 0),
-            9: ('decred_tree', p.UVarintType, 0),
-            10: ('decred_script_version', p.UVarintType, 0),
-            11: ('prev_block_hash_bip115', p.BytesType, 0),
-            12: ('prev_block_height_bip115', p.UVarintType, 0),
-        }
+        return cls._FIELDS
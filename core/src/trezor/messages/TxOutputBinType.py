@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TxOutputBinType(p.MessageType):
+    __slots__ = ('amount', 'script_pubkey', 'decred_script_version',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class TxOutputBinType(p.MessageType):
         self.script_pubkey = script_pubkey
         self.decred_script_version = decred_script_version
 
+    _FIELDS = {
+        1: ('amount', p.UVarintType, 0),  # required
+        2: ('script_pubkey', p.BytesType, 0),  # required
+        3: ('decred_script_version', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.UVarintType, 0),  # required
-            2: ('script_pubkey', p.BytesType, 0),  # required
-            3: ('decred_script_version', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -4,14 +4,12 @@ import protobuf as p
 
 from .MultisigRedeemScriptType import MultisigRedeemScriptType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict, List
 
 
 class TxOutputType(p.MessageType):
+    __slots__ = ('address', 'address_n', 'amount', 'script_type', 'multisig', 'op_return_data', 'decred_script_version', 'block_hash_bip115', 'block_height_bip115',)
 
     def __init__(
         self,
@@ -35,16 +33,18 @@ class TxOutputType(p.MessageType):
         self.block_hash_bip115 = block_hash_bip115
         self.block_height_bip115 = block_height_bip115
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        3: ('amount', p.UVarintType, 0),  # required
+        4: ('script_type', p.UVarintType, 0),  # required
+        5: ('multisig', MultisigRedeemScriptType, 0),
+        6: ('op_return_data', p.BytesType, 0),
+        7: ('decred_script_version', p.UVarintType, 0),
+        8: ('block_hash_bip115', p.BytesType, 0),
+        9: ('block_height_bip115', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('amount', p.UVarintType, 0),  # required
-            4: ('script_type', p.UVarintType, 0),  # required
-            5: ('multisig', MultisigRedeemScriptType, 0),
-            6: ('op_return_data', p.BytesType, 0),
-            7: ('decred_script_version', p.UVarintType, 0),
-            8: ('block_hash_bip115', p.BytesType, 0),
-            9: ('block_height_bip115', p.UVarintType, 0),
-        }
+        return cls._FIELDS
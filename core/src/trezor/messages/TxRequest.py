@@ -1,19 +1,19 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
 from .TxRequestDetailsType import TxRequestDetailsType
 from .TxRequestSerializedType import TxRequestSerializedType
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TxRequest(p.MessageType):
-    MESSAGE_WIRE_TYPE = 21
+    MESSAGE_WIRE_TYPE = const(21)
+    __slots__ = ('request_type', 'details', 'serialized',)
 
     def __init__(
         self,
@@ -25,10 +25,12 @@ class TxRequest(p.MessageType):
         self.details = details
         self.serialized = serialized
 
+    _FIELDS = {
+        1: ('request_type', p.UVarintType, 0),
+        2: ('details', TxRequestDetailsType, 0),
+        3: ('serialized', TxRequestSerializedType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('request_type', p.UVarintType, 0),
-            2: ('details', TxRequestDetailsType, 0),
-            3: ('serialized', TxRequestSerializedType, 0),
-        }
+        return cls._FIELDS
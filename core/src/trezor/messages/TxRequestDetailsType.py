@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TxRequestDetailsType(p.MessageType):
+    __slots__ = ('request_index', 'tx_hash', 'extra_data_len', 'extra_data_offset',)
 
     def __init__(
         self,
@@ -23,11 +21,13 @@ class TxRequestDetailsType(p.MessageType):
         self.extra_data_len = extra_data_len
         self.extra_data_offset = extra_data_offset
 
+    _FIELDS = {
+        1: ('request_index', p.UVarintType, 0),
+        2: ('tx_hash', p.BytesType, 0),
+        3: ('extra_data_len', p.UVarintType, 0),
+        4: ('extra_data_offset', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('request_index', p.UVarintType, 0),
-            2: ('tx_hash', p.BytesType, 0),
-            3: ('extra_data_len', p.UVarintType, 0),
-            4: ('extra_data_offset', p.UVarintType, 0),
-        }
+        return cls._FIELDS
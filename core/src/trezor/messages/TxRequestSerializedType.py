@@ -2,14 +2,12 @@
 # fmt: off
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class TxRequestSerializedType(p.MessageType):
+    __slots__ = ('signature_index', 'signature', 'serialized_tx',)
 
     def __init__(
         self,
@@ -21,10 +19,12 @@ class TxRequestSerializedType(p.MessageType):
         self.signature = signature
         self.serialized_tx = serialized_tx
 
+    _FIELDS = {
+        1: ('signature_index', p.UVarintType, 0),
+        2: ('signature', p.BytesType, 0),
+        3: ('serialized_tx', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature_index', p.UVarintType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('serialized_tx', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -1,16 +1,16 @@
 # Automatically generated by pb2py
 # fmt: off
+from micropython import const
+
 import protobuf as p
 
-if __debug__:
-    try:
-        from typing import Dict, List, Optional
-    except ImportError:
-        Dict, List, Optional = None, None, None  # type: ignore
+if False:
+    from typing import Dict
 
 
 class VerifyMessage(p.MessageType):
-    MESSAGE_WIRE_TYPE = 39
+    MESSAGE_WIRE_TYPE = const(39)
+    __slots__ = ('address', 'signature', 'message', 'coin_name',)
 
     def __init__(
         self,
@@ -24,11 +24,13 @@ class VerifyMessage(p.MessageType):
         self.message = message
         self.coin_name = coin_name
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('signature', p.BytesType, 0),
+        3: ('message', p.BytesType, 0),
+        4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-            4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-        }
+        return cls._FIELDS
@@ -0,0 +1,130 @@
+from common import *
+
+import utime
+
+from trezor import loop
+
+
+class TestTrezorLoop(unittest.TestCase):
+
+    # an interface no emulated hardware reports as ready, so a task paused
+    # on it only wakes up when another task closes it
+    FAKE_IFACE = 0xDE
+
+    def test_run_in_deadline_order(self):
+        trace = []
+
+        async def leaf(name):
+            trace.append(name)
+
+        loop.clear()
+        now = utime.ticks_us()
+        loop.schedule(leaf('second'), None, utime.ticks_add(now, 200))
+        loop.schedule(leaf('first'), None, utime.ticks_add(now, 100))
+        loop.run()
+        self.assertEqual(trace, ['first', 'second'])
+
+    def test_close_scheduled_sibling_from_stepped_task(self):
+        # a stepped task closing other tasks must not confuse the drain of
+        # due tasks in `run`: the victim is due at the same poll timeout as
+        # the killer, and the pauser blocks on I/O so that the timeout path
+        # with the drain loop is taken
+        trace = []
+
+        async def pauser():
+            try:
+                await loop.wait(self.FAKE_IFACE)
+            except GeneratorExit:
+                trace.append('cancelled')
+                raise
+
+        async def victim():
+            trace.append('victim')
+
+        async def killer(tasks):
+            for task in tasks:
+                loop.close(task)
+            trace.append('killer')
+
+        loop.clear()
+        paused_task = pauser()
+        victim_task = victim()
+        now = utime.ticks_us()
+        loop.schedule(paused_task, None, now)
+        killer_task = killer([victim_task, paused_task])
+        loop.schedule(killer_task, None, utime.ticks_add(now, 100))
+        loop.schedule(victim_task, None, utime.ticks_add(now, 200))
+        loop.run()
+        self.assertEqual(trace, ['cancelled', 'killer'])
+
+    def test_await_returns_sent_value(self):
+        # awaiting a syscall yields it into the scheduler once and evaluates
+        # to the value the scheduler sends back, here the sleep deadline.
+        # the same syscall instance can be awaited repeatedly
+        results = []
+
+        async def sleeper(delay):
+            results.append(await delay)
+            results.append(await delay)
+
+        loop.clear()
+        loop.schedule(sleeper(loop.sleep(100)))
+        loop.run()
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[1] != results[0])
+        for planned in results:
+            self.assertEqual(type(planned), int)
+
+    def test_reawait_reused_wait(self):
+        # each await of the same wait syscall gets a fresh awaiter, driven
+        # here the same way the scheduler drives it
+        touch = loop.wait(self.FAKE_IFACE)
+        for value in ('first', 'second'):
+            awaiter = touch.__iter__()
+            self.assertTrue(next(awaiter) is touch)
+            try:
+                awaiter.send(value)
+            except StopIteration as e:
+                self.assertEqual(e.value, value)
+            else:
+                self.fail('awaiter did not finish after send')
+
+    def test_throw_into_awaiting_task(self):
+        # an exception thrown into a task blocked on a syscall, the way the
+        # scheduler cancels tasks, propagates out of the await
+        async def reader():
+            try:
+                await loop.wait(self.FAKE_IFACE)
+            except ValueError:
+                return 'cancelled'
+
+        task = reader()
+        syscall = task.send(None)
+        self.assertEqual(type(syscall), loop.wait)
+        try:
+            task.throw(ValueError())
+        except StopIteration as e:
+            self.assertEqual(e.value, 'cancelled')
+        else:
+            self.fail('task did not finish after throw')
+
+    def test_spawn_with_bare_syscall_child(self):
+        # bare syscalls passed to spawn are scheduled through their awaiters.
+        # when the sleep child wins, the awaiter of the losing wait child is
+        # paused on I/O and gets closed as a task in its own right
+        results = []
+
+        async def parent():
+            winner = await loop.spawn(loop.wait(self.FAKE_IFACE),
+                                      loop.sleep(100))
+            results.append(winner)
+
+        loop.clear()
+        loop.schedule(parent())
+        loop.run()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(type(results[0]), int)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,8 +18,10 @@ class ApplyFlags(p.MessageType):
     ) -> None:
         self.flags = flags
 
+    _FIELDS = {
+        1: ('flags', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('flags', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -30,14 +30,16 @@ class ApplySettings(p.MessageType):
         self.auto_lock_delay_ms = auto_lock_delay_ms
         self.display_rotation = display_rotation
 
+    _FIELDS = {
+        1: ('language', p.UnicodeType, 0),
+        2: ('label', p.UnicodeType, 0),
+        3: ('use_passphrase', p.BoolType, 0),
+        4: ('homescreen', p.BytesType, 0),
+        5: ('passphrase_source', p.UVarintType, 0),
+        6: ('auto_lock_delay_ms', p.UVarintType, 0),
+        7: ('display_rotation', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('language', p.UnicodeType, 0),
-            2: ('label', p.UnicodeType, 0),
-            3: ('use_passphrase', p.BoolType, 0),
-            4: ('homescreen', p.BytesType, 0),
-            5: ('passphrase_source', p.UVarintType, 0),
-            6: ('auto_lock_delay_ms', p.UVarintType, 0),
-            7: ('display_rotation', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -22,10 +22,12 @@ class BinanceCancelMsg(p.MessageType):
         self.sender = sender
         self.symbol = symbol
 
+    _FIELDS = {
+        1: ('refid', p.UnicodeType, 0),
+        2: ('sender', p.UnicodeType, 0),
+        3: ('symbol', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('refid', p.UnicodeType, 0),
-            2: ('sender', p.UnicodeType, 0),
-            3: ('symbol', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class BinanceCoin(p.MessageType):
         self.amount = amount
         self.denom = denom
 
+    _FIELDS = {
+        1: ('amount', p.SVarintType, 0),
+        2: ('denom', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.SVarintType, 0),
-            2: ('denom', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
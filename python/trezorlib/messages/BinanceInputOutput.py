@@ -21,9 +21,11 @@ class BinanceInputOutput(p.MessageType):
         self.address = address
         self.coins = coins if coins is not None else []
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('coins', BinanceCoin, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('coins', BinanceCoin, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class BinancePublicKey(p.MessageType):
     ) -> None:
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
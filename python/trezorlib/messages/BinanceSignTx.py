@@ -30,14 +30,16 @@ class BinanceSignTx(p.MessageType):
         self.sequence = sequence
         self.source = source
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('msg_count', p.UVarintType, 0),
+        3: ('account_number', p.SVarintType, 0),
+        4: ('chain_id', p.UnicodeType, 0),
+        5: ('memo', p.UnicodeType, 0),
+        6: ('sequence', p.SVarintType, 0),
+        7: ('source', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('msg_count', p.UVarintType, 0),
-            3: ('account_number', p.SVarintType, 0),
-            4: ('chain_id', p.UnicodeType, 0),
-            5: ('memo', p.UnicodeType, 0),
-            6: ('sequence', p.SVarintType, 0),
-            7: ('source', p.SVarintType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class BinanceSignedTx(p.MessageType):
         self.signature = signature
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('signature', p.BytesType, 0),
+        2: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -22,9 +22,11 @@ class BinanceTransferMsg(p.MessageType):
         self.inputs = inputs if inputs is not None else []
         self.outputs = outputs if outputs is not None else []
 
+    _FIELDS = {
+        1: ('inputs', BinanceInputOutput, p.FLAG_REPEATED),
+        2: ('outputs', BinanceInputOutput, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('inputs', BinanceInputOutput, p.FLAG_REPEATED),
-            2: ('outputs', BinanceInputOutput, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
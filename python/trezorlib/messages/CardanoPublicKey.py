@@ -22,9 +22,11 @@ class CardanoPublicKey(p.MessageType):
         self.xpub = xpub
         self.node = node
 
+    _FIELDS = {
+        1: ('xpub', p.UnicodeType, 0),
+        2: ('node', HDNodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('xpub', p.UnicodeType, 0),
-            2: ('node', HDNodeType, 0),
-        }
+        return cls._FIELDS
@@ -27,11 +27,13 @@ class CardanoSignTx(p.MessageType):
         self.transactions_count = transactions_count
         self.protocol_magic = protocol_magic
 
+    _FIELDS = {
+        1: ('inputs', CardanoTxInputType, p.FLAG_REPEATED),
+        2: ('outputs', CardanoTxOutputType, p.FLAG_REPEATED),
+        3: ('transactions_count', p.UVarintType, 0),
+        5: ('protocol_magic', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('inputs', CardanoTxInputType, p.FLAG_REPEATED),
-            2: ('outputs', CardanoTxOutputType, p.FLAG_REPEATED),
-            3: ('transactions_count', p.UVarintType, 0),
-            5: ('protocol_magic', p.UVarintType, 0),
-        }
+        return cls._FIELDS
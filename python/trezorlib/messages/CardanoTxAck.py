@@ -18,8 +18,10 @@ class CardanoTxAck(p.MessageType):
     ) -> None:
         self.transaction = transaction
 
+    _FIELDS = {
+        1: ('transaction', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('transaction', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -23,11 +23,13 @@ class CardanoTxInputType(p.MessageType):
         self.prev_index = prev_index
         self.type = type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('prev_hash', p.BytesType, 0),
+        3: ('prev_index', p.UVarintType, 0),
+        4: ('type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('prev_hash', p.BytesType, 0),
-            3: ('prev_index', p.UVarintType, 0),
-            4: ('type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -21,10 +21,12 @@ class CardanoTxOutputType(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.amount = amount
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        3: ('amount', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('amount', p.UVarintType, 0),
-        }
+        return cls._FIELDS
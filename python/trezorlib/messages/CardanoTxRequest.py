@@ -22,10 +22,12 @@ class CardanoTxRequest(p.MessageType):
         self.tx_hash = tx_hash
         self.tx_body = tx_body
 
+    _FIELDS = {
+        1: ('tx_index', p.UVarintType, 0),
+        2: ('tx_hash', p.BytesType, 0),
+        3: ('tx_body', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tx_index', p.UVarintType, 0),
-            2: ('tx_hash', p.BytesType, 0),
-            3: ('tx_body', p.BytesType, 0),
-        }
+        return cls._FIELDS
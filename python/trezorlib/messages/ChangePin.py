@@ -18,8 +18,10 @@ class ChangePin(p.MessageType):
     ) -> None:
         self.remove = remove
 
+    _FIELDS = {
+        1: ('remove', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('remove', p.BoolType, 0),
-        }
+        return cls._FIELDS
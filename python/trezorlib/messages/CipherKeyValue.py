@@ -30,14 +30,16 @@ class CipherKeyValue(p.MessageType):
         self.ask_on_decrypt = ask_on_decrypt
         self.iv = iv
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('key', p.UnicodeType, 0),
+        3: ('value', p.BytesType, 0),
+        4: ('encrypt', p.BoolType, 0),
+        5: ('ask_on_encrypt', p.BoolType, 0),
+        6: ('ask_on_decrypt', p.BoolType, 0),
+        7: ('iv', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('key', p.UnicodeType, 0),
-            3: ('value', p.BytesType, 0),
-            4: ('encrypt', p.BoolType, 0),
-            5: ('ask_on_encrypt', p.BoolType, 0),
-            6: ('ask_on_decrypt', p.BoolType, 0),
-            7: ('iv', p.BytesType, 0),
-        }
+        return cls._FIELDS
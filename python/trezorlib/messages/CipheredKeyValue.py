@@ -18,8 +18,10 @@ class CipheredKeyValue(p.MessageType):
     ) -> None:
         self.value = value
 
+    _FIELDS = {
+        1: ('value', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('value', p.BytesType, 0),
-        }
+        return cls._FIELDS
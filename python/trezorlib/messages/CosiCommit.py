@@ -20,9 +20,11 @@ class CosiCommit(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.data = data
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('data', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('data', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class CosiCommitment(p.MessageType):
         self.commitment = commitment
         self.pubkey = pubkey
 
+    _FIELDS = {
+        1: ('commitment', p.BytesType, 0),
+        2: ('pubkey', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('commitment', p.BytesType, 0),
-            2: ('pubkey', p.BytesType, 0),
-        }
+        return cls._FIELDS
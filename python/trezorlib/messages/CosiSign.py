@@ -24,11 +24,13 @@ class CosiSign(p.MessageType):
         self.global_commitment = global_commitment
         self.global_pubkey = global_pubkey
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('data', p.BytesType, 0),
+        3: ('global_commitment', p.BytesType, 0),
+        4: ('global_pubkey', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('data', p.BytesType, 0),
-            3: ('global_commitment', p.BytesType, 0),
-            4: ('global_pubkey', p.BytesType, 0),
-        }
+        return cls._FIELDS
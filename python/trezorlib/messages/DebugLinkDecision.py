@@ -22,10 +22,12 @@ class DebugLinkDecision(p.MessageType):
         self.up_down = up_down
         self.input = input
 
+    _FIELDS = {
+        1: ('yes_no', p.BoolType, 0),
+        2: ('up_down', p.BoolType, 0),
+        3: ('input', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('yes_no', p.BoolType, 0),
-            2: ('up_down', p.BoolType, 0),
-            3: ('input', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
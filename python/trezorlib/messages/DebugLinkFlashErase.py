@@ -18,8 +18,10 @@ class DebugLinkFlashErase(p.MessageType):
     ) -> None:
         self.sector = sector
 
+    _FIELDS = {
+        1: ('sector', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('sector', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -22,10 +22,12 @@ class DebugLinkLog(p.MessageType):
         self.bucket = bucket
         self.text = text
 
+    _FIELDS = {
+        1: ('level', p.UVarintType, 0),
+        2: ('bucket', p.UnicodeType, 0),
+        3: ('text', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('level', p.UVarintType, 0),
-            2: ('bucket', p.UnicodeType, 0),
-            3: ('text', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class DebugLinkMemory(p.MessageType):
     ) -> None:
         self.memory = memory
 
+    _FIELDS = {
+        1: ('memory', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('memory', p.BytesType, 0),
-        }
+        return cls._FIELDS
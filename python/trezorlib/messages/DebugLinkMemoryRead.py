@@ -20,9 +20,11 @@ class DebugLinkMemoryRead(p.MessageType):
         self.address = address
         self.length = length
 
+    _FIELDS = {
+        1: ('address', p.UVarintType, 0),
+        2: ('length', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UVarintType, 0),
-            2: ('length', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -22,10 +22,12 @@ class DebugLinkMemoryWrite(p.MessageType):
         self.memory = memory
         self.flash = flash
 
+    _FIELDS = {
+        1: ('address', p.UVarintType, 0),
+        2: ('memory', p.BytesType, 0),
+        3: ('flash', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UVarintType, 0),
-            2: ('memory', p.BytesType, 0),
-            3: ('flash', p.BoolType, 0),
-        }
+        return cls._FIELDS
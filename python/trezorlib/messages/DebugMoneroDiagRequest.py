@@ -28,13 +28,15 @@ class DebugMoneroDiagRequest(p.MessageType):
         self.data1 = data1
         self.data2 = data2
 
+    _FIELDS = {
+        1: ('ins', p.UVarintType, 0),
+        2: ('p1', p.UVarintType, 0),
+        3: ('p2', p.UVarintType, 0),
+        4: ('pd', p.UVarintType, p.FLAG_REPEATED),
+        5: ('data1', p.BytesType, 0),
+        6: ('data2', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('ins', p.UVarintType, 0),
-            2: ('p1', p.UVarintType, 0),
-            3: ('p2', p.UVarintType, 0),
-            4: ('pd', p.UVarintType, p.FLAG_REPEATED),
-            5: ('data1', p.BytesType, 0),
-            6: ('data2', p.BytesType, 0),
-        }
+        return cls._FIELDS
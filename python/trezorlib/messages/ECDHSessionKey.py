@@ -18,8 +18,10 @@ class ECDHSessionKey(p.MessageType):
     ) -> None:
         self.session_key = session_key
 
+    _FIELDS = {
+        1: ('session_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('session_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
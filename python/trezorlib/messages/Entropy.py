@@ -18,8 +18,10 @@ class Entropy(p.MessageType):
     ) -> None:
         self.entropy = entropy
 
+    _FIELDS = {
+        1: ('entropy', p.BytesType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('entropy', p.BytesType, 0),  # required
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class EntropyAck(p.MessageType):
     ) -> None:
         self.entropy = entropy
 
+    _FIELDS = {
+        1: ('entropy', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('entropy', p.BytesType, 0),
-        }
+        return cls._FIELDS
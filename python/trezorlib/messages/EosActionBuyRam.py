@@ -23,10 +23,12 @@ class EosActionBuyRam(p.MessageType):
         self.receiver = receiver
         self.quantity = quantity
 
+    _FIELDS = {
+        1: ('payer', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('quantity', EosAsset, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('payer', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('quantity', EosAsset, 0),
-        }
+        return cls._FIELDS
@@ -21,10 +21,12 @@ class EosActionBuyRamBytes(p.MessageType):
         self.receiver = receiver
         self.bytes = bytes
 
+    _FIELDS = {
+        1: ('payer', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('bytes', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('payer', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('bytes', p.UVarintType, 0),
-        }
+        return cls._FIELDS
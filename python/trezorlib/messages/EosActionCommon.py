@@ -23,10 +23,12 @@ class EosActionCommon(p.MessageType):
         self.name = name
         self.authorization = authorization if authorization is not None else []
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('name', p.UVarintType, 0),
+        3: ('authorization', EosPermissionLevel, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('name', p.UVarintType, 0),
-            3: ('authorization', EosPermissionLevel, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -27,12 +27,14 @@ class EosActionDelegate(p.MessageType):
         self.cpu_quantity = cpu_quantity
         self.transfer = transfer
 
+    _FIELDS = {
+        1: ('sender', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('net_quantity', EosAsset, 0),
+        4: ('cpu_quantity', EosAsset, 0),
+        5: ('transfer', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('sender', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('net_quantity', EosAsset, 0),
-            4: ('cpu_quantity', EosAsset, 0),
-            5: ('transfer', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class EosActionDeleteAuth(p.MessageType):
         self.account = account
         self.permission = permission
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('permission', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('permission', p.UVarintType, 0),
-        }
+        return cls._FIELDS
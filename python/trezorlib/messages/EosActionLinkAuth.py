@@ -23,11 +23,13 @@ class EosActionLinkAuth(p.MessageType):
         self.type = type
         self.requirement = requirement
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('code', p.UVarintType, 0),
+        3: ('type', p.UVarintType, 0),
+        4: ('requirement', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('code', p.UVarintType, 0),
-            3: ('type', p.UVarintType, 0),
-            4: ('requirement', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -25,11 +25,13 @@ class EosActionNewAccount(p.MessageType):
         self.owner = owner
         self.active = active
 
+    _FIELDS = {
+        1: ('creator', p.UVarintType, 0),
+        2: ('name', p.UVarintType, 0),
+        3: ('owner', EosAuthorization, 0),
+        4: ('active', EosAuthorization, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('creator', p.UVarintType, 0),
-            2: ('name', p.UVarintType, 0),
-            3: ('owner', EosAuthorization, 0),
-            4: ('active', EosAuthorization, 0),
-        }
+        return cls._FIELDS
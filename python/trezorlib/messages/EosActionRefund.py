@@ -17,8 +17,10 @@ class EosActionRefund(p.MessageType):
     ) -> None:
         self.owner = owner
 
+    _FIELDS = {
+        1: ('owner', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('owner', p.UVarintType, 0),
-        }
+        return cls._FIELDS
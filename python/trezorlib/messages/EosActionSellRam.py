@@ -19,9 +19,11 @@ class EosActionSellRam(p.MessageType):
         self.account = account
         self.bytes = bytes
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('bytes', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('bytes', p.UVarintType, 0),
-        }
+        return cls._FIELDS
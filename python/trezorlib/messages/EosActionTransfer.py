@@ -25,11 +25,13 @@ class EosActionTransfer(p.MessageType):
         self.quantity = quantity
         self.memo = memo
 
+    _FIELDS = {
+        1: ('sender', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('quantity', EosAsset, 0),
+        4: ('memo', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('sender', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('quantity', EosAsset, 0),
-            4: ('memo', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
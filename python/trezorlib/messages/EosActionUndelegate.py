@@ -25,11 +25,13 @@ class EosActionUndelegate(p.MessageType):
         self.net_quantity = net_quantity
         self.cpu_quantity = cpu_quantity
 
+    _FIELDS = {
+        1: ('sender', p.UVarintType, 0),
+        2: ('receiver', p.UVarintType, 0),
+        3: ('net_quantity', EosAsset, 0),
+        4: ('cpu_quantity', EosAsset, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('sender', p.UVarintType, 0),
-            2: ('receiver', p.UVarintType, 0),
-            3: ('net_quantity', EosAsset, 0),
-            4: ('cpu_quantity', EosAsset, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class EosActionUnknown(p.MessageType):
         self.data_size = data_size
         self.data_chunk = data_chunk
 
+    _FIELDS = {
+        1: ('data_size', p.UVarintType, 0),
+        2: ('data_chunk', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data_size', p.UVarintType, 0),
-            2: ('data_chunk', p.BytesType, 0),
-        }
+        return cls._FIELDS
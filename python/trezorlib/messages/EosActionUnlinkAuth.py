@@ -21,10 +21,12 @@ class EosActionUnlinkAuth(p.MessageType):
         self.code = code
         self.type = type
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('code', p.UVarintType, 0),
+        3: ('type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('code', p.UVarintType, 0),
-            3: ('type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -25,11 +25,13 @@ class EosActionUpdateAuth(p.MessageType):
         self.parent = parent
         self.auth = auth
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('permission', p.UVarintType, 0),
+        3: ('parent', p.UVarintType, 0),
+        4: ('auth', EosAuthorization, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('permission', p.UVarintType, 0),
-            3: ('parent', p.UVarintType, 0),
-            4: ('auth', EosAuthorization, 0),
-        }
+        return cls._FIELDS
@@ -21,10 +21,12 @@ class EosActionVoteProducer(p.MessageType):
         self.proxy = proxy
         self.producers = producers if producers is not None else []
 
+    _FIELDS = {
+        1: ('voter', p.UVarintType, 0),
+        2: ('proxy', p.UVarintType, 0),
+        3: ('producers', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('voter', p.UVarintType, 0),
-            2: ('proxy', p.UVarintType, 0),
-            3: ('producers', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
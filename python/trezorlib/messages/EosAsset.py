@@ -19,9 +19,11 @@ class EosAsset(p.MessageType):
         self.amount = amount
         self.symbol = symbol
 
+    _FIELDS = {
+        1: ('amount', p.SVarintType, 0),
+        2: ('symbol', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.SVarintType, 0),
-            2: ('symbol', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -27,11 +27,13 @@ class EosAuthorization(p.MessageType):
         self.accounts = accounts if accounts is not None else []
         self.waits = waits if waits is not None else []
 
+    _FIELDS = {
+        1: ('threshold', p.UVarintType, 0),
+        2: ('keys', EosAuthorizationKey, p.FLAG_REPEATED),
+        3: ('accounts', EosAuthorizationAccount, p.FLAG_REPEATED),
+        4: ('waits', EosAuthorizationWait, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('threshold', p.UVarintType, 0),
-            2: ('keys', EosAuthorizationKey, p.FLAG_REPEATED),
-            3: ('accounts', EosAuthorizationAccount, p.FLAG_REPEATED),
-            4: ('waits', EosAuthorizationWait, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
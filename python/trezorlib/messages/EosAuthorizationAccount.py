@@ -21,9 +21,11 @@ class EosAuthorizationAccount(p.MessageType):
         self.account = account
         self.weight = weight
 
+    _FIELDS = {
+        1: ('account', EosPermissionLevel, 0),
+        2: ('weight', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', EosPermissionLevel, 0),
-            2: ('weight', p.UVarintType, 0),
-        }
+        return cls._FIELDS
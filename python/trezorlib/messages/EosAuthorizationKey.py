@@ -23,11 +23,13 @@ class EosAuthorizationKey(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.weight = weight
 
+    _FIELDS = {
+        1: ('type', p.UVarintType, 0),
+        2: ('key', p.BytesType, 0),
+        3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        4: ('weight', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('key', p.BytesType, 0),
-            3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            4: ('weight', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class EosAuthorizationWait(p.MessageType):
         self.wait_sec = wait_sec
         self.weight = weight
 
+    _FIELDS = {
+        1: ('wait_sec', p.UVarintType, 0),
+        2: ('weight', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('wait_sec', p.UVarintType, 0),
-            2: ('weight', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class EosPermissionLevel(p.MessageType):
         self.actor = actor
         self.permission = permission
 
+    _FIELDS = {
+        1: ('actor', p.UVarintType, 0),
+        2: ('permission', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('actor', p.UVarintType, 0),
-            2: ('permission', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class EosPublicKey(p.MessageType):
         self.wif_public_key = wif_public_key
         self.raw_public_key = raw_public_key
 
+    _FIELDS = {
+        1: ('wif_public_key', p.UnicodeType, 0),
+        2: ('raw_public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('wif_public_key', p.UnicodeType, 0),
-            2: ('raw_public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
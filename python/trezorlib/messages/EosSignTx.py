@@ -26,11 +26,13 @@ class EosSignTx(p.MessageType):
         self.header = header
         self.num_actions = num_actions
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('chain_id', p.BytesType, 0),
+        3: ('header', EosTxHeader, 0),
+        4: ('num_actions', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('chain_id', p.BytesType, 0),
-            3: ('header', EosTxHeader, 0),
-            4: ('num_actions', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class EosSignedTx(p.MessageType):
     ) -> None:
         self.signature = signature
 
+    _FIELDS = {
+        1: ('signature', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
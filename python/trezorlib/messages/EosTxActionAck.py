@@ -62,22 +62,24 @@ class EosTxActionAck(p.MessageType):
         self.new_account = new_account
         self.unknown = unknown
 
+    _FIELDS = {
+        1: ('common', EosActionCommon, 0),
+        2: ('transfer', EosActionTransfer, 0),
+        3: ('delegate', EosActionDelegate, 0),
+        4: ('undelegate', EosActionUndelegate, 0),
+        5: ('refund', EosActionRefund, 0),
+        6: ('buy_ram', EosActionBuyRam, 0),
+        7: ('buy_ram_bytes', EosActionBuyRamBytes, 0),
+        8: ('sell_ram', EosActionSellRam, 0),
+        9: ('vote_producer', EosActionVoteProducer, 0),
+        10: ('update_auth', EosActionUpdateAuth, 0),
+        11: ('delete_auth', EosActionDeleteAuth, 0),
+        12: ('link_auth', EosActionLinkAuth, 0),
+        13: ('unlink_auth', EosActionUnlinkAuth, 0),
+        14: ('new_account', EosActionNewAccount, 0),
+        15: ('unknown', EosActionUnknown, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('common', EosActionCommon, 0),
-            2: ('transfer', EosActionTransfer, 0),
-            3: ('delegate', EosActionDelegate, 0),
-            4: ('undelegate', EosActionUndelegate, 0),
-            5: ('refund', EosActionRefund, 0),
-            6: ('buy_ram', EosActionBuyRam, 0),
-            7: ('buy_ram_bytes', EosActionBuyRamBytes, 0),
-            8: ('sell_ram', EosActionSellRam, 0),
-            9: ('vote_producer', EosActionVoteProducer, 0),
-            10: ('update_auth', EosActionUpdateAuth, 0),
-            11: ('delete_auth', EosActionDeleteAuth, 0),
-            12: ('link_auth', EosActionLinkAuth, 0),
-            13: ('unlink_auth', EosActionUnlinkAuth, 0),
-            14: ('new_account', EosActionNewAccount, 0),
-            15: ('unknown', EosActionUnknown, 0),
-        }
+        return cls._FIELDS
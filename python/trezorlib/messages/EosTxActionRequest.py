@@ -18,8 +18,10 @@ class EosTxActionRequest(p.MessageType):
     ) -> None:
         self.data_size = data_size
 
+    _FIELDS = {
+        1: ('data_size', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data_size', p.UVarintType, 0),
-        }
+        return cls._FIELDS
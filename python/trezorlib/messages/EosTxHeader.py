@@ -27,13 +27,15 @@ class EosTxHeader(p.MessageType):
         self.max_cpu_usage_ms = max_cpu_usage_ms
         self.delay_sec = delay_sec
 
+    _FIELDS = {
+        1: ('expiration', p.UVarintType, 0),  # required
+        2: ('ref_block_num', p.UVarintType, 0),  # required
+        3: ('ref_block_prefix', p.UVarintType, 0),  # required
+        4: ('max_net_usage_words', p.UVarintType, 0),  # required
+        5: ('max_cpu_usage_ms', p.UVarintType, 0),  # required
+        6: ('delay_sec', p.UVarintType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('expiration', p.UVarintType, 0),  # required
-            2: ('ref_block_num', p.UVarintType, 0),  # required
-            3: ('ref_block_prefix', p.UVarintType, 0),  # required
-            4: ('max_net_usage_words', p.UVarintType, 0),  # required
-            5: ('max_cpu_usage_ms', p.UVarintType, 0),  # required
-            6: ('delay_sec', p.UVarintType, 0),  # required
-        }
+        return cls._FIELDS
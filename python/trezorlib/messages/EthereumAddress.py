@@ -20,9 +20,11 @@ class EthereumAddress(p.MessageType):
         self.old_address = old_address
         self.address = address
 
+    _FIELDS = {
+        1: ('old_address', p.BytesType, 0),
+        2: ('address', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('old_address', p.BytesType, 0),
-            2: ('address', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
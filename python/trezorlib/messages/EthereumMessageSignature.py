@@ -20,9 +20,11 @@ class EthereumMessageSignature(p.MessageType):
         self.signature = signature
         self.address = address
 
+    _FIELDS = {
+        2: ('signature', p.BytesType, 0),
+        3: ('address', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            2: ('signature', p.BytesType, 0),
-            3: ('address', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
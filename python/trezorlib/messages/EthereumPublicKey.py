@@ -22,9 +22,11 @@ class EthereumPublicKey(p.MessageType):
         self.node = node
         self.xpub = xpub
 
+    _FIELDS = {
+        1: ('node', HDNodeType, 0),
+        2: ('xpub', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('node', HDNodeType, 0),
-            2: ('xpub', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class EthereumSignMessage(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.message = message
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('message', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('message', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -36,17 +36,19 @@ class EthereumSignTx(p.MessageType):
         self.chain_id = chain_id
         self.tx_type = tx_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('nonce', p.BytesType, 0),
+        3: ('gas_price', p.BytesType, 0),
+        4: ('gas_limit', p.BytesType, 0),
+        11: ('to', p.UnicodeType, 0),
+        6: ('value', p.BytesType, 0),
+        7: ('data_initial_chunk', p.BytesType, 0),
+        8: ('data_length', p.UVarintType, 0),
+        9: ('chain_id', p.UVarintType, 0),
+        10: ('tx_type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('nonce', p.BytesType, 0),
-            3: ('gas_price', p.BytesType, 0),
-            4: ('gas_limit', p.BytesType, 0),
-            11: ('to', p.UnicodeType, 0),
-            6: ('value', p.BytesType, 0),
-            7: ('data_initial_chunk', p.BytesType, 0),
-            8: ('data_length', p.UVarintType, 0),
-            9: ('chain_id', p.UVarintType, 0),
-            10: ('tx_type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class EthereumTxAck(p.MessageType):
     ) -> None:
         self.data_chunk = data_chunk
 
+    _FIELDS = {
+        1: ('data_chunk', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data_chunk', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -24,11 +24,13 @@ class EthereumTxRequest(p.MessageType):
         self.signature_r = signature_r
         self.signature_s = signature_s
 
+    _FIELDS = {
+        1: ('data_length', p.UVarintType, 0),
+        2: ('signature_v', p.UVarintType, 0),
+        3: ('signature_r', p.BytesType, 0),
+        4: ('signature_s', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data_length', p.UVarintType, 0),
-            2: ('signature_v', p.UVarintType, 0),
-            3: ('signature_r', p.BytesType, 0),
-            4: ('signature_s', p.BytesType, 0),
-        }
+        return cls._FIELDS
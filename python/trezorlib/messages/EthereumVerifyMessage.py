@@ -22,10 +22,12 @@ class EthereumVerifyMessage(p.MessageType):
         self.message = message
         self.address = address
 
+    _FIELDS = {
+        2: ('signature', p.BytesType, 0),
+        3: ('message', p.BytesType, 0),
+        4: ('address', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-            4: ('address', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
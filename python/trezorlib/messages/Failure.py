@@ -20,9 +20,11 @@ class Failure(p.MessageType):
         self.code = code
         self.message = message
 
+    _FIELDS = {
+        1: ('code', p.UVarintType, 0),
+        2: ('message', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('code', p.UVarintType, 0),
-            2: ('message', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class FirmwareErase(p.MessageType):
     ) -> None:
         self.length = length
 
+    _FIELDS = {
+        1: ('length', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('length', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class FirmwareRequest(p.MessageType):
         self.offset = offset
         self.length = length
 
+    _FIELDS = {
+        1: ('offset', p.UVarintType, 0),
+        2: ('length', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('offset', p.UVarintType, 0),
-            2: ('length', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class FirmwareUpload(p.MessageType):
         self.payload = payload
         self.hash = hash
 
+    _FIELDS = {
+        1: ('payload', p.BytesType, 0),  # required
+        2: ('hash', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('payload', p.BytesType, 0),  # required
-            2: ('hash', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -28,12 +28,14 @@ class GetAddress(p.MessageType):
         self.multisig = multisig
         self.script_type = script_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+        3: ('show_display', p.BoolType, 0),
+        4: ('multisig', MultisigRedeemScriptType, 0),
+        5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            3: ('show_display', p.BoolType, 0),
-            4: ('multisig', MultisigRedeemScriptType, 0),
-            5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
+        return cls._FIELDS
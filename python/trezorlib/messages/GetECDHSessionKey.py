@@ -24,10 +24,12 @@ class GetECDHSessionKey(p.MessageType):
         self.peer_public_key = peer_public_key
         self.ecdsa_curve_name = ecdsa_curve_name
 
+    _FIELDS = {
+        1: ('identity', IdentityType, 0),
+        2: ('peer_public_key', p.BytesType, 0),
+        3: ('ecdsa_curve_name', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('identity', IdentityType, 0),
-            2: ('peer_public_key', p.BytesType, 0),
-            3: ('ecdsa_curve_name', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
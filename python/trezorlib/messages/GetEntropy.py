@@ -18,8 +18,10 @@ class GetEntropy(p.MessageType):
     ) -> None:
         self.size = size
 
+    _FIELDS = {
+        1: ('size', p.UVarintType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('size', p.UVarintType, 0),  # required
-        }
+        return cls._FIELDS
@@ -26,12 +26,14 @@ class GetPublicKey(p.MessageType):
         self.coin_name = coin_name
         self.script_type = script_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('ecdsa_curve_name', p.UnicodeType, 0),
+        3: ('show_display', p.BoolType, 0),
+        4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+        5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('ecdsa_curve_name', p.UnicodeType, 0),
-            3: ('show_display', p.BoolType, 0),
-            4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
+        return cls._FIELDS
@@ -21,9 +21,11 @@ class HDNodePathType(p.MessageType):
         self.node = node
         self.address_n = address_n if address_n is not None else []
 
+    _FIELDS = {
+        1: ('node', HDNodeType, 0),  # required
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('node', HDNodeType, 0),  # required
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class Initialize(p.MessageType):
         self.state = state
         self.skip_passphrase = skip_passphrase
 
+    _FIELDS = {
+        1: ('state', p.BytesType, 0),
+        2: ('skip_passphrase', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('state', p.BytesType, 0),
-            2: ('skip_passphrase', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -17,8 +17,10 @@ class LiskDelegateType(p.MessageType):
     ) -> None:
         self.username = username
 
+    _FIELDS = {
+        1: ('username', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('username', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class LiskMessageSignature(p.MessageType):
         self.public_key = public_key
         self.signature = signature
 
+    _FIELDS = {
+        1: ('public_key', p.BytesType, 0),
+        2: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('public_key', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
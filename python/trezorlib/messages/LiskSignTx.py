@@ -22,9 +22,11 @@ class LiskSignTx(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.transaction = transaction
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('transaction', LiskTransactionCommon, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('transaction', LiskTransactionCommon, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class LiskSignedTx(p.MessageType):
     ) -> None:
         self.signature = signature
 
+    _FIELDS = {
+        1: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -29,12 +29,14 @@ class LiskTransactionAsset(p.MessageType):
         self.multisignature = multisignature
         self.data = data
 
+    _FIELDS = {
+        1: ('signature', LiskSignatureType, 0),
+        2: ('delegate', LiskDelegateType, 0),
+        3: ('votes', p.UnicodeType, p.FLAG_REPEATED),
+        4: ('multisignature', LiskMultisignatureType, 0),
+        5: ('data', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', LiskSignatureType, 0),
-            2: ('delegate', LiskDelegateType, 0),
-            3: ('votes', p.UnicodeType, p.FLAG_REPEATED),
-            4: ('multisignature', LiskMultisignatureType, 0),
-            5: ('data', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -35,16 +35,18 @@ class LiskTransactionCommon(p.MessageType):
         self.timestamp = timestamp
         self.asset = asset
 
+    _FIELDS = {
+        1: ('type', p.UVarintType, 0),
+        2: ('amount', p.UVarintType, 0),  # default=0
+        3: ('fee', p.UVarintType, 0),
+        4: ('recipient_id', p.UnicodeType, 0),
+        5: ('sender_public_key', p.BytesType, 0),
+        6: ('requester_public_key', p.BytesType, 0),
+        7: ('signature', p.BytesType, 0),
+        8: ('timestamp', p.UVarintType, 0),
+        9: ('asset', LiskTransactionAsset, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('amount', p.UVarintType, 0),  # default=0
-            3: ('fee', p.UVarintType, 0),
-            4: ('recipient_id', p.UnicodeType, 0),
-            5: ('sender_public_key', p.BytesType, 0),
-            6: ('requester_public_key', p.BytesType, 0),
-            7: ('signature', p.BytesType, 0),
-            8: ('timestamp', p.UVarintType, 0),
-            9: ('asset', LiskTransactionAsset, 0),
-        }
+        return cls._FIELDS
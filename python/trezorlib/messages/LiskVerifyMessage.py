@@ -22,10 +22,12 @@ class LiskVerifyMessage(p.MessageType):
         self.signature = signature
         self.message = message
 
+    _FIELDS = {
+        1: ('public_key', p.BytesType, 0),
+        2: ('signature', p.BytesType, 0),
+        3: ('message', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('public_key', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -34,15 +34,17 @@ class LoadDevice(p.MessageType):
         self.skip_checksum = skip_checksum
         self.u2f_counter = u2f_counter
 
+    _FIELDS = {
+        1: ('mnemonics', p.UnicodeType, p.FLAG_REPEATED),
+        2: ('node', HDNodeType, 0),
+        3: ('pin', p.UnicodeType, 0),
+        4: ('passphrase_protection', p.BoolType, 0),
+        5: ('language', p.UnicodeType, 0),  # default=english
+        6: ('label', p.UnicodeType, 0),
+        7: ('skip_checksum', p.BoolType, 0),
+        8: ('u2f_counter', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('mnemonics', p.UnicodeType, p.FLAG_REPEATED),
-            2: ('node', HDNodeType, 0),
-            3: ('pin', p.UnicodeType, 0),
-            4: ('passphrase_protection', p.BoolType, 0),
-            5: ('language', p.UnicodeType, 0),  # default=english
-            6: ('label', p.UnicodeType, 0),
-            7: ('skip_checksum', p.BoolType, 0),
-            8: ('u2f_counter', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class MessageSignature(p.MessageType):
         self.address = address
         self.signature = signature
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class MoneroAccountPublicAddress(p.MessageType):
         self.spend_public_key = spend_public_key
         self.view_public_key = view_public_key
 
+    _FIELDS = {
+        1: ('spend_public_key', p.BytesType, 0),
+        2: ('view_public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('spend_public_key', p.BytesType, 0),
-            2: ('view_public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class MoneroAddress(p.MessageType):
     ) -> None:
         self.address = address
 
+    _FIELDS = {
+        1: ('address', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class MoneroExportedKeyImage(p.MessageType):
         self.iv = iv
         self.blob = blob
 
+    _FIELDS = {
+        1: ('iv', p.BytesType, 0),
+        3: ('blob', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('iv', p.BytesType, 0),
-            3: ('blob', p.BytesType, 0),
-        }
+        return cls._FIELDS
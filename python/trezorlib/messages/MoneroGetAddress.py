@@ -28,13 +28,15 @@ class MoneroGetAddress(p.MessageType):
         self.minor = minor
         self.payment_id = payment_id
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('show_display', p.BoolType, 0),
+        3: ('network_type', p.UVarintType, 0),
+        4: ('account', p.UVarintType, 0),
+        5: ('minor', p.UVarintType, 0),
+        6: ('payment_id', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('show_display', p.BoolType, 0),
-            3: ('network_type', p.UVarintType, 0),
-            4: ('account', p.UVarintType, 0),
-            5: ('minor', p.UVarintType, 0),
-            6: ('payment_id', p.BytesType, 0),
-        }
+        return cls._FIELDS
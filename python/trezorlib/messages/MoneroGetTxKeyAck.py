@@ -22,10 +22,12 @@ class MoneroGetTxKeyAck(p.MessageType):
         self.tx_keys = tx_keys
         self.tx_derivations = tx_derivations
 
+    _FIELDS = {
+        1: ('salt', p.BytesType, 0),
+        2: ('tx_keys', p.BytesType, 0),
+        3: ('tx_derivations', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('salt', p.BytesType, 0),
-            2: ('tx_keys', p.BytesType, 0),
-            3: ('tx_derivations', p.BytesType, 0),
-        }
+        return cls._FIELDS
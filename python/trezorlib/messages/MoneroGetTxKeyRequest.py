@@ -32,15 +32,17 @@ class MoneroGetTxKeyRequest(p.MessageType):
         self.reason = reason
         self.view_public_key = view_public_key
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network_type', p.UVarintType, 0),
+        3: ('salt1', p.BytesType, 0),
+        4: ('salt2', p.BytesType, 0),
+        5: ('tx_enc_keys', p.BytesType, 0),
+        6: ('tx_prefix_hash', p.BytesType, 0),
+        7: ('reason', p.UVarintType, 0),
+        8: ('view_public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network_type', p.UVarintType, 0),
-            3: ('salt1', p.BytesType, 0),
-            4: ('salt2', p.BytesType, 0),
-            5: ('tx_enc_keys', p.BytesType, 0),
-            6: ('tx_prefix_hash', p.BytesType, 0),
-            7: ('reason', p.UVarintType, 0),
-            8: ('view_public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -28,12 +28,14 @@ class MoneroKeyImageExportInitRequest(p.MessageType):
         self.network_type = network_type
         self.subs = subs if subs is not None else []
 
+    _FIELDS = {
+        1: ('num', p.UVarintType, 0),
+        2: ('hash', p.BytesType, 0),
+        3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        4: ('network_type', p.UVarintType, 0),
+        5: ('subs', MoneroSubAddressIndicesList, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('num', p.UVarintType, 0),
-            2: ('hash', p.BytesType, 0),
-            3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            4: ('network_type', p.UVarintType, 0),
-            5: ('subs', MoneroSubAddressIndicesList, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class MoneroKeyImageSyncFinalAck(p.MessageType):
     ) -> None:
         self.enc_key = enc_key
 
+    _FIELDS = {
+        1: ('enc_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('enc_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
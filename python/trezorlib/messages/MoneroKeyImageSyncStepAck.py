@@ -20,8 +20,10 @@ class MoneroKeyImageSyncStepAck(p.MessageType):
     ) -> None:
         self.kis = kis if kis is not None else []
 
+    _FIELDS = {
+        1: ('kis', MoneroExportedKeyImage, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('kis', MoneroExportedKeyImage, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -20,8 +20,10 @@ class MoneroKeyImageSyncStepRequest(p.MessageType):
     ) -> None:
         self.tdis = tdis if tdis is not None else []
 
+    _FIELDS = {
+        1: ('tdis', MoneroTransferDetails, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tdis', MoneroTransferDetails, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class MoneroLiveRefreshStartRequest(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.network_type = network_type
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network_type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network_type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
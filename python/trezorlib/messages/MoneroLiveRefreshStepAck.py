@@ -20,9 +20,11 @@ class MoneroLiveRefreshStepAck(p.MessageType):
         self.salt = salt
         self.key_image = key_image
 
+    _FIELDS = {
+        1: ('salt', p.BytesType, 0),
+        2: ('key_image', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('salt', p.BytesType, 0),
-            2: ('key_image', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -26,12 +26,14 @@ class MoneroLiveRefreshStepRequest(p.MessageType):
         self.sub_addr_major = sub_addr_major
         self.sub_addr_minor = sub_addr_minor
 
+    _FIELDS = {
+        1: ('out_key', p.BytesType, 0),
+        2: ('recv_deriv', p.BytesType, 0),
+        3: ('real_out_idx', p.UVarintType, 0),
+        4: ('sub_addr_major', p.UVarintType, 0),
+        5: ('sub_addr_minor', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('out_key', p.BytesType, 0),
-            2: ('recv_deriv', p.BytesType, 0),
-            3: ('real_out_idx', p.UVarintType, 0),
-            4: ('sub_addr_major', p.UVarintType, 0),
-            5: ('sub_addr_minor', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -23,11 +23,13 @@ class MoneroMultisigKLRki(p.MessageType):
         self.R = R
         self.ki = ki
 
+    _FIELDS = {
+        1: ('K', p.BytesType, 0),
+        2: ('L', p.BytesType, 0),
+        3: ('R', p.BytesType, 0),
+        4: ('ki', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('K', p.BytesType, 0),
-            2: ('L', p.BytesType, 0),
-            3: ('R', p.BytesType, 0),
-            4: ('ki', p.BytesType, 0),
-        }
+        return cls._FIELDS
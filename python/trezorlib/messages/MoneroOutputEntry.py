@@ -21,9 +21,11 @@ class MoneroOutputEntry(p.MessageType):
         self.idx = idx
         self.key = key
 
+    _FIELDS = {
+        1: ('idx', p.UVarintType, 0),
+        2: ('key', MoneroRctKeyPublic, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('idx', p.UVarintType, 0),
-            2: ('key', MoneroRctKeyPublic, 0),
-        }
+        return cls._FIELDS
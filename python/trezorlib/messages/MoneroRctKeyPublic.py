@@ -19,9 +19,11 @@ class MoneroRctKeyPublic(p.MessageType):
         self.dest = dest
         self.commitment = commitment
 
+    _FIELDS = {
+        1: ('dest', p.BytesType, 0),
+        2: ('commitment', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('dest', p.BytesType, 0),
-            2: ('commitment', p.BytesType, 0),
-        }
+        return cls._FIELDS
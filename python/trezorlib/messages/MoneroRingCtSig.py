@@ -21,10 +21,12 @@ class MoneroRingCtSig(p.MessageType):
         self.message = message
         self.rv_type = rv_type
 
+    _FIELDS = {
+        1: ('txn_fee', p.UVarintType, 0),
+        2: ('message', p.BytesType, 0),
+        3: ('rv_type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('txn_fee', p.UVarintType, 0),
-            2: ('message', p.BytesType, 0),
-            3: ('rv_type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
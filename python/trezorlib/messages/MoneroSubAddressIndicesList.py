@@ -19,9 +19,11 @@ class MoneroSubAddressIndicesList(p.MessageType):
         self.account = account
         self.minor_indices = minor_indices if minor_indices is not None else []
 
+    _FIELDS = {
+        1: ('account', p.UVarintType, 0),
+        2: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
@@ -20,8 +20,10 @@ class MoneroTransactionAllInputsSetAck(p.MessageType):
     ) -> None:
         self.rsig_data = rsig_data
 
+    _FIELDS = {
+        1: ('rsig_data', MoneroTransactionRsigData, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('rsig_data', MoneroTransactionRsigData, 0),
-        }
+        return cls._FIELDS
@@ -26,11 +26,13 @@ class MoneroTransactionAllOutSetAck(p.MessageType):
         self.rv = rv
         self.full_message_hash = full_message_hash
 
+    _FIELDS = {
+        1: ('extra', p.BytesType, 0),
+        2: ('tx_prefix_hash', p.BytesType, 0),
+        4: ('rv', MoneroRingCtSig, 0),
+        5: ('full_message_hash', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('extra', p.BytesType, 0),
-            2: ('tx_prefix_hash', p.BytesType, 0),
-            4: ('rv', MoneroRingCtSig, 0),
-            5: ('full_message_hash', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -48,22 +48,24 @@ class MoneroTransactionData(p.MessageType):
         self.hard_fork = hard_fork
         self.monero_version = monero_version
 
+    _FIELDS = {
+        1: ('version', p.UVarintType, 0),
+        2: ('payment_id', p.BytesType, 0),
+        3: ('unlock_time', p.UVarintType, 0),
+        4: ('outputs', MoneroTransactionDestinationEntry, p.FLAG_REPEATED),
+        5: ('change_dts', MoneroTransactionDestinationEntry, 0),
+        6: ('num_inputs', p.UVarintType, 0),
+        7: ('mixin', p.UVarintType, 0),
+        8: ('fee', p.UVarintType, 0),
+        9: ('account', p.UVarintType, 0),
+        10: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
+        11: ('rsig_data', MoneroTransactionRsigData, 0),
+        12: ('integrated_indices', p.UVarintType, p.FLAG_REPEATED),
+        13: ('client_version', p.UVarintType, 0),
+        14: ('hard_fork', p.UVarintType, 0),
+        15: ('monero_version', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('payment_id', p.BytesType, 0),
-            3: ('unlock_time', p.UVarintType, 0),
-            4: ('outputs', MoneroTransactionDestinationEntry, p.FLAG_REPEATED),
-            5: ('change_dts', MoneroTransactionDestinationEntry, 0),
-            6: ('num_inputs', p.UVarintType, 0),
-            7: ('mixin', p.UVarintType, 0),
-            8: ('fee', p.UVarintType, 0),
-            9: ('account', p.UVarintType, 0),
-            10: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
-            11: ('rsig_data', MoneroTransactionRsigData, 0),
-            12: ('integrated_indices', p.UVarintType, p.FLAG_REPEATED),
-            13: ('client_version', p.UVarintType, 0),
-            14: ('hard_fork', p.UVarintType, 0),
-            15: ('monero_version', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -27,12 +27,14 @@ class MoneroTransactionDestinationEntry(p.MessageType):
         self.original = original
         self.is_integrated = is_integrated
 
+    _FIELDS = {
+        1: ('amount', p.UVarintType, 0),
+        2: ('addr', MoneroAccountPublicAddress, 0),
+        3: ('is_subaddress', p.BoolType, 0),
+        4: ('original', p.BytesType, 0),
+        5: ('is_integrated', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.UVarintType, 0),
-            2: ('addr', MoneroAccountPublicAddress, 0),
-            3: ('is_subaddress', p.BoolType, 0),
-            4: ('original', p.BytesType, 0),
-            5: ('is_integrated', p.BoolType, 0),
-        }
+        return cls._FIELDS
@@ -24,11 +24,13 @@ class MoneroTransactionFinalAck(p.MessageType):
         self.rand_mult = rand_mult
         self.tx_enc_keys = tx_enc_keys
 
+    _FIELDS = {
+        1: ('cout_key', p.BytesType, 0),
+        2: ('salt', p.BytesType, 0),
+        3: ('rand_mult', p.BytesType, 0),
+        4: ('tx_enc_keys', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('cout_key', p.BytesType, 0),
-            2: ('salt', p.BytesType, 0),
-            3: ('rand_mult', p.BytesType, 0),
-            4: ('tx_enc_keys', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -22,9 +22,11 @@ class MoneroTransactionInitAck(p.MessageType):
         self.hmacs = hmacs if hmacs is not None else []
         self.rsig_data = rsig_data
 
+    _FIELDS = {
+        1: ('hmacs', p.BytesType, p.FLAG_REPEATED),
+        2: ('rsig_data', MoneroTransactionRsigData, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('hmacs', p.BytesType, p.FLAG_REPEATED),
-            2: ('rsig_data', MoneroTransactionRsigData, 0),
-        }
+        return cls._FIELDS
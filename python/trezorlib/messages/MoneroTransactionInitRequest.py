@@ -26,11 +26,13 @@ class MoneroTransactionInitRequest(p.MessageType):
         self.network_type = network_type
         self.tsx_data = tsx_data
 
+    _FIELDS = {
+        1: ('version', p.UVarintType, 0),
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        3: ('network_type', p.UVarintType, 0),
+        4: ('tsx_data', MoneroTransactionData, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('network_type', p.UVarintType, 0),
-            4: ('tsx_data', MoneroTransactionData, 0),
-        }
+        return cls._FIELDS
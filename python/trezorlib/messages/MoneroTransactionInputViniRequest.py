@@ -28,12 +28,14 @@ class MoneroTransactionInputViniRequest(p.MessageType):
         self.pseudo_out = pseudo_out
         self.pseudo_out_hmac = pseudo_out_hmac
 
+    _FIELDS = {
+        1: ('src_entr', MoneroTransactionSourceEntry, 0),
+        2: ('vini', p.BytesType, 0),
+        3: ('vini_hmac', p.BytesType, 0),
+        4: ('pseudo_out', p.BytesType, 0),
+        5: ('pseudo_out_hmac', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-            2: ('vini', p.BytesType, 0),
-            3: ('vini_hmac', p.BytesType, 0),
-            4: ('pseudo_out', p.BytesType, 0),
-            5: ('pseudo_out_hmac', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class MoneroTransactionInputsPermutationRequest(p.MessageType):
     ) -> None:
         self.perm = perm if perm is not None else []
 
+    _FIELDS = {
+        1: ('perm', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('perm', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
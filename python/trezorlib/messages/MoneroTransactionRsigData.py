@@ -29,14 +29,16 @@ class MoneroTransactionRsigData(p.MessageType):
         self.rsig_parts = rsig_parts if rsig_parts is not None else []
         self.bp_version = bp_version
 
+    _FIELDS = {
+        1: ('rsig_type', p.UVarintType, 0),
+        2: ('offload_type', p.UVarintType, 0),
+        3: ('grouping', p.UVarintType, p.FLAG_REPEATED),
+        4: ('mask', p.BytesType, 0),
+        5: ('rsig', p.BytesType, 0),
+        6: ('rsig_parts', p.BytesType, p.FLAG_REPEATED),
+        7: ('bp_version', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('rsig_type', p.UVarintType, 0),
-            2: ('offload_type', p.UVarintType, 0),
-            3: ('grouping', p.UVarintType, p.FLAG_REPEATED),
-            4: ('mask', p.BytesType, 0),
-            5: ('rsig', p.BytesType, 0),
-            6: ('rsig_parts', p.BytesType, p.FLAG_REPEATED),
-            7: ('bp_version', p.UVarintType, 0),
-        }
+        return cls._FIELDS
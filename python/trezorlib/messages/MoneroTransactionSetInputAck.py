@@ -28,13 +28,15 @@ class MoneroTransactionSetInputAck(p.MessageType):
         self.pseudo_out_alpha = pseudo_out_alpha
         self.spend_key = spend_key
 
+    _FIELDS = {
+        1: ('vini', p.BytesType, 0),
+        2: ('vini_hmac', p.BytesType, 0),
+        3: ('pseudo_out', p.BytesType, 0),
+        4: ('pseudo_out_hmac', p.BytesType, 0),
+        5: ('pseudo_out_alpha', p.BytesType, 0),
+        6: ('spend_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('vini', p.BytesType, 0),
-            2: ('vini_hmac', p.BytesType, 0),
-            3: ('pseudo_out', p.BytesType, 0),
-            4: ('pseudo_out_hmac', p.BytesType, 0),
-            5: ('pseudo_out_alpha', p.BytesType, 0),
-            6: ('spend_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
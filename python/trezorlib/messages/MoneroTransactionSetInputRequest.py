@@ -20,8 +20,10 @@ class MoneroTransactionSetInputRequest(p.MessageType):
     ) -> None:
         self.src_entr = src_entr
 
+    _FIELDS = {
+        1: ('src_entr', MoneroTransactionSourceEntry, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-        }
+        return cls._FIELDS
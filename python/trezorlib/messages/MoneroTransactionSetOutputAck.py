@@ -28,12 +28,14 @@ class MoneroTransactionSetOutputAck(p.MessageType):
         self.out_pk = out_pk
         self.ecdh_info = ecdh_info
 
+    _FIELDS = {
+        1: ('tx_out', p.BytesType, 0),
+        2: ('vouti_hmac', p.BytesType, 0),
+        3: ('rsig_data', MoneroTransactionRsigData, 0),
+        4: ('out_pk', p.BytesType, 0),
+        5: ('ecdh_info', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tx_out', p.BytesType, 0),
-            2: ('vouti_hmac', p.BytesType, 0),
-            3: ('rsig_data', MoneroTransactionRsigData, 0),
-            4: ('out_pk', p.BytesType, 0),
-            5: ('ecdh_info', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -27,11 +27,13 @@ class MoneroTransactionSetOutputRequest(p.MessageType):
         self.rsig_data = rsig_data
         self.is_offloaded_bp = is_offloaded_bp
 
+    _FIELDS = {
+        1: ('dst_entr', MoneroTransactionDestinationEntry, 0),
+        2: ('dst_entr_hmac', p.BytesType, 0),
+        3: ('rsig_data', MoneroTransactionRsigData, 0),
+        4: ('is_offloaded_bp', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('dst_entr', MoneroTransactionDestinationEntry, 0),
-            2: ('dst_entr_hmac', p.BytesType, 0),
-            3: ('rsig_data', MoneroTransactionRsigData, 0),
-            4: ('is_offloaded_bp', p.BoolType, 0),
-        }
+        return cls._FIELDS
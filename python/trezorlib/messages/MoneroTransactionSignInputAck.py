@@ -20,9 +20,11 @@ class MoneroTransactionSignInputAck(p.MessageType):
         self.signature = signature
         self.pseudo_out = pseudo_out
 
+    _FIELDS = {
+        1: ('signature', p.BytesType, 0),
+        2: ('pseudo_out', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('pseudo_out', p.BytesType, 0),
-        }
+        return cls._FIELDS
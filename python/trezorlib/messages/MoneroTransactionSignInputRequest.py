@@ -32,14 +32,16 @@ class MoneroTransactionSignInputRequest(p.MessageType):
         self.pseudo_out_alpha = pseudo_out_alpha
         self.spend_key = spend_key
 
+    _FIELDS = {
+        1: ('src_entr', MoneroTransactionSourceEntry, 0),
+        2: ('vini', p.BytesType, 0),
+        3: ('vini_hmac', p.BytesType, 0),
+        4: ('pseudo_out', p.BytesType, 0),
+        5: ('pseudo_out_hmac', p.BytesType, 0),
+        6: ('pseudo_out_alpha', p.BytesType, 0),
+        7: ('spend_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-            2: ('vini', p.BytesType, 0),
-            3: ('vini_hmac', p.BytesType, 0),
-            4: ('pseudo_out', p.BytesType, 0),
-            5: ('pseudo_out_hmac', p.BytesType, 0),
-            6: ('pseudo_out_alpha', p.BytesType, 0),
-            7: ('spend_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
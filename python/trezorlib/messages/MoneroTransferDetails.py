@@ -23,11 +23,13 @@ class MoneroTransferDetails(p.MessageType):
         self.additional_tx_pub_keys = additional_tx_pub_keys if additional_tx_pub_keys is not None else []
         self.internal_output_index = internal_output_index
 
+    _FIELDS = {
+        1: ('out_key', p.BytesType, 0),
+        2: ('tx_pub_key', p.BytesType, 0),
+        3: ('additional_tx_pub_keys', p.BytesType, p.FLAG_REPEATED),
+        4: ('internal_output_index', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('out_key', p.BytesType, 0),
-            2: ('tx_pub_key', p.BytesType, 0),
-            3: ('additional_tx_pub_keys', p.BytesType, p.FLAG_REPEATED),
-            4: ('internal_output_index', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class MoneroWatchKey(p.MessageType):
         self.watch_key = watch_key
         self.address = address
 
+    _FIELDS = {
+        1: ('watch_key', p.BytesType, 0),
+        2: ('address', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('watch_key', p.BytesType, 0),
-            2: ('address', p.BytesType, 0),
-        }
+        return cls._FIELDS
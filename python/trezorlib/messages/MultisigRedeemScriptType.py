@@ -28,12 +28,14 @@ class MultisigRedeemScriptType(p.MessageType):
         self.nodes = nodes if nodes is not None else []
         self.address_n = address_n if address_n is not None else []
 
+    _FIELDS = {
+        1: ('pubkeys', HDNodePathType, p.FLAG_REPEATED),
+        2: ('signatures', p.BytesType, p.FLAG_REPEATED),
+        3: ('m', p.UVarintType, 0),
+        4: ('nodes', HDNodeType, p.FLAG_REPEATED),
+        5: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('pubkeys', HDNodePathType, p.FLAG_REPEATED),
-            2: ('signatures', p.BytesType, p.FLAG_REPEATED),
-            3: ('m', p.UVarintType, 0),
-            4: ('nodes', HDNodeType, p.FLAG_REPEATED),
-            5: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
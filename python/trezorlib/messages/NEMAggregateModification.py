@@ -21,9 +21,11 @@ class NEMAggregateModification(p.MessageType):
         self.modifications = modifications if modifications is not None else []
         self.relative_change = relative_change
 
+    _FIELDS = {
+        1: ('modifications', NEMCosignatoryModification, p.FLAG_REPEATED),
+        2: ('relative_change', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('modifications', NEMCosignatoryModification, p.FLAG_REPEATED),
-            2: ('relative_change', p.SVarintType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class NEMCosignatoryModification(p.MessageType):
         self.type = type
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('type', p.UVarintType, 0),
+        2: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -24,11 +24,13 @@ class NEMDecryptMessage(p.MessageType):
         self.public_key = public_key
         self.payload = payload
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network', p.UVarintType, 0),
+        3: ('public_key', p.BytesType, 0),
+        4: ('payload', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network', p.UVarintType, 0),
-            3: ('public_key', p.BytesType, 0),
-            4: ('payload', p.BytesType, 0),
-        }
+        return cls._FIELDS
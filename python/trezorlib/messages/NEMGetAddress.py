@@ -22,10 +22,12 @@ class NEMGetAddress(p.MessageType):
         self.network = network
         self.show_display = show_display
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network', p.UVarintType, 0),
+        3: ('show_display', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network', p.UVarintType, 0),
-            3: ('show_display', p.BoolType, 0),
-        }
+        return cls._FIELDS
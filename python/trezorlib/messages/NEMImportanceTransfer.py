@@ -19,9 +19,11 @@ class NEMImportanceTransfer(p.MessageType):
         self.mode = mode
         self.public_key = public_key
 
+    _FIELDS = {
+        1: ('mode', p.UVarintType, 0),
+        2: ('public_key', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('mode', p.UVarintType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
+        return cls._FIELDS
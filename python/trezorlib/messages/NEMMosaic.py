@@ -21,10 +21,12 @@ class NEMMosaic(p.MessageType):
         self.mosaic = mosaic
         self.quantity = quantity
 
+    _FIELDS = {
+        1: ('namespace', p.UnicodeType, 0),
+        2: ('mosaic', p.UnicodeType, 0),
+        3: ('quantity', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('mosaic', p.UnicodeType, 0),
-            3: ('quantity', p.UVarintType, 0),
-        }
+        return cls._FIELDS
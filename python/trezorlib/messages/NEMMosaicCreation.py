@@ -23,10 +23,12 @@ class NEMMosaicCreation(p.MessageType):
         self.sink = sink
         self.fee = fee
 
+    _FIELDS = {
+        1: ('definition', NEMMosaicDefinition, 0),
+        2: ('sink', p.UnicodeType, 0),
+        3: ('fee', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('definition', NEMMosaicDefinition, 0),
-            2: ('sink', p.UnicodeType, 0),
-            3: ('fee', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -23,11 +23,13 @@ class NEMMosaicSupplyChange(p.MessageType):
         self.type = type
         self.delta = delta
 
+    _FIELDS = {
+        1: ('namespace', p.UnicodeType, 0),
+        2: ('mosaic', p.UnicodeType, 0),
+        3: ('type', p.UVarintType, 0),
+        4: ('delta', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('mosaic', p.UnicodeType, 0),
-            3: ('type', p.UVarintType, 0),
-            4: ('delta', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -23,11 +23,13 @@ class NEMProvisionNamespace(p.MessageType):
         self.sink = sink
         self.fee = fee
 
+    _FIELDS = {
+        1: ('namespace', p.UnicodeType, 0),
+        2: ('parent', p.UnicodeType, 0),
+        3: ('sink', p.UnicodeType, 0),
+        4: ('fee', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('parent', p.UnicodeType, 0),
-            3: ('sink', p.UnicodeType, 0),
-            4: ('fee', p.UVarintType, 0),
-        }
+        return cls._FIELDS
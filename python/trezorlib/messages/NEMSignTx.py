@@ -42,16 +42,18 @@ class NEMSignTx(p.MessageType):
         self.aggregate_modification = aggregate_modification
         self.importance_transfer = importance_transfer
 
+    _FIELDS = {
+        1: ('transaction', NEMTransactionCommon, 0),
+        2: ('multisig', NEMTransactionCommon, 0),
+        3: ('transfer', NEMTransfer, 0),
+        4: ('cosigning', p.BoolType, 0),
+        5: ('provision_namespace', NEMProvisionNamespace, 0),
+        6: ('mosaic_creation', NEMMosaicCreation, 0),
+        7: ('supply_change', NEMMosaicSupplyChange, 0),
+        8: ('aggregate_modification', NEMAggregateModification, 0),
+        9: ('importance_transfer', NEMImportanceTransfer, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('transaction', NEMTransactionCommon, 0),
-            2: ('multisig', NEMTransactionCommon, 0),
-            3: ('transfer', NEMTransfer, 0),
-            4: ('cosigning', p.BoolType, 0),
-            5: ('provision_namespace', NEMProvisionNamespace, 0),
-            6: ('mosaic_creation', NEMMosaicCreation, 0),
-            7: ('supply_change', NEMMosaicSupplyChange, 0),
-            8: ('aggregate_modification', NEMAggregateModification, 0),
-            9: ('importance_transfer', NEMImportanceTransfer, 0),
-        }
+        return cls._FIELDS
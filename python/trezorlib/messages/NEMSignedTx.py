@@ -20,9 +20,11 @@ class NEMSignedTx(p.MessageType):
         self.data = data
         self.signature = signature
 
+    _FIELDS = {
+        1: ('data', p.BytesType, 0),
+        2: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('data', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -27,13 +27,15 @@ class NEMTransactionCommon(p.MessageType):
         self.deadline = deadline
         self.signer = signer
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('network', p.UVarintType, 0),
+        3: ('timestamp', p.UVarintType, 0),
+        4: ('fee', p.UVarintType, 0),
+        5: ('deadline', p.UVarintType, 0),
+        6: ('signer', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network', p.UVarintType, 0),
-            3: ('timestamp', p.UVarintType, 0),
-            4: ('fee', p.UVarintType, 0),
-            5: ('deadline', p.UVarintType, 0),
-            6: ('signer', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -27,12 +27,14 @@ class NEMTransfer(p.MessageType):
         self.public_key = public_key
         self.mosaics = mosaics if mosaics is not None else []
 
+    _FIELDS = {
+        1: ('recipient', p.UnicodeType, 0),
+        2: ('amount', p.UVarintType, 0),
+        3: ('payload', p.BytesType, 0),
+        4: ('public_key', p.BytesType, 0),
+        5: ('mosaics', NEMMosaic, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('recipient', p.UnicodeType, 0),
-            2: ('amount', p.UVarintType, 0),
-            3: ('payload', p.BytesType, 0),
-            4: ('public_key', p.BytesType, 0),
-            5: ('mosaics', NEMMosaic, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
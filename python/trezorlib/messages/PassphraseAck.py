@@ -20,9 +20,11 @@ class PassphraseAck(p.MessageType):
         self.passphrase = passphrase
         self.state = state
 
+    _FIELDS = {
+        1: ('passphrase', p.UnicodeType, 0),
+        2: ('state', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('passphrase', p.UnicodeType, 0),
-            2: ('state', p.BytesType, 0),
-        }
+        return cls._FIELDS
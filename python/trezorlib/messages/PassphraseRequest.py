@@ -18,8 +18,10 @@ class PassphraseRequest(p.MessageType):
     ) -> None:
         self.on_device = on_device
 
+    _FIELDS = {
+        1: ('on_device', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('on_device', p.BoolType, 0),
-        }
+        return cls._FIELDS
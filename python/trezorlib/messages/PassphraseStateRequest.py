@@ -18,8 +18,10 @@ class PassphraseStateRequest(p.MessageType):
     ) -> None:
         self.state = state
 
+    _FIELDS = {
+        1: ('state', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('state', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class PinMatrixAck(p.MessageType):
     ) -> None:
         self.pin = pin
 
+    _FIELDS = {
+        1: ('pin', p.UnicodeType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('pin', p.UnicodeType, 0),  # required
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class PinMatrixRequest(p.MessageType):
     ) -> None:
         self.type = type
 
+    _FIELDS = {
+        1: ('type', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('type', p.UVarintType, 0),
-        }
+        return cls._FIELDS
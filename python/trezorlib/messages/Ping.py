@@ -24,11 +24,13 @@ class Ping(p.MessageType):
         self.pin_protection = pin_protection
         self.passphrase_protection = passphrase_protection
 
+    _FIELDS = {
+        1: ('message', p.UnicodeType, 0),
+        2: ('button_protection', p.BoolType, 0),
+        3: ('pin_protection', p.BoolType, 0),
+        4: ('passphrase_protection', p.BoolType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('message', p.UnicodeType, 0),
-            2: ('button_protection', p.BoolType, 0),
-            3: ('pin_protection', p.BoolType, 0),
-            4: ('passphrase_protection', p.BoolType, 0),
-        }
+        return cls._FIELDS
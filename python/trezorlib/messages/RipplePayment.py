@@ -21,10 +21,12 @@ class RipplePayment(p.MessageType):
         self.destination = destination
         self.destination_tag = destination_tag
 
+    _FIELDS = {
+        1: ('amount', p.UVarintType, 0),
+        2: ('destination', p.UnicodeType, 0),
+        3: ('destination_tag', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.UVarintType, 0),
-            2: ('destination', p.UnicodeType, 0),
-            3: ('destination_tag', p.UVarintType, 0),
-        }
+        return cls._FIELDS
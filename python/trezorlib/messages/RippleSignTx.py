@@ -30,13 +30,15 @@ class RippleSignTx(p.MessageType):
         self.last_ledger_sequence = last_ledger_sequence
         self.payment = payment
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('fee', p.UVarintType, 0),
+        3: ('flags', p.UVarintType, 0),
+        4: ('sequence', p.UVarintType, 0),
+        5: ('last_ledger_sequence', p.UVarintType, 0),
+        6: ('payment', RipplePayment, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('fee', p.UVarintType, 0),
-            3: ('flags', p.UVarintType, 0),
-            4: ('sequence', p.UVarintType, 0),
-            5: ('last_ledger_sequence', p.UVarintType, 0),
-            6: ('payment', RipplePayment, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class RippleSignedTx(p.MessageType):
         self.signature = signature
         self.serialized_tx = serialized_tx
 
+    _FIELDS = {
+        1: ('signature', p.BytesType, 0),
+        2: ('serialized_tx', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('serialized_tx', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class SelfTest(p.MessageType):
     ) -> None:
         self.payload = payload
 
+    _FIELDS = {
+        1: ('payload', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('payload', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class SetU2FCounter(p.MessageType):
     ) -> None:
         self.u2f_counter = u2f_counter
 
+    _FIELDS = {
+        1: ('u2f_counter', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('u2f_counter', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -26,11 +26,13 @@ class SignIdentity(p.MessageType):
         self.challenge_visual = challenge_visual
         self.ecdsa_curve_name = ecdsa_curve_name
 
+    _FIELDS = {
+        1: ('identity', IdentityType, 0),
+        2: ('challenge_hidden', p.BytesType, 0),
+        3: ('challenge_visual', p.UnicodeType, 0),
+        4: ('ecdsa_curve_name', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('identity', IdentityType, 0),
-            2: ('challenge_hidden', p.BytesType, 0),
-            3: ('challenge_visual', p.UnicodeType, 0),
-            4: ('ecdsa_curve_name', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -36,17 +36,19 @@ class SignTx(p.MessageType):
         self.timestamp = timestamp
         self.branch_id = branch_id
 
+    _FIELDS = {
+        1: ('outputs_count', p.UVarintType, 0),  # required
+        2: ('inputs_count', p.UVarintType, 0),  # required
+        3: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+        4: ('version', p.UVarintType, 0),  # default=1
+        5: ('lock_time', p.UVarintType, 0),  # default=0
+        6: ('expiry', p.UVarintType, 0),
+        7: ('overwintered', p.BoolType, 0),
+        8: ('version_group_id', p.UVarintType, 0),
+        9: ('timestamp', p.UVarintType, 0),
+        10: ('branch_id', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('outputs_count', p.UVarintType, 0),  # required
-            2: ('inputs_count', p.UVarintType, 0),  # required
-            3: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            4: ('version', p.UVarintType, 0),  # default=1
-            5: ('lock_time', p.UVarintType, 0),  # default=0
-            6: ('expiry', p.UVarintType, 0),
-            7: ('overwintered', p.BoolType, 0),
-            8: ('version_group_id', p.UVarintType, 0),
-            9: ('timestamp', p.UVarintType, 0),
-            10: ('branch_id', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -22,10 +22,12 @@ class SignedIdentity(p.MessageType):
         self.public_key = public_key
         self.signature = signature
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('public_key', p.BytesType, 0),
+        3: ('signature', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('public_key', p.BytesType, 0),
-            3: ('signature', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class StellarAccountMergeOp(p.MessageType):
         self.source_account = source_account
         self.destination_account = destination_account
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('destination_account', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('destination_account', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -26,12 +26,14 @@ class StellarAllowTrustOp(p.MessageType):
         self.asset_code = asset_code
         self.is_authorized = is_authorized
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('trusted_account', p.UnicodeType, 0),
+        3: ('asset_type', p.UVarintType, 0),
+        4: ('asset_code', p.UnicodeType, 0),
+        5: ('is_authorized', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('trusted_account', p.UnicodeType, 0),
-            3: ('asset_type', p.UVarintType, 0),
-            4: ('asset_code', p.UnicodeType, 0),
-            5: ('is_authorized', p.UVarintType, 0),
-        }
+        return cls._FIELDS
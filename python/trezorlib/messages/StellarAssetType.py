@@ -21,10 +21,12 @@ class StellarAssetType(p.MessageType):
         self.code = code
         self.issuer = issuer
 
+    _FIELDS = {
+        1: ('type', p.UVarintType, 0),
+        2: ('code', p.UnicodeType, 0),
+        3: ('issuer', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('code', p.UnicodeType, 0),
-            3: ('issuer', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -20,9 +20,11 @@ class StellarBumpSequenceOp(p.MessageType):
         self.source_account = source_account
         self.bump_to = bump_to
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('bump_to', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('bump_to', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -24,10 +24,12 @@ class StellarChangeTrustOp(p.MessageType):
         self.asset = asset
         self.limit = limit
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('asset', StellarAssetType, 0),
+        3: ('limit', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('asset', StellarAssetType, 0),
-            3: ('limit', p.UVarintType, 0),
-        }
+        return cls._FIELDS
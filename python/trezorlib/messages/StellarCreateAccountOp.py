@@ -22,10 +22,12 @@ class StellarCreateAccountOp(p.MessageType):
         self.new_account = new_account
         self.starting_balance = starting_balance
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('new_account', p.UnicodeType, 0),
+        3: ('starting_balance', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('new_account', p.UnicodeType, 0),
-            3: ('starting_balance', p.SVarintType, 0),
-        }
+        return cls._FIELDS
@@ -30,13 +30,15 @@ class StellarCreatePassiveOfferOp(p.MessageType):
         self.price_n = price_n
         self.price_d = price_d
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('selling_asset', StellarAssetType, 0),
+        3: ('buying_asset', StellarAssetType, 0),
+        4: ('amount', p.SVarintType, 0),
+        5: ('price_n', p.UVarintType, 0),
+        6: ('price_d', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('selling_asset', StellarAssetType, 0),
-            3: ('buying_asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-            5: ('price_n', p.UVarintType, 0),
-            6: ('price_d', p.UVarintType, 0),
-        }
+        return cls._FIELDS
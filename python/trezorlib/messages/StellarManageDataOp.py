@@ -22,10 +22,12 @@ class StellarManageDataOp(p.MessageType):
         self.key = key
         self.value = value
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('key', p.UnicodeType, 0),
+        3: ('value', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('key', p.UnicodeType, 0),
-            3: ('value', p.BytesType, 0),
-        }
+        return cls._FIELDS
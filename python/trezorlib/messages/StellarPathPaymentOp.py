@@ -32,14 +32,16 @@ class StellarPathPaymentOp(p.MessageType):
         self.destination_amount = destination_amount
         self.paths = paths if paths is not None else []
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('send_asset', StellarAssetType, 0),
+        3: ('send_max', p.SVarintType, 0),
+        4: ('destination_account', p.UnicodeType, 0),
+        5: ('destination_asset', StellarAssetType, 0),
+        6: ('destination_amount', p.SVarintType, 0),
+        7: ('paths', StellarAssetType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('send_asset', StellarAssetType, 0),
-            3: ('send_max', p.SVarintType, 0),
-            4: ('destination_account', p.UnicodeType, 0),
-            5: ('destination_asset', StellarAssetType, 0),
-            6: ('destination_amount', p.SVarintType, 0),
-            7: ('paths', StellarAssetType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
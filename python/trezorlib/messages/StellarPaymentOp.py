@@ -26,11 +26,13 @@ class StellarPaymentOp(p.MessageType):
         self.asset = asset
         self.amount = amount
 
+    _FIELDS = {
+        1: ('source_account', p.UnicodeType, 0),
+        2: ('destination_account', p.UnicodeType, 0),
+        3: ('asset', StellarAssetType, 0),
+        4: ('amount', p.SVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('destination_account', p.UnicodeType, 0),
-            3: ('asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class Success(p.MessageType):
     ) -> None:
         self.message = message
 
+    _FIELDS = {
+        1: ('message', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('message', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
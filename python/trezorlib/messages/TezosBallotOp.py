@@ -23,11 +23,13 @@ class TezosBallotOp(p.MessageType):
         self.proposal = proposal
         self.ballot = ballot
 
+    _FIELDS = {
+        1: ('source', p.BytesType, 0),
+        2: ('period', p.UVarintType, 0),
+        3: ('proposal', p.BytesType, 0),
+        4: ('ballot', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source', p.BytesType, 0),
-            2: ('period', p.UVarintType, 0),
-            3: ('proposal', p.BytesType, 0),
-            4: ('ballot', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -19,9 +19,11 @@ class TezosContractID(p.MessageType):
         self.tag = tag
         self.hash = hash
 
+    _FIELDS = {
+        1: ('tag', p.UVarintType, 0),
+        2: ('hash', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tag', p.UVarintType, 0),
-            2: ('hash', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -21,10 +21,12 @@ class TezosProposalOp(p.MessageType):
         self.period = period
         self.proposals = proposals if proposals is not None else []
 
+    _FIELDS = {
+        1: ('source', p.BytesType, 0),
+        2: ('period', p.UVarintType, 0),
+        4: ('proposals', p.BytesType, p.FLAG_REPEATED),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source', p.BytesType, 0),
-            2: ('period', p.UVarintType, 0),
-            4: ('proposals', p.BytesType, p.FLAG_REPEATED),
-        }
+        return cls._FIELDS
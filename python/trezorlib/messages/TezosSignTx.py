@@ -39,15 +39,17 @@ class TezosSignTx(p.MessageType):
         self.proposal = proposal
         self.ballot = ballot
 
+    _FIELDS = {
+        1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        2: ('branch', p.BytesType, 0),
+        3: ('reveal', TezosRevealOp, 0),
+        4: ('transaction', TezosTransactionOp, 0),
+        5: ('origination', TezosOriginationOp, 0),
+        6: ('delegation', TezosDelegationOp, 0),
+        7: ('proposal', TezosProposalOp, 0),
+        8: ('ballot', TezosBallotOp, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('branch', p.BytesType, 0),
-            3: ('reveal', TezosRevealOp, 0),
-            4: ('transaction', TezosTransactionOp, 0),
-            5: ('origination', TezosOriginationOp, 0),
-            6: ('delegation', TezosDelegationOp, 0),
-            7: ('proposal', TezosProposalOp, 0),
-            8: ('ballot', TezosBallotOp, 0),
-        }
+        return cls._FIELDS
@@ -22,10 +22,12 @@ class TezosSignedTx(p.MessageType):
         self.sig_op_contents = sig_op_contents
         self.operation_hash = operation_hash
 
+    _FIELDS = {
+        1: ('signature', p.UnicodeType, 0),
+        2: ('sig_op_contents', p.BytesType, 0),
+        3: ('operation_hash', p.UnicodeType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature', p.UnicodeType, 0),
-            2: ('sig_op_contents', p.BytesType, 0),
-            3: ('operation_hash', p.UnicodeType, 0),
-        }
+        return cls._FIELDS
@@ -33,15 +33,17 @@ class TezosTransactionOp(p.MessageType):
         self.destination = destination
         self.parameters = parameters
 
+    _FIELDS = {
+        1: ('source', TezosContractID, 0),
+        2: ('fee', p.UVarintType, 0),
+        3: ('counter', p.UVarintType, 0),
+        4: ('gas_limit', p.UVarintType, 0),
+        5: ('storage_limit', p.UVarintType, 0),
+        6: ('amount', p.UVarintType, 0),
+        7: ('destination', TezosContractID, 0),
+        8: ('parameters', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('source', TezosContractID, 0),
-            2: ('fee', p.UVarintType, 0),
-            3: ('counter', p.UVarintType, 0),
-            4: ('gas_limit', p.UVarintType, 0),
-            5: ('storage_limit', p.UVarintType, 0),
-            6: ('amount', p.UVarintType, 0),
-            7: ('destination', TezosContractID, 0),
-            8: ('parameters', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -20,8 +20,10 @@ class TxAck(p.MessageType):
     ) -> None:
         self.tx = tx
 
+    _FIELDS = {
+        1: ('tx', TransactionType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('tx', TransactionType, 0),
-        }
+        return cls._FIELDS
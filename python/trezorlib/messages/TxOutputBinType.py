@@ -21,10 +21,12 @@ class TxOutputBinType(p.MessageType):
         self.script_pubkey = script_pubkey
         self.decred_script_version = decred_script_version
 
+    _FIELDS = {
+        1: ('amount', p.UVarintType, 0),  # required
+        2: ('script_pubkey', p.BytesType, 0),  # required
+        3: ('decred_script_version', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('amount', p.UVarintType, 0),  # required
-            2: ('script_pubkey', p.BytesType, 0),  # required
-            3: ('decred_script_version', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -35,16 +35,18 @@ class TxOutputType(p.MessageType):
         self.block_hash_bip115 = block_hash_bip115
         self.block_height_bip115 = block_height_bip115
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+        3: ('amount', p.UVarintType, 0),  # required
+        4: ('script_type', p.UVarintType, 0),  # required
+        5: ('multisig', MultisigRedeemScriptType, 0),
+        6: ('op_return_data', p.BytesType, 0),
+        7: ('decred_script_version', p.UVarintType, 0),
+        8: ('block_hash_bip115', p.BytesType, 0),
+        9: ('block_height_bip115', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('amount', p.UVarintType, 0),  # required
-            4: ('script_type', p.UVarintType, 0),  # required
-            5: ('multisig', MultisigRedeemScriptType, 0),
-            6: ('op_return_data', p.BytesType, 0),
-            7: ('decred_script_version', p.UVarintType, 0),
-            8: ('block_hash_bip115', p.BytesType, 0),
-            9: ('block_height_bip115', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -25,10 +25,12 @@ class TxRequest(p.MessageType):
         self.details = details
         self.serialized = serialized
 
+    _FIELDS = {
+        1: ('request_type', p.UVarintType, 0),
+        2: ('details', TxRequestDetailsType, 0),
+        3: ('serialized', TxRequestSerializedType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('request_type', p.UVarintType, 0),
-            2: ('details', TxRequestDetailsType, 0),
-            3: ('serialized', TxRequestSerializedType, 0),
-        }
+        return cls._FIELDS
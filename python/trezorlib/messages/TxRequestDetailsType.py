@@ -23,11 +23,13 @@ class TxRequestDetailsType(p.MessageType):
         self.extra_data_len = extra_data_len
         self.extra_data_offset = extra_data_offset
 
+    _FIELDS = {
+        1: ('request_index', p.UVarintType, 0),
+        2: ('tx_hash', p.BytesType, 0),
+        3: ('extra_data_len', p.UVarintType, 0),
+        4: ('extra_data_offset', p.UVarintType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('request_index', p.UVarintType, 0),
-            2: ('tx_hash', p.BytesType, 0),
-            3: ('extra_data_len', p.UVarintType, 0),
-            4: ('extra_data_offset', p.UVarintType, 0),
-        }
+        return cls._FIELDS
@@ -21,10 +21,12 @@ class TxRequestSerializedType(p.MessageType):
         self.signature = signature
         self.serialized_tx = serialized_tx
 
+    _FIELDS = {
+        1: ('signature_index', p.UVarintType, 0),
+        2: ('signature', p.BytesType, 0),
+        3: ('serialized_tx', p.BytesType, 0),
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('signature_index', p.UVarintType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('serialized_tx', p.BytesType, 0),
-        }
+        return cls._FIELDS
@@ -24,11 +24,13 @@ class VerifyMessage(p.MessageType):
         self.message = message
         self.coin_name = coin_name
 
+    _FIELDS = {
+        1: ('address', p.UnicodeType, 0),
+        2: ('signature', p.BytesType, 0),
+        3: ('message', p.BytesType, 0),
+        4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-            4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-        }
+        return cls._FIELDS
@@ -18,8 +18,10 @@ class WordAck(p.MessageType):
     ) -> None:
         self.word = word
 
+    _FIELDS = {
+        1: ('word', p.UnicodeType, 0),  # required
+    }
+
     @classmethod
     def get_fields(cls) -> Dict:
-        return {
-            1: ('word', p.UnicodeType, 0),  # required
-        }
+        return cls._FIELDS